@@ -7,29 +7,29 @@ using locators defined in Locators.json. It includes methods to navigate to the
 and to verify the absence of the 'Remember Me' checkbox, as required by TC_LOGIN_002.
 """
 
-from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from core.locators import LocatorRef
 
 class LoginPage:
     """
     Page Object for the Login Screen
     """
 
-    # Locators (from Locators.json)
-    URL = "https://example-ecommerce.com/login"
-    EMAIL_FIELD = (By.ID, "login-email")
-    PASSWORD_FIELD = (By.ID, "login-password")
-    REMEMBER_ME_CHECKBOX = (By.ID, "remember-me")
-    LOGIN_SUBMIT_BUTTON = (By.ID, "login-submit")
-    FORGOT_PASSWORD_LINK = (By.CSS_SELECTOR, "a.forgot-password-link")
-    ERROR_MESSAGE = (By.CSS_SELECTOR, "div.alert-danger")
-    VALIDATION_ERROR = (By.CSS_SELECTOR, ".invalid-feedback")
-    EMPTY_FIELD_PROMPT = (By.XPATH, "//*[text()='Mandatory fields are required']")
-    DASHBOARD_HEADER = (By.CSS_SELECTOR, "h1.dashboard-title")
-    USER_PROFILE_ICON = (By.CSS_SELECTOR, ".user-profile-name")
+    # Locators (from Locators.json, loaded on first use)
+    URL = LocatorRef('LoginPage.url')
+    EMAIL_FIELD = LocatorRef('LoginPage.inputs.emailField')
+    PASSWORD_FIELD = LocatorRef('LoginPage.inputs.passwordField')
+    REMEMBER_ME_CHECKBOX = LocatorRef('LoginPage.inputs.rememberMeCheckbox')
+    LOGIN_SUBMIT_BUTTON = LocatorRef('LoginPage.buttons.loginSubmit')
+    FORGOT_PASSWORD_LINK = LocatorRef('LoginPage.buttons.forgotPasswordLink')
+    ERROR_MESSAGE = LocatorRef('LoginPage.messages.errorMessage')
+    VALIDATION_ERROR = LocatorRef('LoginPage.messages.validationError')
+    EMPTY_FIELD_PROMPT = LocatorRef('LoginPage.messages.emptyFieldPrompt')
+    DASHBOARD_HEADER = LocatorRef('LoginPage.postLogin.dashboardHeader')
+    USER_PROFILE_ICON = LocatorRef('LoginPage.postLogin.userProfileIcon')
 
     def __init__(self, driver: WebDriver, timeout: int = 10):
         """
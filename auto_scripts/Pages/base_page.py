@@ -0,0 +1,15 @@
+from auto_scripts.api.Pages.BasePage import BasePage as _BasePage
+
+
+class BasePage(_BasePage):
+    """Base class for the page objects in auto_scripts/Pages
+
+    Adds the short interaction names these page objects use on top of the
+    shared BasePage (waits, extract_rows, ...).
+    """
+
+    def send_keys(self, locator, text):
+        self.enter_text(locator, text)
+
+    def click(self, locator):
+        self.click_element(locator)
@@ -1,10 +1,18 @@
 from selenium.webdriver.common.by import By
+from auto_scripts.api.core.self_healing import HealingLocator
 from auto_scripts.Pages.base_page import BasePage
 
 class LoginPage(BasePage):
-    USERNAME_INPUT = (By.ID, "username")
-    PASSWORD_INPUT = (By.ID, "password")
-    LOGIN_BUTTON = (By.ID, "loginBtn")
+    USERNAME_INPUT = HealingLocator((By.ID, "username"),
+                                    (By.NAME, "username"),
+                                    (By.CSS_SELECTOR, "[data-test='username']"))
+    PASSWORD_INPUT = HealingLocator((By.ID, "password"),
+                                    (By.NAME, "password"),
+                                    (By.CSS_SELECTOR, "[data-test='password']"))
+    LOGIN_BUTTON = HealingLocator((By.ID, "loginBtn"),
+                                  (By.NAME, "login"),
+                                  (By.CSS_SELECTOR, "[data-test='login-button']"),
+                                  (By.XPATH, "//button[normalize-space()='Login']"))
     # Added from metadata
     ADMIN_LOGIN_LOCATOR = (By.ID, "placeholder_admin_login_locator")
     ADMIN_LOGIN_SUCCESS_LOCATOR = (By.ID, "placeholder_admin_login_success_locator")
@@ -10,6 +10,13 @@ class ProductCatalogPage(BasePage):
     PRODUCT_LIST_LOCATOR = (By.ID, "placeholder_product_list_locator")
     PRODUCT_CATALOG_PAGE_DISPLAY_LOCATOR = (By.ID, "placeholder_product_catalog_page_display_locator")
     PRODUCT_DETAILS_LOCATOR = (By.ID, "placeholder_product_details_locator")
+    # Bulk extraction: one row per product inside PRODUCT_LIST; placeholders until the markup is known
+    PRODUCT_ROW = (By.CSS_SELECTOR, "placeholder_product_row_locator")
+    PRODUCT_FIELDS = {
+        "name": (By.CSS_SELECTOR, "placeholder_product_name_locator"),
+        "price": (By.CSS_SELECTOR, "placeholder_product_price_locator"),
+        "inventory_status": (By.CSS_SELECTOR, "placeholder_product_inventory_status_locator"),
+    }
 
     def search_product(self, product_name):
         self.send_keys(self.SEARCH_BOX, product_name)
@@ -36,3 +43,18 @@ class ProductCatalogPage(BasePage):
     def assert_all_products_listed(self):
         """Verify all products are listed with details and inventory status."""
         return self.is_visible(self.PRODUCT_DETAILS_LOCATOR)
+
+    def get_all_products(self):
+        """Return every listed product as a dict of PRODUCT_FIELDS, in one script call."""
+        return self.extract_rows(self.PRODUCT_LIST, self.PRODUCT_ROW, self.PRODUCT_FIELDS)
+
+    @classmethod
+    def find_products_missing_details(cls, products):
+        """Return the extracted products lacking a name, price or inventory status.
+
+        Runs locally on the records from get_all_products, without touching the browser.
+        """
+        return [
+            product for product in products
+            if not all((product.get(field) or "").strip() for field in cls.PRODUCT_FIELDS)
+        ]
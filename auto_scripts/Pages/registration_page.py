@@ -16,7 +16,7 @@ class RegistrationPage(BasePage):
         super().__init__(driver)
 
     def navigate_to_registration(self):
-        self.driver.get(self.REGISTRATION_URL)
+        self.navigate_to(self.REGISTRATION_URL)
 
     def enter_first_name(self, first_name):
         self.enter_text(self.FIRST_NAME_INPUT, first_name)
@@ -1,22 +1,144 @@
-from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
+from auto_scripts.api.core.element_cache import ElementCache
+from auto_scripts.api.core.polling import BackoffWebDriverWait, default_poll_schedule
+
+
+# Resolves a container, its rows and each row's fields inside the page and
+# returns plain records, so a whole list costs a single WebDriver command.
+EXTRACT_ROWS_SCRIPT = """
+var spec = arguments[0];
+function query(context, q, all) {
+    if (q.attribute) {
+        q = {css: '[' + q.attribute + '="' + CSS.escape(q.value) + '"]'};
+    } else if (q.className) {
+        q = {css: '.' + CSS.escape(q.className)};
+    }
+    if (q.xpath) {
+        var type = all ? XPathResult.ORDERED_NODE_SNAPSHOT_TYPE : XPathResult.FIRST_ORDERED_NODE_TYPE;
+        var result = document.evaluate(q.xpath, context, null, type, null);
+        if (!all) { return result.singleNodeValue; }
+        var nodes = [];
+        for (var i = 0; i < result.snapshotLength; i++) { nodes.push(result.snapshotItem(i)); }
+        return nodes;
+    }
+    return all ? Array.prototype.slice.call(context.querySelectorAll(q.css)) : context.querySelector(q.css);
+}
+var root = spec.container ? query(document, spec.container, false) : document;
+if (!root) { return null; }
+return query(root, spec.rows, true).map(function (row) {
+    var record = {};
+    spec.fields.forEach(function (field) {
+        var element = field.query ? query(row, field.query, false) : row;
+        if (!element) {
+            record[field.name] = null;
+        } else if (field.attribute) {
+            record[field.name] = element.getAttribute(field.attribute);
+        } else {
+            record[field.name] = (element.innerText || element.textContent || '').trim();
+        }
+    });
+    return record;
+});
+"""
+
+
+def _locator_query(locator, relative=False):
+    """
+    Translate a locator tuple into a query the extraction script understands
+    
+    Ids, names and class names are escaped in the page with CSS.escape. An
+    XPath evaluated relative to a row or container that starts with / is
+    prefixed with . so it stays inside that element.
+    
+    Args:
+        locator (tuple): Locator tuple (By.TYPE, "value")
+        relative (bool): True for row and field locators
+    
+    Returns:
+        dict: {'css': selector}, {'attribute': name, 'value': value},
+            {'className': name} or {'xpath': expression}
+    
+    Raises:
+        ValueError: If the strategy cannot be evaluated in the page, or a
+            relative XPath would search the whole document
+    """
+    by, value = locator
+    if by == By.CSS_SELECTOR:
+        return {'css': value}
+    if by == By.ID:
+        return {'attribute': 'id', 'value': value}
+    if by == By.NAME:
+        return {'attribute': 'name', 'value': value}
+    if by == By.CLASS_NAME:
+        return {'className': value}
+    if by == By.TAG_NAME:
+        return {'css': value}
+    if by == By.XPATH:
+        if relative and value.startswith('/'):
+            value = '.' + value
+        elif relative and value.startswith('(/'):
+            raise ValueError(f"XPath {value!r} searches the whole document; start it with (./ or (.//")
+        return {'xpath': value}
+    raise ValueError(f"Locator strategy '{by}' is not supported for row extraction")
+
+
+def _field_query(name, field):
+    """
+    Build the script spec for one extracted field
+    
+    Args:
+        name (str): Key of the field in each returned record
+        field: Locator tuple for the field's text, (locator, attribute) for an
+            attribute value, or None for the row element's own text
+    
+    Returns:
+        dict: Field spec
+    """
+    attribute = None
+    if field and isinstance(field[0], tuple):
+        field, attribute = field
+    return {
+        'name': name,
+        'query': _locator_query(field, relative=True) if field else None,
+        'attribute': attribute,
+    }
 
 
 class BasePage:
     """Base Page Object class with common methods for all page objects"""
     
-    def __init__(self, driver, timeout=10):
+    def __init__(self, driver, timeout=10, poll_schedule=None):
         """
         Initialize BasePage
         
         Args:
             driver: Selenium WebDriver instance
             timeout (int): Default timeout for waits
+            poll_schedule (PollSchedule): Wait poll schedule, config default if None
         """
         self.driver = driver
         self.timeout = timeout
-        self.wait = WebDriverWait(driver, timeout)
+        self.poll_schedule = poll_schedule or default_poll_schedule()
+        self.owner = type(self).__name__
+        self.wait = self.create_wait(timeout)
+        self.element_cache = ElementCache(driver, owner=self.owner)
+    
+    def create_wait(self, timeout, locator=None):
+        """
+        Create an explicit wait polling on this page's schedule
+        
+        Args:
+            timeout (float): Wait timeout in seconds
+            locator (tuple): Locator being waited on, used for timeout calibration
+        
+        Returns:
+            BackoffWebDriverWait: Configured wait
+        """
+        return BackoffWebDriverWait(
+            self.driver, timeout, self.poll_schedule, locator=locator, owner=self.owner
+        )
     
     def find_element(self, locator):
         """
@@ -28,7 +150,8 @@ class BasePage:
         Returns:
             WebElement: Found element
         """
-        return self.wait.until(EC.presence_of_element_located(locator))
+        wait = self.create_wait(self.timeout, locator)
+        return wait.until(EC.presence_of_element_located(locator))
     
     def find_elements(self, locator):
         """
@@ -53,29 +176,67 @@ class BasePage:
             bool: True if visible, False otherwise
         """
         try:
-            self.wait.until(EC.visibility_of_element_located(locator))
+            wait = self.create_wait(self.timeout, locator)
+            wait.until(EC.visibility_of_element_located(locator))
             return True
         except TimeoutException:
             return False
     
     def click_element(self, locator):
         """
-        Click on element
+        Click on element, reusing its cached handle and re-locating it if the
+        DOM re-renders before the click
         
         Args:
             locator (tuple): Locator tuple (By.TYPE, "value")
         """
-        element = self.wait.until(EC.element_to_be_clickable(locator))
-        element.click()
+        def locate():
+            wait = self.create_wait(self.timeout, locator)
+            return wait.until(EC.element_to_be_clickable(locator))
+        self.element_cache.resolve(locator, locate, lambda element: element.click())
+        # The click may have navigated; the cache re-checks the URL on its next lookup
+        self.element_cache.mark_dirty()
     
     def enter_text(self, locator, text):
         """
-        Enter text into element
+        Enter text into element, reusing its cached handle and re-locating it
+        if the DOM re-renders while typing
         
         Args:
             locator (tuple): Locator tuple (By.TYPE, "value")
             text (str): Text to enter
         """
-        element = self.find_element(locator)
-        element.clear()
-        element.send_keys(text)
+        def type_text(element):
+            element.clear()
+            element.send_keys(text)
+        self.element_cache.resolve(locator, lambda: self.find_element(locator), type_text)
+    
+    def extract_rows(self, container, row_locator, field_map):
+        """
+        Extract a list or table as records in a single script call
+        
+        Reading N rows field by field costs N x fields WebDriver round trips;
+        this resolves every row and field inside the page instead. Field and
+        row locators are evaluated relative to the row and container; an
+        XPath starting with / is made relative by prefixing it with .
+        
+        Args:
+            container (tuple): Locator of the list/table, None for the whole document
+            row_locator (tuple): Locator of a row inside the container
+            field_map (dict): Record key -> locator tuple (text), (locator, attribute)
+                pair (attribute value) or None (row text)
+        
+        Returns:
+            list: One dict per row; missing fields are None
+        """
+        spec = {
+            'container': _locator_query(container) if container else None,
+            'rows': _locator_query(row_locator, relative=True),
+            'fields': [_field_query(name, field) for name, field in field_map.items()],
+        }
+        rows = self.driver.execute_script(EXTRACT_ROWS_SCRIPT, spec)
+        if rows is None:
+            # Container not rendered yet: wait for it once, then extract again
+            self.find_element(container)
+            rows = self.driver.execute_script(EXTRACT_ROWS_SCRIPT, spec)
+        return rows or []
@@ -7,8 +7,8 @@ from selenium import webdriver
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.edge.options import Options as EdgeOptions
-import yaml
 import os
+from auto_scripts.api.core.config_cache import load_config
 from auto_scripts.api.utils.logger import logger
 
 
@@ -55,9 +55,7 @@ class DriverFactory:
             dict: Configuration dictionary
         """
         try:
-            config_path = 'auto_scripts/api/config/config.yaml'
-            with open(config_path, 'r') as f:
-                return yaml.safe_load(f)
+            return load_config('auto_scripts/api/config/config.yaml')
         except FileNotFoundError:
             logger.warning("config.yaml not found, using defaults")
             return {'browser': 'chrome', 'headless': False}
@@ -0,0 +1,119 @@
+"""Per-page element cache
+
+Keeps the WebElements a page object located, keyed by locator, so repeated
+interactions on an unchanged DOM skip the find round trip. Handles are
+re-located transparently when the driver reports them stale.
+"""
+
+from selenium.common.exceptions import (
+    StaleElementReferenceException,
+    ElementNotInteractableException,
+    ElementClickInterceptedException,
+)
+from auto_scripts.api.core.stale_recovery import DEFAULT_STALE_RETRIES, run_with_recovery
+
+# Errors that mean a cached handle can no longer be used as-is and must be re-located
+CACHE_MISS_EXCEPTIONS = (
+    StaleElementReferenceException,
+    ElementNotInteractableException,
+    ElementClickInterceptedException,
+)
+
+
+class ElementCache:
+    """Per-page cache of located WebElements keyed by locator tuple.
+
+    Handles are dropped on navigation, when the browser URL changes and when
+    the driver reports them stale. A URL check is only issued after an action
+    that may have navigated (see mark_dirty), so cache hits normally cost no
+    extra round trip.
+    """
+
+    def __init__(self, driver, owner=None):
+        """Initialize an empty cache.
+
+        Args:
+            driver: Selenium WebDriver instance
+            owner (str): Page class name, for stale recovery statistics
+        """
+        self.driver = driver
+        self.owner = owner
+        self._elements = {}
+        self._url = None
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, locator):
+        """Get the cached element for a locator.
+
+        Args:
+            locator (tuple): Element locator
+
+        Returns:
+            WebElement: Cached element, None on a miss
+        """
+        if self._dirty:
+            self._dirty = False
+            if self._elements and self.driver.current_url != self._url:
+                self.clear()
+        element = self._elements.get(tuple(locator))
+        if element is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return element
+
+    def put(self, locator, element):
+        """Store an element, remembering the URL it was found on.
+
+        Args:
+            locator (tuple): Element locator
+            element (WebElement): Located element
+        """
+        if not self._elements:
+            self._url = self.driver.current_url
+        self._elements[tuple(locator)] = element
+
+    def invalidate(self, locator):
+        """Forget the cached element for a single locator.
+
+        Args:
+            locator (tuple): Element locator
+        """
+        self._elements.pop(tuple(locator), None)
+
+    def mark_dirty(self):
+        """Flag that the page may have navigated; the URL is re-checked on the next lookup."""
+        self._dirty = True
+
+    def clear(self):
+        """Forget every cached element."""
+        self._elements.clear()
+        self._url = None
+        self._dirty = False
+
+    def resolve(self, locator, locate, action, retries=DEFAULT_STALE_RETRIES):
+        """Run action on the cached element, re-locating it transparently on a miss.
+
+        Args:
+            locator (tuple): Element locator
+            locate (callable): Zero-arg callable returning a fresh element
+            action (callable): Callable receiving the element
+            retries (int): Re-locations allowed when a fresh element goes stale
+
+        Returns:
+            object: Whatever action returns
+        """
+        element = self.get(locator)
+        if element is not None:
+            try:
+                return action(element)
+            except CACHE_MISS_EXCEPTIONS:
+                self.invalidate(locator)
+
+        def locate_fresh():
+            element = locate()
+            self.put(locator, element)
+            return element
+        return run_with_recovery(locate_fresh, action, locator, self.owner, retries)
@@ -0,0 +1,202 @@
+"""Page locator preflight
+
+Scans the page object modules the suite uses statically at collection time
+for placeholder locator values ("<placeholder>", placeholder_* ids, empty
+values) and for locators declared twice in one class. Tests whose module
+imports an affected page class error in setup, before a fixture starts a
+browser, instead of timing out on a wait.
+"""
+
+import ast
+import glob
+import inspect
+import os
+import re
+from collections import defaultdict, namedtuple
+
+import pytest
+from selenium.webdriver.common.by import By
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+# Page object modules of the suite, relative to BASE_DIR
+PAGE_GLOBS = ('auto_scripts/api/Pages/*.py', 'auto_scripts/Pages/*.py')
+
+# "<placeholder>", "placeholder_admin_login_locator", empty values
+PLACEHOLDER_PATTERN = re.compile(r'^\s*$|^<[^>]*>$|^placeholder([_-]|$)', re.I)
+
+PROBLEMS_KEY = pytest.StashKey[list]()
+
+PageLocator = namedtuple('PageLocator', 'source page name by value lineno')
+
+
+class LocatorPreflightError(Exception):
+    """Raised instead of running a test whose page classes declare unusable locators."""
+
+
+def _locator(node):
+    # `(By.X, "value")` -> ('x', 'value'), anything else -> None
+    if isinstance(node, ast.Call) and getattr(node.func, 'id', None) == 'HealingLocator' and node.args:
+        # The primary; fallbacks are only tried once it misses
+        return _locator(node.args[0])
+    if not (isinstance(node, ast.Tuple) and len(node.elts) == 2):
+        return None
+    by, value = node.elts
+    if not (isinstance(by, ast.Attribute) and isinstance(by.value, ast.Name) and by.value.id == 'By'):
+        return None
+    if not (isinstance(value, ast.Constant) and isinstance(value.value, str)):
+        return None
+    strategy = getattr(By, by.attr, None)
+    return (strategy, value.value) if strategy else None
+
+
+def scan_file(path):
+    """Find the locators declared as class attributes of a page module, without importing it.
+
+    Picks up `NAME = (By.X, "value")`, the primary of
+    `NAME = HealingLocator((By.X, "value"), ...)` and dicts of such tuples,
+    reported as NAME['key'].
+
+    Args:
+        path (str): Page object module
+
+    Returns:
+        list: PageLocator per locator
+
+    Raises:
+        SyntaxError: If the module cannot be parsed
+    """
+    with open(path) as f:
+        tree = ast.parse(f.read(), filename=path)
+    source = os.path.relpath(path, BASE_DIR)
+    found = []
+    for cls in (node for node in tree.body if isinstance(node, ast.ClassDef)):
+        for statement in cls.body:
+            if isinstance(statement, ast.Assign):
+                targets = [target.id for target in statement.targets if isinstance(target, ast.Name)]
+            elif isinstance(statement, ast.AnnAssign) and isinstance(statement.target, ast.Name):
+                targets = [statement.target.id]
+            else:
+                continue
+            entries = []
+            locator = _locator(statement.value) if statement.value is not None else None
+            if locator:
+                entries.append(('', locator))
+            elif isinstance(statement.value, ast.Dict):
+                for key, item in zip(statement.value.keys, statement.value.values):
+                    item_locator = _locator(item)
+                    if item_locator and isinstance(key, ast.Constant):
+                        entries.append((f"[{key.value!r}]", item_locator))
+            for target in targets:
+                for suffix, (by, value) in entries:
+                    found.append(PageLocator(source, cls.name, target + suffix, by, value, statement.lineno))
+    return found
+
+
+def collect(patterns=PAGE_GLOBS):
+    """Scan every page module matching patterns; modules that do not parse are left out.
+
+    Args:
+        patterns (tuple): Globs relative to BASE_DIR
+
+    Returns:
+        list: PageLocator per locator
+    """
+    found = []
+    for pattern in patterns:
+        for path in sorted(glob.glob(os.path.join(BASE_DIR, pattern))):
+            try:
+                found.extend(scan_file(path))
+            except SyntaxError:
+                continue
+    return found
+
+
+def find_problems(page_locators):
+    """Find placeholder and duplicate locators.
+
+    Args:
+        page_locators (list): PageLocator per locator
+
+    Returns:
+        dict: (source, page class) -> list of messages
+    """
+    problems = defaultdict(list)
+    seen = defaultdict(dict)
+    for locator in page_locators:
+        key = (locator.source, locator.page)
+        described = f"{locator.name} = ({locator.by!r}, {locator.value!r}) at line {locator.lineno}"
+        if PLACEHOLDER_PATTERN.search(locator.value):
+            problems[key].append(f"{described} is a placeholder")
+            continue
+        first = seen[key].setdefault((locator.by, locator.value), locator.name)
+        if first != locator.name:
+            problems[key].append(f"{described} duplicates {first}")
+    return problems
+
+
+def page_classes_used(module):
+    """List the classes a test module has imported.
+
+    Args:
+        module: Test module
+
+    Returns:
+        set: (source relative to BASE_DIR, class name)
+    """
+    used = set()
+    for value in vars(module).values():
+        if not inspect.isclass(value):
+            continue
+        try:
+            path = inspect.getsourcefile(value)
+        except TypeError:
+            continue
+        if path:
+            used.add((os.path.relpath(path, BASE_DIR), value.__name__))
+    return used
+
+
+def check_items(items):
+    """Attach the locator problems of the page classes each test's module uses.
+
+    Called from pytest_collection_modifyitems; the page modules are scanned
+    once per session.
+
+    Args:
+        items (list): Collected items
+    """
+    problems = find_problems(collect())
+    if not problems:
+        return
+    by_module = {}
+    for item in items:
+        module = getattr(item, 'module', None)
+        if module is None:
+            continue
+        if module.__name__ not in by_module:
+            by_module[module.__name__] = [
+                f"{page} ({source}): {problem}"
+                for source, page in sorted(page_classes_used(module))
+                for problem in problems.get((source, page), [])
+            ]
+        if by_module[module.__name__]:
+            item.stash[PROBLEMS_KEY] = by_module[module.__name__]
+
+
+def raise_for_item(item):
+    """Fail a test flagged by check_items before any of its fixtures start a browser.
+
+    Args:
+        item: pytest item, from pytest_runtest_setup
+
+    Raises:
+        LocatorPreflightError: If the test's page classes have unusable locators
+    """
+    __tracebackhide__ = True
+    problems = item.stash.get(PROBLEMS_KEY, None)
+    if problems:
+        raise LocatorPreflightError(
+            "Page locators are not usable, fix them before running this test:\n  "
+            + "\n  ".join(problems)
+        )
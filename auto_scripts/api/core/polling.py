@@ -0,0 +1,165 @@
+"""Explicit wait polling
+
+Provides a backoff poll schedule and a WebDriverWait subclass that uses it,
+so fast pages are polled quickly and slow ones are not flooded with requests.
+"""
+
+import os
+import time
+from functools import lru_cache
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+from auto_scripts.api.core import deadline
+from auto_scripts.api.core.config_cache import load_config
+from auto_scripts.api.core.self_healing import healing_condition
+from auto_scripts.api.core.timeout_calibration import get_calibrator
+from auto_scripts.api.core.wait_telemetry import condition_name, telemetry
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), '..', 'config', 'config.yaml')
+
+
+class PollSchedule:
+    """Exponential backoff schedule for explicit wait polling."""
+
+    def __init__(self, initial=0.025, factor=2.0, maximum=0.5):
+        """Initialize poll schedule.
+
+        Args:
+            initial (float): First poll interval in seconds
+            factor (float): Multiplier applied after every poll
+            maximum (float): Upper bound for the poll interval in seconds
+
+        Raises:
+            ValueError: If the schedule would never grow or starts above its cap
+        """
+        if initial <= 0 or factor < 1 or maximum < initial:
+            raise ValueError(
+                f"Invalid poll schedule: initial={initial}, factor={factor}, max={maximum}"
+            )
+        self.initial = initial
+        self.factor = factor
+        self.maximum = maximum
+
+    def intervals(self):
+        """Yield successive poll intervals.
+
+        Yields:
+            float: Seconds to sleep before the next poll
+        """
+        interval = self.initial
+        while True:
+            yield interval
+            interval = min(interval * self.factor, self.maximum)
+
+    @classmethod
+    def from_config(cls, settings):
+        """Build a schedule from configuration.
+
+        Args:
+            settings (dict): Mapping with optional 'initial', 'factor' and 'max' keys
+
+        Returns:
+            PollSchedule: Configured schedule
+        """
+        settings = settings or {}
+        return cls(
+            initial=float(settings.get('initial', 0.025)),
+            factor=float(settings.get('factor', 2.0)),
+            maximum=float(settings.get('max', 0.5)),
+        )
+
+    def __repr__(self):
+        return f"PollSchedule(initial={self.initial}, factor={self.factor}, max={self.maximum})"
+
+
+@lru_cache(maxsize=None)
+def default_poll_schedule():
+    """Load the poll schedule from `timeouts.poll_schedule` in config.yaml.
+
+    The file is read once per process.
+
+    Returns:
+        PollSchedule: Configured schedule, or the default one if not configured
+    """
+    try:
+        config = load_config(CONFIG_PATH)
+    except FileNotFoundError:
+        config = {}
+    return PollSchedule.from_config(config.get('timeouts', {}).get('poll_schedule'))
+
+
+class BackoffWebDriverWait(WebDriverWait):
+    """WebDriverWait that polls on a PollSchedule instead of a fixed interval."""
+
+    def __init__(self, driver, timeout, poll_schedule=None, ignored_exceptions=None,
+                 locator=None, owner=None):
+        """Initialize wait.
+
+        Args:
+            driver: WebDriver instance
+            timeout (float): Timeout in seconds
+            poll_schedule (PollSchedule): Schedule to poll on, config default if None
+            ignored_exceptions (iterable): Exceptions ignored while polling
+            locator (tuple): Locator being waited on, used for timeout calibration
+            owner (str): Page class performing the wait, used for timeout calibration
+        """
+        self.poll_schedule = poll_schedule or default_poll_schedule()
+        self.locator = locator
+        self.owner = owner
+        super().__init__(
+            driver,
+            timeout,
+            poll_frequency=self.poll_schedule.initial,
+            ignored_exceptions=ignored_exceptions,
+        )
+
+    def until(self, method, message=""):
+        """Poll method until it returns a truthy value or the timeout expires."""
+        return self._poll_until(method, message, expect=True)
+
+    def until_not(self, method, message=""):
+        """Poll method until it returns a falsy value or the timeout expires."""
+        return self._poll_until(method, message, expect=False)
+
+    def _poll_until(self, method, message, expect):
+        screen = None
+        stacktrace = None
+        calibrator = get_calibrator()
+        own_timeout = calibrator.timeout_for(self.owner, self.locator, self._timeout)
+        timeout, limited = deadline.clamp(own_timeout)
+        started = time.monotonic()
+        end_time = started + timeout
+        outcome = 'error'
+        # A HealingLocator's fallbacks are tried whenever its primary misses
+        poll = healing_condition(method, self.locator, self.owner) if expect else method
+        try:
+            for interval in self.poll_schedule.intervals():
+                try:
+                    value = poll(self._driver)
+                    if bool(value) == expect:
+                        if expect:
+                            calibrator.record(self.owner, self.locator, time.monotonic() - started)
+                        outcome = 'ok'
+                        return value
+                except self._ignored_exceptions as exc:
+                    if not expect:
+                        outcome = 'ok'
+                        return True
+                    screen = getattr(exc, "screen", None)
+                    stacktrace = getattr(exc, "stacktrace", None)
+                remaining = end_time - time.monotonic()
+                if remaining <= 0:
+                    break
+                time.sleep(min(interval, remaining))
+            if limited:
+                outcome = 'deadline'
+                raise deadline.DeadlineExceeded(
+                    f"Test time budget exhausted while waiting. {message}".strip()
+                )
+            outcome = 'timeout'
+            raise TimeoutException(message, screen, stacktrace)
+        finally:
+            condition = condition_name(method) if expect else f"not {condition_name(method)}"
+            elapsed = time.monotonic() - started
+            telemetry.record(self.owner, self.locator, condition, elapsed, outcome)
@@ -0,0 +1,154 @@
+"""Prerequisite flows shared by many tests
+
+A probe test marked `@prerequisite("admin_login")` checks one flow that
+many tests start with; tests marked `@requires("admin_login")` depend on it.
+Probes are moved to the front of the run, and once a probe fails every
+test requiring it is skipped at setup with the probe's failure as the
+reason, instead of failing slowly through its own timeouts. Failures are
+recorded as files so every xdist worker sees them.
+
+Probes live in tests/test_prerequisites.py. A run collecting dependents but
+not their probe (e.g. `pytest tests/api`) warns that they run unguarded.
+
+Under xdist a dependent on another worker may start before the probe has
+failed. Probes and their dependents are put in one `xdist_group` per
+prerequisite, so `-n <N> --dist loadgroup` runs each group on one worker,
+probe first; with other `--dist` modes the skip is best effort.
+"""
+
+import glob
+import json
+import os
+import warnings
+
+import pytest
+
+BASE_DIR = os.path.join(os.path.dirname(__file__), '..')
+PREREQUISITE_DIR = os.path.join(BASE_DIR, '.cache', 'prerequisites')
+
+
+def requires(*names):
+    """Mark a test as depending on prerequisite flows.
+
+    Args:
+        *names (str): Prerequisite names, as given to prerequisite()
+
+    Returns:
+        MarkDecorator: pytest.mark.requires(*names)
+    """
+    return pytest.mark.requires(*names)
+
+
+def prerequisite(name):
+    """Mark a test as the probe of a prerequisite flow.
+
+    Args:
+        name (str): Prerequisite name
+
+    Returns:
+        MarkDecorator: pytest.mark.prerequisite(name)
+    """
+    return pytest.mark.prerequisite(name)
+
+
+def _probe_name(item):
+    marker = item.get_closest_marker('prerequisite')
+    return marker.args[0] if marker and marker.args else None
+
+
+def order_probes_first(items):
+    """Move probe tests to the front, keeping the order otherwise.
+
+    Args:
+        items (list): Collected items, modified in place
+    """
+    items.sort(key=lambda item: _probe_name(item) is None)
+
+
+def _required(item):
+    return [name for marker in item.iter_markers('requires') for name in marker.args]
+
+
+def group_with_probes(items):
+    """Put each probe and the tests requiring it in one xdist_group.
+
+    A test requiring several prerequisites joins the group of the first one;
+    tests already in an xdist_group are left alone.
+
+    Args:
+        items (list): Collected items
+    """
+    for item in items:
+        if item.get_closest_marker('xdist_group'):
+            continue
+        name = _probe_name(item) or next(iter(_required(item)), None)
+        if name is not None:
+            item.add_marker(pytest.mark.xdist_group(f"prerequisite-{name}"))
+
+
+def warn_missing_probes(items):
+    """Warn about prerequisites required by collected tests whose probe was not collected.
+
+    Args:
+        items (list): Collected items
+    """
+    probed = {_probe_name(item) for item in items}
+    for name in sorted({name for item in items for name in _required(item)} - probed):
+        warnings.warn(pytest.PytestWarning(
+            f"No probe for prerequisite '{name}' was collected; the tests requiring it run "
+            f"unguarded. Include tests/test_prerequisites.py in the run."
+        ))
+
+
+def _failure_path(name, directory):
+    return os.path.join(directory, f"{name}.json")
+
+
+def record_result(item, report, directory=PREREQUISITE_DIR):
+    """Record a failed probe, from pytest_runtest_makereport.
+
+    Args:
+        item: pytest item
+        report: TestReport of one phase
+        directory (str): Directory holding failed prerequisites
+    """
+    name = _probe_name(item)
+    if name is None or not report.failed:
+        return
+    crash = getattr(report.longrepr, 'reprcrash', None)
+    reason = crash.message if crash else report.longreprtext.strip().splitlines()[-1]
+    os.makedirs(directory, exist_ok=True)
+    path = _failure_path(name, directory)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump({'name': name, 'nodeid': item.nodeid, 'when': report.when,
+                   'reason': reason.splitlines()[0][:200]}, f)
+    os.replace(tmp_path, path)
+
+
+def skip_if_unmet(item, directory=PREREQUISITE_DIR):
+    """Skip a test whose required prerequisite probe has failed.
+
+    Args:
+        item: pytest item
+        directory (str): Directory holding failed prerequisites
+    """
+    for marker in item.iter_markers('requires'):
+        for name in marker.args:
+            try:
+                with open(_failure_path(name, directory)) as f:
+                    failure = json.load(f)
+            except (OSError, ValueError):
+                continue
+            pytest.skip(f"prerequisite '{name}' failed in {failure['nodeid']} "
+                        f"({failure['when']}): {failure['reason']}")
+
+
+def clear(directory=PREREQUISITE_DIR):
+    """Forget prerequisites that failed in a previous session.
+
+    Args:
+        directory (str): Directory holding failed prerequisites
+    """
+    for path in glob.glob(os.path.join(directory, '*.json')):
+        os.remove(path)
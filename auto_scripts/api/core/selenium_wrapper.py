@@ -1,7 +1,8 @@
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from selenium.webdriver.common.action_chains import ActionChains
+from auto_scripts.api.core.action_sequence import ActionSequence
+from auto_scripts.api.core.polling import BackoffWebDriverWait, default_poll_schedule
+from auto_scripts.api.core.stale_recovery import DEFAULT_STALE_RETRIES, run_with_recovery
 
 
 class SeleniumWrapper:
@@ -10,17 +11,39 @@ class SeleniumWrapper:
     Provides reusable methods for UI interactions
     """
     
-    def __init__(self, driver, timeout=10):
+    def __init__(self, driver, timeout=10, poll_schedule=None, owner=None,
+                 stale_retries=DEFAULT_STALE_RETRIES):
         """
         Initialize SeleniumWrapper
         
         Args:
             driver: Selenium WebDriver instance
             timeout (int): Default timeout for waits
+            poll_schedule (PollSchedule): Wait poll schedule, config default if None
+            owner (str): Page class using this instance, used for timeout calibration
+            stale_retries (int): Times an action re-locates an element that went stale
         """
         self.driver = driver
         self.timeout = timeout
-        self.wait = WebDriverWait(driver, timeout)
+        self.poll_schedule = poll_schedule or default_poll_schedule()
+        self.owner = owner
+        self.stale_retries = stale_retries
+        self.wait = self.create_wait(timeout)
+    
+    def create_wait(self, timeout, locator=None):
+        """
+        Create an explicit wait polling on this wrapper's schedule
+        
+        Args:
+            timeout (float): Wait timeout in seconds
+            locator (tuple): Locator being waited on, used for timeout calibration
+        
+        Returns:
+            BackoffWebDriverWait: Configured wait
+        """
+        return BackoffWebDriverWait(
+            self.driver, timeout, self.poll_schedule, locator=locator, owner=self.owner
+        )
     
     def wait_for_element(self, locator, timeout=None):
         """
@@ -34,9 +57,23 @@ class SeleniumWrapper:
             WebElement: Found element
         """
         wait_time = timeout if timeout else self.timeout
-        wait = WebDriverWait(self.driver, wait_time)
+        wait = self.create_wait(wait_time, locator)
         return wait.until(EC.presence_of_element_located(locator))
     
+    def _with_fresh_element(self, locator, locate, action):
+        """
+        Run action on the located element, re-locating it if it goes stale
+        
+        Args:
+            locator (tuple): Locator tuple (By.TYPE, "value")
+            locate (callable): Zero-arg callable returning a fresh element
+            action (callable): Callable receiving the element
+        
+        Returns:
+            Whatever action returns
+        """
+        return run_with_recovery(locate, action, locator, self.owner, self.stale_retries)
+    
     def click_element(self, locator):
         """
         Click on element with wait
@@ -44,8 +81,10 @@ class SeleniumWrapper:
         Args:
             locator (tuple): Locator tuple (By.TYPE, "value")
         """
-        element = self.wait.until(EC.element_to_be_clickable(locator))
-        element.click()
+        def locate():
+            wait = self.create_wait(self.timeout, locator)
+            return wait.until(EC.element_to_be_clickable(locator))
+        self._with_fresh_element(locator, locate, lambda element: element.click())
     
     def enter_text(self, locator, text):
         """
@@ -55,9 +94,10 @@ class SeleniumWrapper:
             locator (tuple): Locator tuple (By.TYPE, "value")
             text (str): Text to enter
         """
-        element = self.wait_for_element(locator)
-        element.clear()
-        element.send_keys(text)
+        def type_text(element):
+            element.clear()
+            element.send_keys(text)
+        self._with_fresh_element(locator, lambda: self.wait_for_element(locator), type_text)
     
     def is_element_visible(self, locator, timeout=None):
         """
@@ -72,7 +112,7 @@ class SeleniumWrapper:
         """
         try:
             wait_time = timeout if timeout else self.timeout
-            wait = WebDriverWait(self.driver, wait_time)
+            wait = self.create_wait(wait_time, locator)
             wait.until(EC.visibility_of_element_located(locator))
             return True
         except TimeoutException:
@@ -88,8 +128,21 @@ class SeleniumWrapper:
         Returns:
             str: Element text
         """
-        element = self.wait_for_element(locator)
-        return element.text
+        return self._with_fresh_element(
+            locator, lambda: self.wait_for_element(locator), lambda element: element.text
+        )
+    
+    def actions(self, timeout=None):
+        """
+        Start a batched sequence of pointer and keyboard actions
+        
+        Args:
+            timeout (int): Optional custom timeout for locating targets
+        
+        Returns:
+            ActionSequence: Empty sequence, sent as one request by perform()
+        """
+        return ActionSequence(self.driver, lambda locator: self.wait_for_element(locator, timeout))
     
     def hover_over_element(self, locator):
         """
@@ -98,6 +151,4 @@ class SeleniumWrapper:
         Args:
             locator (tuple): Locator tuple (By.TYPE, "value")
         """
-        element = self.wait_for_element(locator)
-        actions = ActionChains(self.driver)
-        actions.move_to_element(element).perform()
+        self.actions().hover(locator).perform()
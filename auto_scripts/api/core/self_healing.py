@@ -0,0 +1,272 @@
+"""Self-healing locators
+
+Lets page classes declare ranked fallbacks for a locator. When the primary
+misses during an explicit wait the fallbacks are tried in one script call,
+and the one that matched is persisted so later runs try it right after the
+primary.
+"""
+
+import json
+import os
+import sys
+import time
+
+from selenium.common.exceptions import NoSuchElementException, WebDriverException
+
+from auto_scripts.api.core.wait_telemetry import condition_name
+
+BASE_DIR = os.path.join(os.path.dirname(__file__), '..')
+RESOLUTION_FILE = os.path.join(BASE_DIR, '.cache', 'healing', 'resolutions.json')
+
+# Returns [index, element] for every locator in arguments[0] matching something,
+# in order. Locators are [by, value] pairs using Selenium's By strings.
+FIND_MATCHES_SCRIPT = """
+var locators = arguments[0];
+function textOf(node) { return (node.textContent || '').replace(/\\s+/g, ' ').trim(); }
+function find(by, value) {
+    switch (by) {
+    case 'id': return document.getElementById(value);
+    case 'name': return document.querySelector('[name="' + CSS.escape(value) + '"]');
+    case 'css selector': return document.querySelector(value);
+    case 'class name': return document.getElementsByClassName(value)[0] || null;
+    case 'tag name': return document.getElementsByTagName(value)[0] || null;
+    case 'xpath':
+        return document.evaluate(value, document, null,
+            XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    case 'link text':
+        return Array.prototype.find.call(document.links,
+            function (a) { return textOf(a) === value; }) || null;
+    case 'partial link text':
+        return Array.prototype.find.call(document.links,
+            function (a) { return textOf(a).indexOf(value) !== -1; }) || null;
+    }
+    return null;
+}
+var matches = [];
+for (var i = 0; i < locators.length; i++) {
+    try {
+        var element = find(locators[i][0], locators[i][1]);
+        if (element) { matches.push([i, element]); }
+    } catch (e) {}
+}
+return matches;
+"""
+
+# What an expected condition requires of the element; waits on any other
+# condition are never healed since a substitute element cannot satisfy them
+REQUIREMENTS = {
+    'presence_of_element_located': lambda element: True,
+    'visibility_of_element_located': lambda element: element.is_displayed(),
+    'element_to_be_clickable': lambda element: element.is_displayed() and element.is_enabled(),
+}
+
+
+class HealingLocator(tuple):
+    """(By, value) locator with ranked fallbacks tried when the primary matches nothing
+
+        SUBMIT_BUTTON = HealingLocator((By.ID, "submit"),
+                                       (By.NAME, "submit"),
+                                       (By.CSS_SELECTOR, "[data-test='submit']"),
+                                       (By.XPATH, "//button[normalize-space()='Submit']"))
+
+    It is a plain 2-tuple of the primary locator everywhere else.
+    """
+
+    def __new__(cls, primary, *fallbacks):
+        """Create the locator.
+
+        Args:
+            primary (tuple): (By, value) tried through the normal condition
+            *fallbacks (tuple): (By, value) alternatives, best first
+        """
+        locator = super().__new__(cls, primary)
+        locator.fallbacks = tuple(tuple(fallback) for fallback in fallbacks)
+        return locator
+
+    def __reduce__(self):
+        return (HealingLocator, (tuple(self),) + self.fallbacks)
+
+
+def _key(owner, locator):
+    return f"{owner or '-'}|{locator[0]}|{locator[1]}"
+
+
+class ResolutionCache:
+    """Fallbacks that healed a primary locator, persisted across runs.
+
+    Entries are keyed by page class and primary locator. On later runs a
+    cached fallback is tried right after the primary, and dropped again as
+    soon as the primary matches. save() merges into the file on disk so
+    xdist workers can share it.
+    """
+
+    def __init__(self, path=RESOLUTION_FILE):
+        """Initialize the cache; the file is read on first use.
+
+        Args:
+            path (str): JSON file holding the resolutions
+        """
+        self.path = path
+        self.started = time.time()
+        self._entries = None
+        self._changed = {}
+
+    @property
+    def entries(self):
+        if self._entries is None:
+            self._entries = self._read()
+        return self._entries
+
+    def _read(self):
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def preferred(self, owner, locator):
+        """Return the cached fallback for a locator.
+
+        Args:
+            owner (str): Page class name
+            locator (HealingLocator): Locator being waited on
+
+        Returns:
+            tuple: Cached fallback, None if there is none or it is no longer declared
+        """
+        entry = self.entries.get(_key(owner, locator))
+        if entry is None:
+            return None
+        fallback = (entry['by'], entry['value'])
+        return fallback if fallback in locator.fallbacks else None
+
+    def candidates(self, owner, locator):
+        """Return the locators to try in one script call.
+
+        Args:
+            owner (str): Page class name
+            locator (HealingLocator): Locator being waited on
+
+        Returns:
+            list: Primary, cached fallback, remaining fallbacks when a fallback
+                is cached, otherwise just the fallbacks
+        """
+        preferred = self.preferred(owner, locator)
+        if preferred is None:
+            return list(locator.fallbacks)
+        rest = [fallback for fallback in locator.fallbacks if fallback != preferred]
+        return [tuple(locator), preferred] + rest
+
+    def record(self, owner, locator, used):
+        """Remember which candidate matched.
+
+        Args:
+            owner (str): Page class name
+            locator (HealingLocator): Locator being waited on
+            used (tuple): Candidate that matched; the primary clears the entry
+        """
+        key = _key(owner, locator)
+        if tuple(used) == tuple(locator):
+            if key in self.entries:
+                del self.entries[key]
+                self._changed[key] = None
+            return
+        entry = self.entries.get(key)
+        if entry is None or (entry['by'], entry['value']) != tuple(used):
+            entry = {'page': owner or '-', 'primary': list(locator), 'by': used[0],
+                     'value': used[1], 'heals': 0}
+        entry['heals'] += 1
+        entry['last_healed'] = time.time()
+        self.entries[key] = entry
+        self._changed[key] = entry
+
+    def save(self):
+        """Merge this process' changes into the file on disk."""
+        if not self._changed:
+            return
+        merged = self._read()
+        for key, entry in self._changed.items():
+            if entry is None:
+                merged.pop(key, None)
+            else:
+                merged[key] = entry
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(merged, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+        self._entries = merged
+        self._changed.clear()
+
+    def report(self, since=None):
+        """Build the healing report.
+
+        Args:
+            since (float): Only list locators healed after this timestamp
+
+        Returns:
+            list: Report lines, empty if nothing was healed
+        """
+        entries = [entry for entry in self._read().values()
+                   if since is None or entry['last_healed'] >= since]
+        if not entries:
+            return []
+        lines = ["Primary locators that no longer match; update them to the fallback that did:"]
+        for entry in sorted(entries, key=lambda entry: (-entry['heals'], entry['page'])):
+            by, value = entry['primary']
+            last = time.strftime('%Y-%m-%d %H:%M', time.localtime(entry['last_healed']))
+            lines.append(f"  {entry['page']} {by}={value!r} -> {entry['by']}={entry['value']!r} "
+                         f"(healed {entry['heals']}x, last {last})")
+        return lines
+
+
+resolutions = ResolutionCache()
+
+
+def healing_condition(method, locator, owner, cache=None):
+    """Wrap an expected condition so a HealingLocator's fallbacks are tried when it fails.
+
+    The primary goes through the original condition; when it misses, every
+    fallback is tried in one script call. Once a fallback has healed the
+    locator, all candidates go in that single call, the primary first so a
+    fixed primary clears the cached fallback. The first candidate that both
+    matches and meets the condition wins.
+
+    Args:
+        method (callable): Expected condition built from the primary locator
+        locator (tuple): Locator being waited on
+        owner (str): Page class name
+        cache (ResolutionCache): Defaults to the process-wide resolutions
+
+    Returns:
+        callable: method itself when the locator has no fallbacks or the
+            condition cannot be met by a substitute element
+    """
+    requirement = REQUIREMENTS.get(condition_name(method))
+    if not getattr(locator, 'fallbacks', None) or requirement is None:
+        return method
+    cache = cache or resolutions
+
+    def condition(driver):
+        if cache.preferred(owner, locator) is None:
+            try:
+                value = method(driver)
+            except NoSuchElementException:
+                value = False
+            if value:
+                return value
+        candidates = cache.candidates(owner, locator)
+        try:
+            matches = driver.execute_script(FIND_MATCHES_SCRIPT, [list(c) for c in candidates])
+            for index, element in matches or ():
+                if requirement(element):
+                    cache.record(owner, locator, candidates[index])
+                    return element
+        except WebDriverException:
+            pass
+        return False
+    return condition
+
+
+if __name__ == '__main__':
+    print("\n".join(ResolutionCache(*sys.argv[1:2]).report()) or "No healed locators recorded")
@@ -0,0 +1,113 @@
+"""Stale element recovery
+
+Re-locates an element by its locator when the DOM re-renders between locating
+it and acting on it, and counts how often that happens.
+"""
+
+from collections import Counter
+
+from selenium.common.exceptions import StaleElementReferenceException
+
+# Re-resolutions allowed per wrapper call before the stale error is raised
+DEFAULT_STALE_RETRIES = 2
+
+
+class StaleRecoveryStats:
+    """Process-wide counters of stale-element re-resolutions.
+
+    Counters are keyed by page class and locator.
+    """
+
+    def __init__(self):
+        """Initialize empty counters."""
+        self.retries = Counter()
+        self.recovered = Counter()
+        self.exhausted = Counter()
+
+    @staticmethod
+    def key(owner, locator):
+        """Build the counter key for a page class and locator.
+
+        Args:
+            owner (str): Page class name
+            locator (tuple): Element locator
+
+        Returns:
+            str: Counter key
+        """
+        return f"{owner or '-'}|{locator[0]}|{locator[1]}" if locator else owner or '-'
+
+    def summary(self):
+        """Summarize the counters.
+
+        Returns:
+            dict: Totals plus per-locator retry counts, most frequent first
+        """
+        return {
+            'retries': sum(self.retries.values()),
+            'recovered': sum(self.recovered.values()),
+            'exhausted': sum(self.exhausted.values()),
+            'by_locator': dict(self.retries.most_common()),
+        }
+
+    def reset(self):
+        """Clear all counters."""
+        self.retries.clear()
+        self.recovered.clear()
+        self.exhausted.clear()
+
+
+stats = StaleRecoveryStats()
+
+
+def run_with_recovery(locate, action, locator=None, owner=None, retries=DEFAULT_STALE_RETRIES):
+    """Run action on a freshly located element, re-locating it when it goes stale.
+
+    Args:
+        locate (callable): Zero-arg callable returning a fresh element
+        action (callable): Callable receiving the element
+        locator (tuple): Element locator, used for the counters
+        owner (str): Page class name, used for the counters
+        retries (int): Re-resolutions allowed before the error is re-raised
+
+    Returns:
+        Whatever action returns
+
+    Raises:
+        StaleElementReferenceException: If the element is still stale after all retries
+    """
+    key = stats.key(owner, locator)
+    attempt = 0
+    while True:
+        element = locate()
+        try:
+            result = action(element)
+        except StaleElementReferenceException:
+            if attempt >= retries:
+                stats.exhausted[key] += 1
+                raise
+            attempt += 1
+            stats.retries[key] += 1
+            continue
+        if attempt:
+            stats.recovered[key] += 1
+        return result
+
+
+def format_summary(summary, top=5):
+    """Format a StaleRecoveryStats summary for the terminal.
+
+    Args:
+        summary (dict): Result of StaleRecoveryStats.summary()
+        top (int): Number of most frequent locators to list
+
+    Returns:
+        list: Report lines
+    """
+    lines = [
+        f"Stale element recovery: {summary['retries']} re-resolutions, "
+        f"{summary['recovered']} calls recovered, {summary['exhausted']} gave up"
+    ]
+    for key, count in list(summary['by_locator'].items())[:top]:
+        lines.append(f"  {count:>4}  {key}")
+    return lines
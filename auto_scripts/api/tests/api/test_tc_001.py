@@ -9,8 +9,10 @@ import yaml
 from auto_scripts.Pages.login_page import LoginPage
 from auto_scripts.Pages.product_catalog_page import ProductCatalogPage
 from auto_scripts.Pages.base_page import BasePage
+from auto_scripts.api.core.prerequisites import requires
 
 
+@requires("admin_login")
 def test_tc_001_product_catalog_listing(driver):
     """Test Product Catalog Listing functionality.
     
@@ -48,3 +50,5 @@ def test_tc_001_product_catalog_listing(driver):
     # Step 6: Assert all products listed
     assert product_catalog_page.assert_all_products_listed(), "Not all products are listed with details"
     assert len(products) > 0, "No products found in catalog"
+    incomplete = ProductCatalogPage.find_products_missing_details(product_catalog_page.get_all_products())
+    assert not incomplete, f"Products missing details or inventory status: {incomplete}"
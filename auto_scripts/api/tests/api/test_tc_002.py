@@ -9,8 +9,10 @@ import yaml
 from auto_scripts.Pages.login_page import LoginPage
 from auto_scripts.Pages.add_product_page import AddProductPage
 from auto_scripts.Pages.base_page import BasePage
+from auto_scripts.api.core.prerequisites import requires
 
 
+@requires("admin_login")
 def test_tc_002_add_product(driver):
     """Test Add Product functionality.
     
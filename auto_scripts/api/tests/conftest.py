@@ -4,10 +4,44 @@ This file contains shared fixtures and configuration for all tests.
 """
 
 import pytest
-import yaml
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
+from selenium.webdriver.remote.command import Command
+from auto_scripts.api.core import (
+    deadline, impact_analysis, locator_preflight, prerequisites, self_healing, stale_recovery, wait_telemetry,
+)
+from auto_scripts.api.core.config_cache import load_config
+from auto_scripts.api.core.timeout_calibration import get_calibrator
+
+
+# Commands that neither need the preloaded page nor should trigger loading it
+PRELOAD_SKIPPING_COMMANDS = {Command.GET, Command.QUIT}
+
+
+def preload_lazily(driver, url):
+    """Load url right before the driver's first browser command.
+    
+    If that first command is itself a navigation (page objects navigating on
+    their own), or the driver is quit unused, the preload is dropped instead
+    of costing an extra page load. Any other command, reading the current
+    URL included, loads it first, so the browser always reports its real
+    state: BasePage.navigate_to checking where it is finds the preloaded
+    page and does not load it a second time.
+    
+    Args:
+        driver: Selenium WebDriver instance
+        url (str): URL to preload
+    """
+    execute = driver.execute
+    
+    def execute_after_preload(driver_command, params=None):
+        driver.execute = execute
+        if driver_command not in PRELOAD_SKIPPING_COMMANDS:
+            execute(Command.GET, {'url': url})
+        return execute(driver_command, params)
+    
+    driver.execute = execute_after_preload
 
 
 @pytest.fixture(scope="function")
@@ -19,8 +53,7 @@ def driver(request):
     """
     # Load configuration
     try:
-        with open('auto_scripts/api/config/config.yaml', 'r') as f:
-            config = yaml.safe_load(f)
+        config = load_config('auto_scripts/api/config/config.yaml')
     except FileNotFoundError:
         config = {
             'browser': 'chrome',
@@ -48,12 +81,13 @@ def driver(request):
         raise ValueError(f"Unsupported browser: {browser}")
     
     driver.maximize_window()
-    driver.implicitly_wait(10)
+    # Explicit waits poll with find_element; an implicit wait would block each poll
+    driver.implicitly_wait(0)
     
-    # Navigate to base URL if configured
+    # Navigate to base URL if configured, but only if the test does not navigate first
     base_url = config.get('base_url')
     if base_url:
-        driver.get(base_url)
+        preload_lazily(driver, base_url)
     
     yield driver
     
@@ -69,11 +103,97 @@ def config():
         dict: Configuration dictionary
     """
     try:
-        with open('auto_scripts/api/config/config.yaml', 'r') as f:
-            return yaml.safe_load(f)
+        return load_config('auto_scripts/api/config/config.yaml')
     except FileNotFoundError:
         return {
             'browser': 'chrome',
             'headless': False,
             'base_url': 'http://localhost:8080'
         }
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    """Run the test inside its time budget so every wait is cut down to the time left.
+    
+    The budget comes from a `budget(seconds)` marker or `timeouts.test_budget`
+    in config.yaml.
+    """
+    try:
+        config = load_config('auto_scripts/api/config/config.yaml')
+        test_budget = config.get('timeouts', {}).get('test_budget')
+    except FileNotFoundError:
+        test_budget = None
+    with deadline.budget(deadline.budget_for(item, test_budget)):
+        yield
+
+
+def pytest_addoption(parser):
+    """Register --impacted-by for test impact analysis."""
+    impact_analysis.add_option(parser)
+
+
+def pytest_collection_modifyitems(config, items):
+    """Deselect tests unaffected by --impacted-by changes, flag unusable page locators
+    and run prerequisite probes first, grouped with their dependents for xdist."""
+    impact_analysis.deselect_unaffected(config, items)
+    locator_preflight.check_items(items)
+    prerequisites.order_probes_first(items)
+    prerequisites.group_with_probes(items)
+    prerequisites.warn_missing_probes(items)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    """Skip tests whose prerequisite failed and error flagged tests immediately
+    instead of letting them time out in a browser."""
+    prerequisites.skip_if_unmet(item)
+    locator_preflight.raise_for_item(item)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Record failed prerequisite probes for the tests requiring them."""
+    outcome = yield
+    prerequisites.record_result(item, outcome.get_result())
+
+
+def pytest_sessionstart(session):
+    """Drop telemetry and failed prerequisites of a previous session (controller process only)."""
+    if not hasattr(session.config, 'workerinput'):
+        wait_telemetry.clear_flushed()
+        prerequisites.clear()
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Persist wait durations, healed locators and flush wait telemetry.
+    
+    Wait durations are flushed per process; the controller folds every
+    worker's into the calibration history.
+    """
+    get_calibrator().flush()
+    if not hasattr(session.config, 'workerinput'):
+        get_calibrator().save()
+    self_healing.resolutions.save()
+    wait_telemetry.telemetry.flush()
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Report stale element recovery, healed locators and wait telemetry for the session."""
+    summary = stale_recovery.stats.summary()
+    if summary['retries'] or summary['exhausted']:
+        terminalreporter.section("stale element recovery")
+        for line in stale_recovery.format_summary(summary):
+            terminalreporter.write_line(line)
+
+    lines = self_healing.resolutions.report(since=self_healing.resolutions.started)
+    if lines:
+        terminalreporter.section("self-healing locators")
+        for line in lines:
+            terminalreporter.write_line(line)
+
+    lines = wait_telemetry.WaitTelemetry.load().report()
+    if lines:
+        terminalreporter.section("wait telemetry")
+        for line in lines:
+            terminalreporter.write_line(line)
@@ -0,0 +1,18 @@
+"""Prerequisite probes
+
+Each probe checks one flow many tests start with; tests marked
+`@requires(<name>)` are skipped as soon as its probe fails. Kept at the top
+of tests/ so a run of the whole suite collects them along with every
+dependent, in tests/api as well as tests/ui.
+"""
+
+from auto_scripts.Pages.login_page import LoginPage
+from auto_scripts.api.core.prerequisites import prerequisite
+
+
+@prerequisite("admin_login")
+def test_admin_login(driver):
+    """Admin can log in with valid credentials."""
+    login_page = LoginPage(driver)
+    login_page.login_as_admin("admin", "valid_admin_password")
+    assert login_page.assert_admin_login_successful(), "Admin login failed"
@@ -6,9 +6,11 @@ import pytest
 from auto_scripts.Pages.LoginPage import LoginPage
 from auto_scripts.Pages.ProductCatalogPage import ProductCatalogPage
 from auto_scripts.core.driver_factory import get_driver
-import yaml
+from auto_scripts.api.core.config_cache import load_config
+from auto_scripts.api.core.prerequisites import requires
 
 
+@requires("admin_login")
 def test_tc_001_product_catalog_listing():
     """
     Test Case: tc_001
@@ -19,8 +21,7 @@ def test_tc_001_product_catalog_listing():
       3. View all products and verify listing
     """
     # Load configuration
-    with open('auto_scripts/api/config/config.yaml') as f:
-        config = yaml.safe_load(f)
+    config = load_config('auto_scripts/api/config/config.yaml')
     
     # Initialize driver
     driver = get_driver()
@@ -6,9 +6,11 @@ import pytest
 from auto_scripts.Pages.LoginPage import LoginPage
 from auto_scripts.Pages.AddProductPage import AddProductPage
 from auto_scripts.core.driver_factory import get_driver
-import yaml
+from auto_scripts.api.core.config_cache import load_config
+from auto_scripts.api.core.prerequisites import requires
 
 
+@requires("admin_login")
 def test_tc_002_add_product():
     """
     Test Case: tc_002
@@ -19,8 +21,7 @@ def test_tc_002_add_product():
       3. Enter product details and submit
     """
     # Load configuration
-    with open('auto_scripts/api/config/config.yaml') as f:
-        config = yaml.safe_load(f)
+    config = load_config('auto_scripts/api/config/config.yaml')
     
     # Initialize driver
     driver = get_driver()
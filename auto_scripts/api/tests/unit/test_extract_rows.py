@@ -0,0 +1,86 @@
+"""Row extraction tests.
+
+Checks the spec BasePage.extract_rows hands to its extraction script: how
+locators are escaped and how row and field XPaths are kept inside their row.
+"""
+
+import pytest
+from selenium.webdriver.common.by import By
+from auto_scripts.api.Pages.BasePage import EXTRACT_ROWS_SCRIPT, BasePage, _locator_query
+from auto_scripts.api.core import locator_preflight
+
+
+class FakeDriver:
+    """Driver recording the extraction spec and returning no rows."""
+
+    def __init__(self):
+        self.specs = []
+
+    def execute_script(self, script, spec):
+        assert script == EXTRACT_ROWS_SCRIPT
+        self.specs.append(spec)
+        return []
+
+
+class TestLocatorQuery:
+    """Test class for translating locators into extraction queries."""
+
+    @pytest.mark.parametrize('locator, query', [
+        ((By.ID, 'price\\"x'), {'attribute': 'id', 'value': 'price\\"x'}),
+        ((By.NAME, 'qty'), {'attribute': 'name', 'value': 'qty'}),
+        ((By.CLASS_NAME, 'in:stock'), {'className': 'in:stock'}),
+        ((By.CSS_SELECTOR, '.price'), {'css': '.price'}),
+    ])
+    def test_values_escaped_in_page(self, locator, query):
+        """Verify ids, names and class names go to the script unescaped, for CSS.escape."""
+        assert _locator_query(locator) == query
+        assert 'CSS.escape(q.value)' in EXTRACT_ROWS_SCRIPT
+
+    def test_relative_xpath_stays_in_row(self):
+        """Verify a row or field XPath starting with / is evaluated from the row."""
+        assert _locator_query((By.XPATH, "//span[@class='price']"), relative=True) == \
+            {'xpath': ".//span[@class='price']"}
+        assert _locator_query((By.XPATH, "./td[2]"), relative=True) == {'xpath': "./td[2]"}
+        assert _locator_query((By.XPATH, "//table"), relative=False) == {'xpath': "//table"}
+
+    def test_grouped_document_xpath_rejected(self):
+        """Verify a parenthesized XPath searching the whole document is rejected for a field."""
+        with pytest.raises(ValueError, match='whole document'):
+            _locator_query((By.XPATH, "(//span)[1]"), relative=True)
+
+    def test_unsupported_strategy(self):
+        """Verify link text locators cannot be extracted."""
+        with pytest.raises(ValueError):
+            _locator_query((By.LINK_TEXT, 'Details'))
+
+
+class TestExtractRows:
+    """Test class for the single-call row extraction."""
+
+    def test_spec(self):
+        """Verify container, row and field queries are built as the script expects."""
+        driver = FakeDriver()
+        page = BasePage(driver)
+        rows = page.extract_rows((By.ID, 'products'), (By.XPATH, "//tr"), {
+            'name': (By.XPATH, "//td[1]"),
+            'link': ((By.CSS_SELECTOR, 'a'), 'href'),
+            'text': None,
+        })
+        assert rows == []
+        assert driver.specs == [{
+            'container': {'attribute': 'id', 'value': 'products'},
+            'rows': {'xpath': './/tr'},
+            'fields': [
+                {'name': 'name', 'query': {'xpath': './/td[1]'}, 'attribute': None},
+                {'name': 'link', 'query': {'css': 'a'}, 'attribute': 'href'},
+                {'name': 'text', 'query': None, 'attribute': None},
+            ],
+        }]
+
+    def test_product_fields_flagged_as_placeholders(self):
+        """Verify the product catalog's extraction locators are reported until they are filled in."""
+        problems = locator_preflight.find_problems(locator_preflight.collect())
+        flagged = problems[('auto_scripts/Pages/product_catalog_page.py', 'ProductCatalogPage')]
+        for name in ('PRODUCT_ROW', "PRODUCT_FIELDS['name']", "PRODUCT_FIELDS['price']",
+                     "PRODUCT_FIELDS['inventory_status']"):
+            assert any(problem.startswith(f"{name} = ") for problem in flagged)
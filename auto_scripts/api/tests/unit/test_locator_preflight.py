@@ -0,0 +1,61 @@
+"""Locator preflight tests.
+
+Scans small page modules written to a temporary directory and checks which
+locators are flagged and how a flagged test fails.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from auto_scripts.api.core import locator_preflight
+
+PAGE_SOURCE = '''
+from selenium.webdriver.common.by import By
+
+class LoginPage:
+    USERNAME = (By.ID, "username")
+    SUBMIT = (By.ID, "<placeholder>")
+    LOGIN_BUTTON = (By.ID, "username")
+    FIELDS = {"email": (By.NAME, "placeholder_email"), "name": (By.NAME, "name")}
+    LOGIN = HealingLocator((By.ID, "login"), (By.NAME, "login"))
+
+    def helper(self):
+        local = (By.ID, "<placeholder>")
+'''
+
+
+@pytest.fixture
+def page_locators(tmp_path, monkeypatch):
+    """Locators of PAGE_SOURCE, scanned relative to tmp_path."""
+    monkeypatch.setattr(locator_preflight, 'BASE_DIR', str(tmp_path))
+    path = tmp_path / 'login_page.py'
+    path.write_text(PAGE_SOURCE)
+    return locator_preflight.scan_file(str(path))
+
+
+class TestLocatorPreflight:
+    """Test class for flagging unusable page locators."""
+
+    def test_scan_class_attributes(self, page_locators):
+        """Verify class-level tuples, HealingLocator primaries and dicts of tuples are found, method locals are not."""
+        assert [locator.name for locator in page_locators] == \
+            ['USERNAME', 'SUBMIT', 'LOGIN_BUTTON', "FIELDS['email']", "FIELDS['name']", 'LOGIN']
+        assert page_locators[-1].by == 'id' and page_locators[-1].value == 'login'
+        assert page_locators[0] == ('login_page.py', 'LoginPage', 'USERNAME', 'id', 'username', 5)
+
+    def test_placeholders_and_duplicates(self, page_locators):
+        """Verify placeholder values and locators declared twice are reported per page class."""
+        problems = locator_preflight.find_problems(page_locators)
+        assert problems == {('login_page.py', 'LoginPage'): [
+            "SUBMIT = ('id', '<placeholder>') at line 6 is a placeholder",
+            "LOGIN_BUTTON = ('id', 'username') at line 7 duplicates USERNAME",
+            "FIELDS['email'] = ('name', 'placeholder_email') at line 8 is a placeholder",
+        ]}
+
+    def test_flagged_item_fails_in_setup(self):
+        """Verify a flagged test raises with the problems listed and others pass through."""
+        flagged = SimpleNamespace(stash=pytest.Stash())
+        flagged.stash[locator_preflight.PROBLEMS_KEY] = ['LoginPage (login_page.py): SUBMIT is a placeholder']
+        with pytest.raises(locator_preflight.LocatorPreflightError, match='SUBMIT is a placeholder'):
+            locator_preflight.raise_for_item(flagged)
+        locator_preflight.raise_for_item(SimpleNamespace(stash=pytest.Stash()))
@@ -0,0 +1,61 @@
+"""Lazy preload tests.
+
+Checks that the driver fixture's deferred base URL load happens before the
+first browser command that needs a page, and never answers for the browser.
+"""
+
+from selenium.webdriver.remote.command import Command
+from auto_scripts.api.tests.conftest import preload_lazily
+
+BASE_URL = 'http://localhost:8080'
+
+
+class FakeDriver:
+    """Driver recording the commands it executes and tracking the loaded URL."""
+
+    def __init__(self):
+        self.commands = []
+        self.url = 'about:blank'
+
+    def execute(self, driver_command, params=None):
+        self.commands.append((driver_command, params))
+        if driver_command == Command.GET:
+            self.url = params['url']
+        if driver_command == Command.GET_CURRENT_URL:
+            return {'value': self.url}
+        return {'value': None}
+
+
+class TestPreloadLazily:
+    """Test class for the deferred base URL load."""
+
+    def test_reading_url_loads_page_first(self):
+        """Verify reading the current URL loads the preload and reports the real URL."""
+        driver = FakeDriver()
+        preload_lazily(driver, BASE_URL)
+        assert driver.execute(Command.GET_CURRENT_URL)['value'] == BASE_URL
+        assert driver.commands == [(Command.GET, {'url': BASE_URL}), (Command.GET_CURRENT_URL, None)]
+
+    def test_navigation_first_drops_preload(self):
+        """Verify a navigation as first command replaces the preload."""
+        driver = FakeDriver()
+        preload_lazily(driver, BASE_URL)
+        driver.execute(Command.GET, {'url': f"{BASE_URL}/login"})
+        driver.execute(Command.GET_CURRENT_URL)
+        assert driver.commands == [(Command.GET, {'url': f"{BASE_URL}/login"}), (Command.GET_CURRENT_URL, None)]
+
+    def test_quit_unused_drops_preload(self):
+        """Verify quitting an unused driver loads nothing."""
+        driver = FakeDriver()
+        preload_lazily(driver, BASE_URL)
+        driver.execute(Command.QUIT)
+        assert driver.commands == [(Command.QUIT, None)]
+
+    def test_preload_happens_once(self):
+        """Verify later commands go straight to the browser."""
+        driver = FakeDriver()
+        preload_lazily(driver, BASE_URL)
+        driver.execute(Command.FIND_ELEMENT, {'using': 'id', 'value': 'login'})
+        driver.execute(Command.GET_CURRENT_URL)
+        assert [command for command, _ in driver.commands] == \
+            [Command.GET, Command.FIND_ELEMENT, Command.GET_CURRENT_URL]
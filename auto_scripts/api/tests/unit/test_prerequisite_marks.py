@@ -0,0 +1,80 @@
+"""Prerequisite tests.
+
+Drives the prerequisite hooks with stand-in items and checks probe ordering,
+xdist grouping, the missing probe warning and skipping once a probe failed.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from auto_scripts.api.core import prerequisites
+
+
+class FakeItem:
+    """Stand-in for a pytest item carrying marks."""
+
+    def __init__(self, nodeid, *marks):
+        self.nodeid = nodeid
+        self.marks = [mark.mark for mark in marks]
+
+    def iter_markers(self, name):
+        return (mark for mark in self.marks if mark.name == name)
+
+    def get_closest_marker(self, name):
+        return next(self.iter_markers(name), None)
+
+    def add_marker(self, marker):
+        self.marks.append(marker.mark)
+
+
+def collected():
+    """A dependent, an unrelated test and the admin_login probe, in collection order."""
+    return [FakeItem('tests/api/test_tc_001.py::test_catalog', prerequisites.requires('admin_login')),
+            FakeItem('tests/ui/test_tc_003.py::test_search'),
+            FakeItem('tests/test_prerequisites.py::test_admin_login', prerequisites.prerequisite('admin_login'))]
+
+
+def failed_report(when='call'):
+    """Stand-in for the TestReport of a failed phase."""
+    return SimpleNamespace(failed=True, when=when, longrepr=SimpleNamespace(
+        reprcrash=SimpleNamespace(message="AssertionError: Admin login failed")))
+
+
+class TestPrerequisites:
+    """Test class for probes and the tests requiring them."""
+
+    def test_probes_first(self):
+        """Verify probes move to the front and the rest keep their order."""
+        items = collected()
+        prerequisites.order_probes_first(items)
+        assert [item.nodeid.split('::')[1] for item in items] == ['test_admin_login', 'test_catalog', 'test_search']
+
+    def test_probe_and_dependents_grouped(self):
+        """Verify a probe and its dependents share an xdist_group and other tests get none."""
+        items = collected()
+        prerequisites.group_with_probes(items)
+        groups = [item.get_closest_marker('xdist_group') for item in items]
+        assert groups[0].args == groups[2].args == ('prerequisite-admin_login',)
+        assert groups[1] is None
+
+    def test_existing_group_kept(self):
+        """Verify a test already in an xdist_group stays in it."""
+        item = FakeItem('test_x', prerequisites.requires('admin_login'), pytest.mark.xdist_group('db'))
+        prerequisites.group_with_probes([item])
+        assert [mark.args for mark in item.iter_markers('xdist_group')] == [('db',)]
+
+    def test_missing_probe_warns(self):
+        """Verify dependents collected without their probe are reported."""
+        with pytest.warns(pytest.PytestWarning, match="No probe for prerequisite 'admin_login'"):
+            prerequisites.warn_missing_probes(collected()[:2])
+
+    def test_failed_probe_skips_dependents(self, tmp_path):
+        """Verify a failed probe skips its dependents with the probe's failure as the reason."""
+        dependent, unrelated, probe = collected()
+        prerequisites.skip_if_unmet(dependent, str(tmp_path))
+        prerequisites.record_result(probe, failed_report(), str(tmp_path))
+        with pytest.raises(pytest.skip.Exception, match="Admin login failed"):
+            prerequisites.skip_if_unmet(dependent, str(tmp_path))
+        prerequisites.skip_if_unmet(unrelated, str(tmp_path))
+        prerequisites.clear(str(tmp_path))
+        prerequisites.skip_if_unmet(dependent, str(tmp_path))
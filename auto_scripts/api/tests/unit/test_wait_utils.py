@@ -0,0 +1,39 @@
+"""Wait utility tests.
+
+Runs WaitUtils against a stand-in driver that reports a scripted sequence
+of URLs, without a browser.
+"""
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+from auto_scripts.api.core.polling import PollSchedule
+from auto_scripts.api.utils.wait_utils import WaitUtils
+
+FAST_SCHEDULE = PollSchedule(initial=0.001, factor=1.0, maximum=0.001)
+
+
+class FakeDriver:
+    """Driver whose current_url walks through a list of URLs, then stays on the last."""
+
+    def __init__(self, *urls):
+        self.urls = list(urls)
+
+    @property
+    def current_url(self):
+        return self.urls.pop(0) if len(self.urls) > 1 else self.urls[0]
+
+
+class TestWaitForUrlContains:
+    """Test class for waiting on the current URL."""
+
+    def test_returns_once_url_matches(self):
+        """Verify the wait polls until the URL contains the fragment."""
+        driver = FakeDriver('http://localhost/login', 'http://localhost/login', 'http://localhost/products')
+        wait_utils = WaitUtils(driver, timeout=2, poll_schedule=FAST_SCHEDULE)
+        assert wait_utils.wait_for_url_contains('/products') is True
+
+    def test_times_out(self):
+        """Verify a URL that never matches raises TimeoutException."""
+        wait_utils = WaitUtils(FakeDriver('http://localhost/login'), timeout=0.05, poll_schedule=FAST_SCHEDULE)
+        with pytest.raises(TimeoutException):
+            wait_utils.wait_for_url_contains('/products')
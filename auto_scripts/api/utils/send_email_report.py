@@ -7,15 +7,13 @@ from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
 from email import encoders
 import os
-import yaml
 from datetime import datetime
+from auto_scripts.api.core import config_cache
 
 
 def load_config():
     """Load configuration from config.yaml"""
-    config_path = os.path.join(os.path.dirname(__file__), '..', 'config', 'config.yaml')
-    with open(config_path, 'r') as f:
-        return yaml.safe_load(f)
+    return config_cache.load_config()
 
 
 def send_report(subject=None, body=None, attachments=None, recipients=None):
@@ -3,25 +3,43 @@
 Provides reusable wait methods for common scenarios in test automation.
 """
 
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from auto_scripts.api.utils.logger import logger
+from auto_scripts.api.core.polling import BackoffWebDriverWait, default_poll_schedule
 
 
 class WaitUtils:
     """Utility class for WebDriver wait operations."""
     
-    def __init__(self, driver, timeout=20):
+    def __init__(self, driver, timeout=20, poll_schedule=None, owner=None):
         """Initialize WaitUtils with driver and default timeout.
         
         Args:
             driver: Selenium WebDriver instance
             timeout (int): Default timeout in seconds
+            poll_schedule (PollSchedule): Wait poll schedule, config default if None
+            owner (str): Page class using this instance, used for timeout calibration
         """
         self.driver = driver
         self.timeout = timeout
-        self.wait = WebDriverWait(driver, timeout)
+        self.poll_schedule = poll_schedule or default_poll_schedule()
+        self.owner = owner
+        self.wait = self.create_wait(timeout)
+    
+    def create_wait(self, timeout, locator=None):
+        """Create an explicit wait polling on this instance's schedule.
+        
+        Args:
+            timeout (float): Wait timeout in seconds
+            locator (tuple): Locator being waited on, used for timeout calibration
+        
+        Returns:
+            BackoffWebDriverWait: Configured wait
+        """
+        return BackoffWebDriverWait(
+            self.driver, timeout, self.poll_schedule, locator=locator, owner=self.owner
+        )
     
     def wait_for_element_visible(self, locator, timeout=None):
         """Wait for element to be visible.
@@ -38,7 +56,7 @@ class WaitUtils:
         """
         try:
             wait_time = timeout if timeout else self.timeout
-            wait = WebDriverWait(self.driver, wait_time)
+            wait = self.create_wait(wait_time, locator)
             element = wait.until(EC.visibility_of_element_located(locator))
             logger.info(f"Element {locator} is visible")
             return element
@@ -61,7 +79,7 @@ class WaitUtils:
         """
         try:
             wait_time = timeout if timeout else self.timeout
-            wait = WebDriverWait(self.driver, wait_time)
+            wait = self.create_wait(wait_time, locator)
             element = wait.until(EC.element_to_be_clickable(locator))
             logger.info(f"Element {locator} is clickable")
             return element
@@ -84,7 +102,7 @@ class WaitUtils:
         """
         try:
             wait_time = timeout if timeout else self.timeout
-            wait = WebDriverWait(self.driver, wait_time)
+            wait = self.create_wait(wait_time, locator)
             element = wait.until(EC.presence_of_element_located(locator))
             logger.info(f"Element {locator} is present in DOM")
             return element
@@ -108,7 +126,7 @@ class WaitUtils:
         """
         try:
             wait_time = timeout if timeout else self.timeout
-            wait = WebDriverWait(self.driver, wait_time)
+            wait = self.create_wait(wait_time, locator)
             result = wait.until(EC.text_to_be_present_in_element(locator, text))
             logger.info(f"Text '{text}' found in element {locator}")
             return result
@@ -131,7 +149,7 @@ class WaitUtils:
         """
         try:
             wait_time = timeout if timeout else self.timeout
-            wait = WebDriverWait(self.driver, wait_time)
+            wait = self.create_wait(wait_time, locator)
             result = wait.until(EC.invisibility_of_element_located(locator))
             logger.info(f"Element {locator} is invisible")
             return result
@@ -154,7 +172,7 @@ class WaitUtils:
         """
         try:
             wait_time = timeout if timeout else self.timeout
-            wait = WebDriverWait(self.driver, wait_time)
+            wait = self.create_wait(wait_time)
             result = wait.until(EC.url_contains(url_fragment))
             logger.info(f"URL contains '{url_fragment}'")
             return result
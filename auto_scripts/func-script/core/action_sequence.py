@@ -0,0 +1,92 @@
+from selenium.webdriver.common.action_chains import ActionChains
+
+
+class ActionSequence:
+    """Fluent builder for multi-step pointer and keyboard interactions
+
+    Targets are locators or already located WebElements; locators are waited
+    for as steps are queued. perform() sends every queued step to the browser
+    as a single W3C actions request instead of one command per step:
+
+        wrapper.actions().click(search).type(search, "shoes").press(Keys.ENTER).perform()
+    """
+
+    def __init__(self, driver, locate):
+        self.driver = driver
+        self._locate = locate
+        self._chain = ActionChains(driver)
+        self._steps = 0
+
+    def __len__(self):
+        return self._steps
+
+    def _element(self, target):
+        if isinstance(target, tuple):
+            return self._locate(target)
+        return target
+
+    def _queued(self):
+        self._steps += 1
+        return self
+
+    def hover(self, target):
+        """Move the pointer to the middle of target"""
+        self._chain.move_to_element(self._element(target))
+        return self._queued()
+
+    def click(self, target=None):
+        """Click target, or the current pointer position when target is None"""
+        self._chain.click(None if target is None else self._element(target))
+        return self._queued()
+
+    def double_click(self, target=None):
+        """Double click target, or the current pointer position when target is None"""
+        self._chain.double_click(None if target is None else self._element(target))
+        return self._queued()
+
+    def right_click(self, target=None):
+        """Context click target, or the current pointer position when target is None"""
+        self._chain.context_click(None if target is None else self._element(target))
+        return self._queued()
+
+    def type(self, target, text):
+        """Click target to focus it and type text (existing text is not cleared)"""
+        self._chain.send_keys_to_element(self._element(target), text)
+        return self._queued()
+
+    def press(self, *keys):
+        """Type keys into the focused element, e.g. press(Keys.TAB, Keys.ENTER)"""
+        self._chain.send_keys(*keys)
+        return self._queued()
+
+    def key_down(self, key):
+        """Hold a modifier key down until key_up"""
+        self._chain.key_down(key)
+        return self._queued()
+
+    def key_up(self, key):
+        """Release a modifier key held by key_down"""
+        self._chain.key_up(key)
+        return self._queued()
+
+    def drag(self, source, target):
+        """Drag source and drop it onto target"""
+        self._chain.drag_and_drop(self._element(source), self._element(target))
+        return self._queued()
+
+    def drag_by(self, source, x_offset, y_offset):
+        """Drag source by the given pixel offset"""
+        self._chain.drag_and_drop_by_offset(self._element(source), x_offset, y_offset)
+        return self._queued()
+
+    def pause(self, seconds):
+        """Pause between the surrounding steps inside the browser"""
+        self._chain.pause(seconds)
+        return self._queued()
+
+    def perform(self):
+        """Send all queued steps in one actions request and start a new sequence"""
+        if self._steps:
+            self._chain.perform()
+        self._chain = ActionChains(self.driver)
+        self._steps = 0
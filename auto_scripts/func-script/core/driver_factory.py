@@ -8,15 +8,12 @@ from selenium.webdriver.edge.options import Options as EdgeOptions
 from webdriver_manager.chrome import ChromeDriverManager
 from webdriver_manager.firefox import GeckoDriverManager
 from webdriver_manager.microsoft import EdgeChromiumDriverManager
-import yaml
-import os
+from core import config_cache
 
 
 def load_config():
     """Load configuration from config.yaml file"""
-    config_path = os.path.join(os.path.dirname(__file__), '..', 'config', 'config.yaml')
-    with open(config_path, 'r') as file:
-        return yaml.safe_load(file)
+    return config_cache.load_config()
 
 
 def get_chrome_driver(headless=False, window_size="1920,1080"):
@@ -91,7 +88,7 @@ def get_driver(browser_name=None, headless=None, window_size=None):
     else:
         raise ValueError(f"Unsupported browser: {browser}")
     
-    # Set timeouts from config
+    # Set timeouts from config; implicit_wait stays 0 so explicit wait polls do not block
     driver.implicitly_wait(config['browser']['implicit_wait'])
     driver.set_page_load_timeout(config['browser']['page_load_timeout'])
     driver.set_script_timeout(config['browser']['script_timeout'])
@@ -1,31 +1,72 @@
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.support.ui import Select
 from selenium.common.exceptions import (
     TimeoutException,
     NoSuchElementException,
     ElementNotInteractableException,
-    StaleElementReferenceException
+    StaleElementReferenceException,
+    WebDriverException
 )
 import time
 import logging
+from core.action_sequence import ActionSequence
+from core.polling import BackoffWebDriverWait, default_poll_schedule
+from core.stale_recovery import DEFAULT_STALE_RETRIES, run_with_recovery
+
+# Selects the option(s) of the <select> in arguments[0] whose text or value
+# (arguments[1]) equals arguments[2], firing input/change like a user would.
+# Returns true when selected, false when no option matches and null when the
+# element or option needs Select's own handling (not a <select>, disabled).
+SELECT_OPTION_SCRIPT = """
+var select = arguments[0], attribute = arguments[1], wanted = arguments[2];
+if (!select || select.tagName.toLowerCase() !== 'select') { return null; }
+var matched = [];
+for (var i = 0; i < select.options.length; i++) {
+    var option = select.options[i];
+    if ((attribute === 'text' ? option.text : option.value) !== wanted) { continue; }
+    if (option.disabled) { return null; }
+    matched.push(option);
+    if (!select.multiple) { break; }
+}
+if (!matched.length) { return false; }
+var changed = false;
+matched.forEach(function (option) {
+    if (!option.selected) { option.selected = true; changed = true; }
+});
+if (changed) {
+    select.dispatchEvent(new Event('input', {bubbles: true}));
+    select.dispatchEvent(new Event('change', {bubbles: true}));
+}
+return true;
+"""
 
 
 class SeleniumWrapper:
     """Wrapper class for common Selenium operations with enhanced error handling and waits"""
     
-    def __init__(self, driver, timeout=10):
+    def __init__(self, driver, timeout=10, poll_schedule=None, owner=None,
+                 stale_retries=DEFAULT_STALE_RETRIES, element_cache=None):
         self.driver = driver
         self.timeout = timeout
-        self.wait = WebDriverWait(driver, timeout)
+        self.poll_schedule = poll_schedule or default_poll_schedule()
+        self.owner = owner
+        self.stale_retries = stale_retries
+        self.element_cache = element_cache
+        self.wait = self.create_wait(timeout)
         self.logger = logging.getLogger(__name__)
     
+    def create_wait(self, timeout, locator=None):
+        """Create an explicit wait polling on this wrapper's schedule"""
+        return BackoffWebDriverWait(
+            self.driver, timeout, self.poll_schedule, locator=locator, owner=self.owner
+        )
+    
     def find_element(self, locator, timeout=None):
         """Find element with explicit wait"""
         wait_time = timeout or self.timeout
         try:
-            element = WebDriverWait(self.driver, wait_time).until(
+            element = self.create_wait(wait_time, locator).until(
                 EC.presence_of_element_located(locator)
             )
             return element
@@ -37,7 +78,7 @@ class SeleniumWrapper:
         """Find multiple elements with explicit wait"""
         wait_time = timeout or self.timeout
         try:
-            WebDriverWait(self.driver, wait_time).until(
+            self.create_wait(wait_time, locator).until(
                 EC.presence_of_element_located(locator)
             )
             return self.driver.find_elements(*locator)
@@ -49,7 +90,7 @@ class SeleniumWrapper:
         """Wait for element to be visible"""
         wait_time = timeout or self.timeout
         try:
-            element = WebDriverWait(self.driver, wait_time).until(
+            element = self.create_wait(wait_time, locator).until(
                 EC.visibility_of_element_located(locator)
             )
             return element
@@ -61,7 +102,7 @@ class SeleniumWrapper:
         """Wait for element to be clickable"""
         wait_time = timeout or self.timeout
         try:
-            element = WebDriverWait(self.driver, wait_time).until(
+            element = self.create_wait(wait_time, locator).until(
                 EC.element_to_be_clickable(locator)
             )
             return element
@@ -69,13 +110,28 @@ class SeleniumWrapper:
             self.logger.error(f"Element not clickable with locator: {locator}")
             raise
     
+    def _with_fresh_element(self, locator, locate, action):
+        """Run action on the located element, re-locating it at once if it goes stale
+        
+        With an element cache the cached handle is tried before locating again.
+        """
+        if self.element_cache is not None:
+            return self.element_cache.resolve(locator, locate, action, self.stale_retries)
+        return run_with_recovery(locate, action, locator, self.owner, self.stale_retries)
+    
     def click_element(self, locator, timeout=None):
         """Click element with retry mechanism"""
         max_attempts = 3
         for attempt in range(max_attempts):
             try:
-                element = self.wait_for_element_clickable(locator, timeout)
-                element.click()
+                self._with_fresh_element(
+                    locator,
+                    lambda: self.wait_for_element_clickable(locator, timeout),
+                    lambda element: element.click(),
+                )
+                if self.element_cache is not None:
+                    # The click may have navigated; the cache re-checks the URL on its next lookup
+                    self.element_cache.mark_dirty()
                 return
             except (StaleElementReferenceException, ElementNotInteractableException) as e:
                 if attempt == max_attempts - 1:
@@ -85,11 +141,14 @@ class SeleniumWrapper:
     
     def enter_text(self, locator, text, clear_first=True, timeout=None):
         """Enter text into input field"""
-        try:
-            element = self.wait_for_element_visible(locator, timeout)
+        def type_text(element):
             if clear_first:
                 element.clear()
             element.send_keys(text)
+        try:
+            self._with_fresh_element(
+                locator, lambda: self.wait_for_element_visible(locator, timeout), type_text
+            )
         except Exception as e:
             self.logger.error(f"Failed to enter text '{text}' into element {locator}: {str(e)}")
             raise
@@ -97,8 +156,11 @@ class SeleniumWrapper:
     def get_text(self, locator, timeout=None):
         """Get text from element"""
         try:
-            element = self.wait_for_element_visible(locator, timeout)
-            return element.text
+            return self._with_fresh_element(
+                locator,
+                lambda: self.wait_for_element_visible(locator, timeout),
+                lambda element: element.text,
+            )
         except Exception as e:
             self.logger.error(f"Failed to get text from element {locator}: {str(e)}")
             raise
@@ -115,7 +177,7 @@ class SeleniumWrapper:
     def is_element_visible(self, locator, timeout=2):
         """Check if element is visible"""
         try:
-            WebDriverWait(self.driver, timeout).until(
+            self.create_wait(timeout, locator).until(
                 EC.visibility_of_element_located(locator)
             )
             return True
@@ -125,7 +187,7 @@ class SeleniumWrapper:
     def is_element_present(self, locator, timeout=2):
         """Check if element is present in DOM"""
         try:
-            WebDriverWait(self.driver, timeout).until(
+            self.create_wait(timeout, locator).until(
                 EC.presence_of_element_located(locator)
             )
             return True
@@ -136,7 +198,7 @@ class SeleniumWrapper:
         """Wait for specific text to appear in element"""
         wait_time = timeout or self.timeout
         try:
-            WebDriverWait(self.driver, wait_time).until(
+            self.create_wait(wait_time, locator).until(
                 EC.text_to_be_present_in_element(locator, text)
             )
             return True
@@ -154,26 +216,53 @@ class SeleniumWrapper:
             self.logger.error(f"Failed to scroll to element {locator}: {str(e)}")
             raise
     
+    def actions(self, timeout=None):
+        """Start a batched pointer/keyboard ActionSequence, sent as one request by perform()"""
+        return ActionSequence(
+            self.driver, lambda locator: self.wait_for_element_visible(locator, timeout)
+        )
+    
     def hover_over_element(self, locator, timeout=None):
         """Hover over element"""
         try:
-            element = self.wait_for_element_visible(locator, timeout)
-            ActionChains(self.driver).move_to_element(element).perform()
+            self.actions(timeout).hover(locator).perform()
         except Exception as e:
             self.logger.error(f"Failed to hover over element {locator}: {str(e)}")
             raise
     
-    def select_dropdown_by_text(self, locator, text, timeout=None):
-        """Select dropdown option by visible text"""
-        from selenium.webdriver.support.ui import Select
+    def select_dropdown_by_text(self, locator, text, timeout=None, use_script=True):
+        """Select dropdown option by visible text, in one script call unless Select is needed"""
         try:
             element = self.find_element(locator, timeout)
-            select = Select(element)
-            select.select_by_visible_text(text)
+            selected = self._select_option_by_script(element, 'text', text) if use_script else None
+            if selected is None:
+                Select(element).select_by_visible_text(text)
+            elif not selected:
+                raise NoSuchElementException(f"Could not locate element with visible text: {text}")
         except Exception as e:
             self.logger.error(f"Failed to select dropdown option '{text}' from {locator}: {str(e)}")
             raise
     
+    def select_dropdown_by_value(self, locator, value, timeout=None, use_script=True):
+        """Select dropdown option by value, in one script call unless Select is needed"""
+        try:
+            element = self.find_element(locator, timeout)
+            selected = self._select_option_by_script(element, 'value', value) if use_script else None
+            if selected is None:
+                Select(element).select_by_value(value)
+            elif not selected:
+                raise NoSuchElementException(f"Cannot locate option with value: {value}")
+        except Exception as e:
+            self.logger.error(f"Failed to select dropdown value '{value}' from {locator}: {str(e)}")
+            raise
+    
+    def _select_option_by_script(self, element, attribute, wanted):
+        """Select matching option(s) in the page; None means fall back to Select"""
+        try:
+            return self.driver.execute_script(SELECT_OPTION_SCRIPT, element, attribute, wanted)
+        except WebDriverException:
+            return None
+    
     def take_screenshot(self, filename):
         """Take screenshot and save to file"""
         try:
@@ -0,0 +1,146 @@
+import glob
+import json
+import math
+import os
+from functools import lru_cache
+
+from core.config_cache import load_config
+
+BASE_DIR = os.path.join(os.path.dirname(__file__), '..')
+CONFIG_PATH = os.path.join(BASE_DIR, 'config', 'config.yaml')
+
+# Most recent wait durations kept per page class and locator
+MAX_SAMPLES = 200
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of a list of numbers"""
+    ordered = sorted(samples)
+    rank = max(math.ceil(pct / 100.0 * len(ordered)) - 1, 0)
+    return ordered[rank]
+
+
+class TimeoutCalibrator:
+    """Records wait-to-success durations per page class and locator across runs
+
+    In calibrated mode a locator's timeout becomes safety_factor x its observed
+    p99, bounded by min_timeout and max_timeout and never longer than the
+    timeout the caller asked for. Locators with fewer than min_samples
+    recorded successes keep the timeout the caller asked for.
+    """
+
+    def __init__(self, history_file, enabled=False, safety_factor=3.0,
+                 min_samples=20, min_timeout=1.0, max_timeout=60.0):
+        self.history_file = history_file
+        self.enabled = enabled
+        self.safety_factor = safety_factor
+        self.min_samples = min_samples
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self._samples = None
+        self._recorded = {}
+
+    @staticmethod
+    def key(owner, locator):
+        """History key for a page class and locator tuple"""
+        return f"{owner or '-'}|{locator[0]}|{locator[1]}"
+
+    def _history(self):
+        if self._samples is None:
+            self._samples = self._read_file()
+        return self._samples
+
+    def _read_file(self):
+        return self._read_json(self.history_file)
+
+    def record(self, owner, locator, seconds):
+        """Record how long a successful wait on locator took"""
+        if locator is None:
+            return
+        key = self.key(owner, locator)
+        self._recorded.setdefault(key, []).append(round(seconds, 4))
+        samples = self._history().setdefault(key, [])
+        samples.append(round(seconds, 4))
+        del samples[:-MAX_SAMPLES]
+
+    def timeout_for(self, owner, locator, default):
+        """Timeout to use for a wait on locator, `default` unless calibrated
+
+        A calibrated timeout never exceeds `default`: a caller asking for a
+        short wait, such as a negative visibility check, keeps it short.
+        """
+        if not self.enabled or locator is None:
+            return default
+        samples = self._history().get(self.key(owner, locator), [])
+        if len(samples) < self.min_samples:
+            return default
+        calibrated = percentile(samples, 99) * self.safety_factor
+        return min(max(calibrated, self.min_timeout), self.max_timeout, default)
+
+    def _run_file(self, worker):
+        root, ext = os.path.splitext(self.history_file)
+        return f"{root}-{worker}{ext}"
+
+    @staticmethod
+    def _read_json(path):
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def flush(self, worker=None):
+        """Write durations recorded in this process to <history>-<worker>.json for save() to merge"""
+        if not self._recorded:
+            return None
+        worker = worker or os.environ.get('PYTEST_XDIST_WORKER', 'main')
+        path = self._run_file(worker)
+        recorded = self._read_json(path)
+        for key, samples in self._recorded.items():
+            recorded.setdefault(key, []).extend(samples)
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_file = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_file, 'w') as f:
+            json.dump(recorded, f)
+        os.replace(tmp_file, path)
+        self._recorded = {}
+        return path
+
+    def save(self):
+        """Fold every process' flushed durations into the history file (controller process only)"""
+        root, ext = os.path.splitext(self.history_file)
+        runs = sorted(glob.glob(f"{glob.escape(root)}-*{ext}"))
+        if not runs:
+            return
+        history = self._read_file()
+        for run in runs:
+            for key, samples in self._read_json(run).items():
+                merged = history.setdefault(key, [])
+                merged.extend(samples)
+                del merged[:-MAX_SAMPLES]
+        os.makedirs(os.path.dirname(self.history_file) or '.', exist_ok=True)
+        tmp_file = f"{self.history_file}.{os.getpid()}.tmp"
+        with open(tmp_file, 'w') as f:
+            json.dump(history, f, indent=1, sort_keys=True)
+        os.replace(tmp_file, self.history_file)
+        for run in runs:
+            os.remove(run)
+        self._samples = history
+
+
+@lru_cache(maxsize=None)
+def get_calibrator():
+    """Process-wide calibrator configured from `browser.calibration` in config.yaml"""
+    try:
+        config = load_config(CONFIG_PATH)
+    except FileNotFoundError:
+        config = {}
+    settings = config.get('browser', {}).get('calibration') or {}
+    return TimeoutCalibrator(
+        history_file=os.path.join(BASE_DIR, settings.get('history_file', '.cache/wait_timings.json')),
+        enabled=bool(settings.get('enabled', False)),
+        safety_factor=float(settings.get('safety_factor', 3.0)),
+        min_samples=int(settings.get('min_samples', 20)),
+        min_timeout=float(settings.get('min_timeout', 1.0)),
+        max_timeout=float(settings.get('max_timeout', 60.0)),
+    )
@@ -0,0 +1,174 @@
+import bisect
+import glob
+import json
+import math
+import os
+import sys
+
+BASE_DIR = os.path.join(os.path.dirname(__file__), '..')
+TELEMETRY_DIR = os.path.join(BASE_DIR, '.cache', 'telemetry')
+
+# Upper bounds in seconds of the latency buckets; one more bucket holds anything slower
+BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+FAILED_OUTCOMES = ('timeout', 'deadline')
+
+
+def condition_name(method):
+    """Readable name of an expected condition or wait callable"""
+    name = getattr(method, '__qualname__', None) or type(method).__name__
+    return name.split('.')[0]
+
+
+class WaitHistogram:
+    """Latency histogram and outcome counts for one page class, locator and condition"""
+
+    __slots__ = ('counts', 'outcomes', 'total', 'maximum')
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.outcomes = {}
+        self.total = 0.0
+        self.maximum = 0.0
+
+    @property
+    def calls(self):
+        return sum(self.counts)
+
+    @property
+    def failures(self):
+        return sum(self.outcomes.get(outcome, 0) for outcome in FAILED_OUTCOMES)
+
+    def add(self, elapsed, outcome):
+        self.counts[bisect.bisect_left(BUCKETS, elapsed)] += 1
+        self.outcomes[outcome] = self.outcomes.get(outcome, 0) + 1
+        self.total += elapsed
+        self.maximum = max(self.maximum, elapsed)
+
+    def percentile(self, pct):
+        """Upper bound of the bucket holding the pct-th percentile"""
+        rank = max(math.ceil(pct / 100.0 * self.calls), 1)
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return BUCKETS[index] if index < len(BUCKETS) else self.maximum
+        return 0.0
+
+    def merge(self, other):
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        for outcome, count in other.outcomes.items():
+            self.outcomes[outcome] = self.outcomes.get(outcome, 0) + count
+        self.total += other.total
+        self.maximum = max(self.maximum, other.maximum)
+
+    def to_dict(self):
+        return {'counts': self.counts, 'outcomes': self.outcomes,
+                'total': round(self.total, 4), 'max': round(self.maximum, 4)}
+
+    @classmethod
+    def from_dict(cls, data):
+        histogram = cls()
+        histogram.counts = list(data['counts'])
+        histogram.outcomes = dict(data['outcomes'])
+        histogram.total = data['total']
+        histogram.maximum = data['max']
+        return histogram
+
+
+class WaitTelemetry:
+    """In-memory wait histograms keyed by (page class, By, locator value, condition)
+
+    Every explicit wait records into the process-wide `telemetry` instance;
+    each pytest process (xdist worker or not) flushes it to its own file in
+    TELEMETRY_DIR at session end and the controller merges them for the report.
+    """
+
+    def __init__(self):
+        self.histograms = {}
+
+    def record(self, owner, locator, condition, elapsed, outcome):
+        """Record one wait; outcome is 'ok', 'timeout', 'deadline' or 'error'"""
+        by, value = locator if locator else ('-', '-')
+        key = (owner or '-', by, value, condition)
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = WaitHistogram()
+        histogram.add(elapsed, outcome)
+
+    def merge(self, other):
+        for key, histogram in other.histograms.items():
+            if key in self.histograms:
+                self.histograms[key].merge(histogram)
+            else:
+                self.histograms[key] = WaitHistogram.from_dict(histogram.to_dict())
+
+    def clear(self):
+        self.histograms.clear()
+
+    def flush(self, directory=TELEMETRY_DIR, worker=None):
+        """Write this process' histograms to waits-<worker>.json and return its path"""
+        if not self.histograms:
+            return None
+        worker = worker or os.environ.get('PYTEST_XDIST_WORKER', 'main')
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"waits-{worker}.json")
+        records = [
+            dict(zip(('owner', 'by', 'value', 'condition'), key), **histogram.to_dict())
+            for key, histogram in self.histograms.items()
+        ]
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(records, f)
+        os.replace(tmp_path, path)
+        return path
+
+    @classmethod
+    def load(cls, directory=TELEMETRY_DIR):
+        """Merge every flushed worker file in directory"""
+        merged = cls()
+        for path in sorted(glob.glob(os.path.join(directory, 'waits-*.json'))):
+            with open(path) as f:
+                records = json.load(f)
+            part = cls()
+            for record in records:
+                key = (record['owner'], record['by'], record['value'], record['condition'])
+                part.histograms[key] = WaitHistogram.from_dict(record)
+            merged.merge(part)
+        return merged
+
+    def report(self, top=10):
+        """Report lines: waits costing the most total time and the most timed-out locators"""
+        if not self.histograms:
+            return []
+        header = f"{'total s':>9} {'calls':>6} {'mean':>7} {'p95<=':>7} {'max':>7} {'fail':>5}  wait"
+
+        def row(key, histogram):
+            owner, by, value, condition = key
+            return (f"{histogram.total:>9.2f} {histogram.calls:>6} "
+                    f"{histogram.total / histogram.calls:>7.3f} {histogram.percentile(95):>7.2f} "
+                    f"{histogram.maximum:>7.2f} {histogram.failures:>5}  "
+                    f"{owner} {by}={value} [{condition}]")
+
+        items = list(self.histograms.items())
+        lines = ["Slowest waits (by total time)", header]
+        items.sort(key=lambda item: item[1].total, reverse=True)
+        lines.extend(row(key, histogram) for key, histogram in items[:top])
+        failing = [item for item in items if item[1].failures]
+        if failing:
+            failing.sort(key=lambda item: (item[1].failures, item[1].total), reverse=True)
+            lines += ["", "Most timed-out waits", header]
+            lines.extend(row(key, histogram) for key, histogram in failing[:top])
+        return lines
+
+
+def clear_flushed(directory=TELEMETRY_DIR):
+    """Remove worker files left over from a previous session"""
+    for path in glob.glob(os.path.join(directory, 'waits-*.json')):
+        os.remove(path)
+
+
+telemetry = WaitTelemetry()
+
+
+if __name__ == '__main__':
+    print("\n".join(WaitTelemetry.load(*sys.argv[1:2]).report()) or "No wait telemetry recorded")
@@ -1,6 +1,6 @@
 from core.selenium_wrapper import SeleniumWrapper
-import yaml
-import os
+from core.config_cache import load_config
+from core.element_cache import ElementCache
 
 
 class BasePage:
@@ -8,33 +8,35 @@ class BasePage:
     
     def __init__(self, driver):
         self.driver = driver
-        self.selenium_wrapper = SeleniumWrapper(driver)
+        self.element_cache = ElementCache(driver, owner=type(self).__name__)
+        self.selenium_wrapper = SeleniumWrapper(driver, owner=type(self).__name__,
+                                                element_cache=self.element_cache)
         self.config = self._load_config()
     
     def _load_config(self):
         """Load configuration from config.yaml"""
-        config_path = os.path.join(os.path.dirname(__file__), '..', 'config', 'config.yaml')
-        with open(config_path, 'r') as file:
-            return yaml.safe_load(file)
+        return load_config()
     
     def find_element(self, locator, timeout=None):
         """Find element using selenium wrapper"""
-        return self.selenium_wrapper.find_element(locator, timeout)
+        element = self.selenium_wrapper.find_element(locator, timeout)
+        self.element_cache.put(locator, element)
+        return element
     
     def find_elements(self, locator, timeout=None):
         """Find multiple elements using selenium wrapper"""
         return self.selenium_wrapper.find_elements(locator, timeout)
     
     def click_element(self, locator, timeout=None):
-        """Click element using selenium wrapper"""
+        """Click element using selenium wrapper, reusing the cached handle when it is still attached"""
         self.selenium_wrapper.click_element(locator, timeout)
     
     def enter_text(self, locator, text, clear_first=True, timeout=None):
-        """Enter text into element using selenium wrapper"""
+        """Enter text into element using selenium wrapper, reusing the cached handle when it is still attached"""
         self.selenium_wrapper.enter_text(locator, text, clear_first, timeout)
     
     def get_text(self, locator, timeout=None):
-        """Get text from element using selenium wrapper"""
+        """Get text from element using selenium wrapper, reusing the cached handle when it is still attached"""
         return self.selenium_wrapper.get_text(locator, timeout)
     
     def get_attribute(self, locator, attribute_name, timeout=None):
@@ -79,18 +81,22 @@ class BasePage:
     
     def refresh_page(self):
         """Refresh current page"""
+        self.element_cache.clear()
         self.driver.refresh()
     
     def navigate_back(self):
         """Navigate back in browser history"""
+        self.element_cache.clear()
         self.driver.back()
     
     def navigate_forward(self):
         """Navigate forward in browser history"""
+        self.element_cache.clear()
         self.driver.forward()
     
     def switch_to_window(self, window_handle):
         """Switch to specific browser window"""
+        self.element_cache.clear()
         self.driver.switch_to.window(window_handle)
     
     def get_window_handles(self):
@@ -104,10 +110,12 @@ class BasePage:
     def switch_to_frame(self, frame_locator):
         """Switch to iframe"""
         frame_element = self.find_element(frame_locator)
+        self.element_cache.clear()
         self.driver.switch_to.frame(frame_element)
     
     def switch_to_default_content(self):
         """Switch back to default content from iframe"""
+        self.element_cache.clear()
         self.driver.switch_to.default_content()
     
     def execute_javascript(self, script, *args):
@@ -1,17 +1,21 @@
 import pytest
 import os
-import yaml
 from datetime import datetime
 from core.driver_factory import get_driver
+from core import config_cache, deadline, self_healing, stale_recovery, wait_telemetry
+from core.timeout_calibration import get_calibrator
 from utils.send_email_report import send_test_completion_report
 
 
+def load_config():
+    """Load configuration from config.yaml"""
+    return config_cache.load_config()
+
+
 @pytest.fixture(scope="session")
 def config():
     """Load configuration for test session"""
-    config_path = os.path.join(os.path.dirname(__file__), '..', 'config', 'config.yaml')
-    with open(config_path, 'r') as file:
-        return yaml.safe_load(file)
+    return load_config()
 
 
 @pytest.fixture(scope="function")
@@ -56,6 +60,14 @@ def pytest_runtest_makereport(item, call):
     setattr(item, "rep_" + rep.when, rep)
 
 
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    """Run the test inside its time budget so every wait is cut down to the time left"""
+    test_budget = load_config().get('execution', {}).get('test_budget')
+    with deadline.budget(deadline.budget_for(item, test_budget)):
+        yield
+
+
 @pytest.fixture(scope="session", autouse=True)
 def test_session_setup_teardown(config):
     """Setup and teardown for entire test session"""
@@ -74,6 +86,15 @@ def test_session_setup_teardown(config):
     
     print(f"\n=== Test Session Completed ===")
     print(f"Duration: {duration}")
+    for line in stale_recovery.format_summary(stale_recovery.stats.summary()):
+        print(line)
+    
+    # Flush wait durations for timeout calibration; the controller folds them into the history
+    get_calibrator().flush()
+    # Flush this worker's wait histograms for the telemetry report
+    wait_telemetry.telemetry.flush()
+    # Persist fallbacks that healed a locator so later runs try them first
+    self_healing.resolutions.save()
     
     # Send email report if enabled
     if config.get('reporting', {}).get('email_notification', False):
@@ -101,6 +122,33 @@ def collect_test_results(request, test_session_setup_teardown):
         test_results.append(result)
 
 
+def pytest_sessionstart(session):
+    """Drop wait telemetry flushed by a previous session (controller process only)"""
+    if not hasattr(session.config, 'workerinput'):
+        wait_telemetry.clear_flushed()
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Fold every process' wait durations into the calibration history (controller process only)"""
+    if not hasattr(session.config, 'workerinput'):
+        get_calibrator().save()
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Report healed locators and the slowest and most timed-out waits of the session"""
+    lines = self_healing.resolutions.report(since=self_healing.resolutions.started)
+    if lines:
+        terminalreporter.section("self-healing locators")
+        for line in lines:
+            terminalreporter.write_line(line)
+
+    lines = wait_telemetry.WaitTelemetry.load().report()
+    if lines:
+        terminalreporter.section("wait telemetry")
+        for line in lines:
+            terminalreporter.write_line(line)
+
+
 # Pytest configuration
 def pytest_configure(config):
     """Configure pytest with custom markers"""
@@ -122,6 +170,9 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "validation: mark test as validation test"
     )
+    config.addinivalue_line(
+        "markers", "budget(seconds): limit the total time all waits in the test may take"
+    )
 
 
 def pytest_collection_modifyitems(config, items):
@@ -5,9 +5,9 @@ from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
 from email import encoders
 import os
-import yaml
 import logging
 from datetime import datetime
+from core.config_cache import load_config
 
 
 class EmailReporter:
@@ -19,9 +19,7 @@ class EmailReporter:
     
     def _load_config(self):
         """Load email configuration from config.yaml"""
-        config_path = os.path.join(os.path.dirname(__file__), '..', 'config', 'config.yaml')
-        with open(config_path, 'r') as file:
-            return yaml.safe_load(file)
+        return load_config()
     
     def send_test_report(self, subject, body, attachments=None, recipients=None):
         """Send test report via email"""
@@ -1,19 +1,19 @@
 import pytest
 import os
-import yaml
 from datetime import datetime
 from core.driver_factory import get_driver
+from core import circuit_breaker, config_cache, config_snapshot, deadline, duration_history, impact_analysis, rerun, result_log, self_healing, sharding, stale_recovery, wait_telemetry
+from core.timeout_calibration import get_calibrator
 from utils.send_email_report import send_test_failure_report, send_test_summary_report
 
-# Global test results tracking
-test_results = []
+# Serialized config snapshot built by the controller and handed to xdist workers
+CONFIG_SNAPSHOT_KEY = pytest.StashKey[str]()
 
 def load_config():
     """Load configuration from config.yaml."""
     config_path = os.path.join(os.path.dirname(__file__), 'config', 'config.yaml')
     try:
-        with open(config_path, 'r') as f:
-            return yaml.safe_load(f)
+        return config_cache.load_config(config_path)
     except FileNotFoundError:
         return {}
 
@@ -22,16 +22,31 @@ def config():
     """Provide configuration data to tests."""
     return load_config()
 
+@pytest.fixture(scope="session")
+def browser_pool():
+    """Keep the browser of a failed attempt for the rerun of the test."""
+    pool = rerun.BrowserPool()
+    yield pool
+    pool.close()
+
 @pytest.fixture(scope="function")
-def driver(config):
-    """Provide WebDriver instance for tests."""
+def driver(config, request, browser_pool):
+    """Provide WebDriver instance for tests.
+    
+    A rerun of a failed test reuses the browser of its failed attempt.
+    """
     browser_config = config.get('ui', {}).get('browser', {})
     browser = browser_config.get('default', 'chrome')
     headless = browser_config.get('headless', False)
     
-    driver_instance = get_driver(browser=browser, headless=headless)
+    driver_instance = browser_pool.acquire() if rerun.attempt(request.node) > 1 else None
+    if driver_instance is None:
+        driver_instance = get_driver(browser=browser, headless=headless)
     yield driver_instance
-    driver_instance.quit()
+    if rerun.will_retry(request.node):
+        browser_pool.release(driver_instance)
+    else:
+        driver_instance.quit()
 
 @pytest.fixture(scope="function")
 def test_data(config):
@@ -43,37 +58,68 @@ def pytest_runtest_makereport(item, call):
     """Hook to capture test results for reporting."""
     outcome = yield
     report = outcome.get_result()
+    rerun.note_report(item, report)
+    circuit_breaker.breaker.record(report, call.excinfo)
+    # Setup, call and teardown all count towards the test's predicted duration;
+    # only the last attempt of a rerun test is kept
+    if report.when == 'setup':
+        duration_history.history.restart(item.nodeid)
+    duration_history.history.add(item.nodeid, report.duration)
     
-    if report.when == "call":
-        test_result = {
-            'name': item.name,
-            'passed': report.passed,
-            'failed': report.failed,
-            'skipped': report.skipped,
-            'duration': report.duration,
-            'timestamp': datetime.now().isoformat()
-        }
-        
-        if report.failed:
-            test_result['error'] = str(report.longrepr)
-            
-            # Send failure notification if enabled
-            config = load_config()
-            email_config = config.get('email', {})
-            if email_config.get('enabled', False) and email_config.get('send_on_failure', False):
-                send_test_failure_report(
-                    test_name=item.name,
-                    error_message=str(report.longrepr)
-                )
-        
-        test_results.append(test_result)
+    # Written to this process' result file; the controller merges every worker's
+    test_result = result_log.make_record(item, report, rerun.attempt(item))
+    if test_result is None:
+        return
+    result_log.results.append(test_result)
+    
+    if report.when == "call" and report.failed and not rerun.will_retry(item):
+        # Send failure notification if enabled
+        config = load_config()
+        email_config = config.get('email', {})
+        if email_config.get('enabled', False) and email_config.get('send_on_failure', False):
+            send_test_failure_report(
+                test_name=item.name,
+                error_message=test_result['error']
+            )
+
+def pytest_sessionstart(session):
+    """Drop telemetry, breaker trips and results flushed by a previous session (controller process only)."""
+    if not hasattr(session.config, 'workerinput'):
+        wait_telemetry.clear_flushed()
+        circuit_breaker.clear_flushed()
+        duration_history.clear_runs()
+        result_log.clear_results()
 
 def pytest_sessionfinish(session, exitstatus):
     """Hook called after test session finishes."""
+    # Flush wait durations for timeout calibration; the controller folds every worker's into the history
+    get_calibrator().flush()
+    if not hasattr(session.config, 'workerinput'):
+        get_calibrator().save()
+    # Flush this worker's wait histograms for the telemetry report
+    wait_telemetry.telemetry.flush()
+    # Flush this worker's circuit breaker trips; the controller merges them for the report
+    circuit_breaker.breaker.flush()
+    # Record test durations; the controller folds every worker's into the history
+    duration_history.history.flush()
+    if not hasattr(session.config, 'workerinput'):
+        duration_history.update_history()
+    # Persist fallbacks that healed a locator so later runs try them first
+    self_healing.resolutions.save()
+    
+    # Only the controller sees every worker's results; it reports once
+    if hasattr(session.config, 'workerinput'):
+        return
+    test_results = result_log.load_results()
+    results_path = session.config.getoption('results_jsonl')
+    if results_path:
+        shard = session.config.getoption('shard')
+        result_log.export(test_results, results_path, **({'shard': shard} if shard else {}))
     if test_results:
-        total_tests = len(test_results)
-        passed_tests = len([r for r in test_results if r['passed']])
-        failed_tests = len([r for r in test_results if r['failed']])
+        summary = result_log.summarize(test_results)
+        total_tests = summary['total']
+        passed_tests = summary['passed']
+        failed_tests = summary['failed'] + summary['error']
         
         # Send summary report if enabled
         config = load_config()
@@ -98,9 +144,6 @@ def setup_test_environment():
     os.makedirs(screenshots_dir, exist_ok=True)
     
     yield
-    
-    # Cleanup after all tests
-    print(f"\nTest execution completed. Total results: {len(test_results)}")
 
 @pytest.fixture
 def take_screenshot(driver, request):
@@ -128,19 +171,42 @@ def take_screenshot(driver, request):
 
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_setup(item):
-    """Hook to setup individual test runs."""
+    """Hook to setup individual test runs.
+    
+    Skips the test while the infrastructure circuit breaker is open.
+    """
+    circuit_breaker.breaker.before_test(item)
     yield
 
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_call(item):
-    """Hook called during test execution."""
-    outcome = yield
+    """Hook called during test execution.
+    
+    Runs the test inside its time budget so every wait is cut down to the
+    time the test has left.
+    """
+    test_budget = load_config().get('execution', {}).get('test_budget')
+    with deadline.budget(deadline.budget_for(item, test_budget)):
+        outcome = yield
     
     # Store the test result in the item for later use
     item.rep_call = outcome.get_result()
 
 def pytest_configure(config):
     """Configure pytest with custom markers and settings."""
+    # Resolve config.yaml once in the controller; workers install its snapshot
+    if hasattr(config, 'workerinput'):
+        config_snapshot.install(config.workerinput['config_snapshot'])
+    else:
+        try:
+            snapshot = config_snapshot.build_snapshot()
+        except config_snapshot.ConfigError as e:
+            raise pytest.UsageError(str(e))
+        config_snapshot.install(snapshot)
+        config.stash[CONFIG_SNAPSHOT_KEY] = config_snapshot.serialize(snapshot)
+    # Failed tests are rerun by pytest-rerunfailures as execution.retry_failed_tests asks
+    rerun.configure(config, load_config())
+    circuit_breaker.breaker.configure(load_config())
     config.addinivalue_line(
         "markers", "smoke: mark test as smoke test"
     )
@@ -155,4 +221,74 @@ def pytest_configure(config):
     )
     config.addinivalue_line(
         "markers", "api: mark test as API test"
-    )
\ No newline at end of file
+    )
+    config.addinivalue_line(
+        "markers", "budget(seconds): limit the total time all waits in the test may take"
+    )
+
+
+def pytest_addoption(parser):
+    """Register --impacted-by, --shard and --results-jsonl."""
+    impact_analysis.add_option(parser)
+    sharding.add_options(parser)
+    parser.addoption('--results-jsonl', metavar='PATH', default=None,
+                     help="write every test's result record to PATH (JSON Lines) at session end")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Only keep tests affected by the changes since --impacted-by and in this --shard."""
+    impact_analysis.deselect_unaffected(config, items)
+    sharding.deselect_other_shards(config, items)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Hand an xdist worker the controller's config snapshot."""
+    node.workerinput['config_snapshot'] = node.config.stash[CONFIG_SNAPSHOT_KEY]
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    """Run `--dist load` sessions longest predicted test first."""
+    if config.getoption('dist') != 'load':
+        return None
+    # xdist is only importable when it is the one asking
+    from core.duration_scheduler import DurationScheduling
+    return DurationScheduling(config, log)
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Report results, circuit breaker trips, stale element recovery, healed locators and wait telemetry."""
+    if not hasattr(config, 'workerinput'):
+        summary = result_log.summarize(result_log.load_results())
+        if summary['total']:
+            terminalreporter.section("test results (all workers)")
+            terminalreporter.write_line(
+                ", ".join(f"{summary[outcome]} {outcome}" for outcome in result_log.OUTCOMES)
+                + f" of {summary['total']} tests"
+                + (f", {summary['flaky']} flaky (passed on a rerun)" if summary['flaky'] else "")
+            )
+
+    lines = circuit_breaker.CircuitBreaker.load().summary()
+    if lines:
+        terminalreporter.section("infrastructure circuit breaker")
+        for line in lines:
+            terminalreporter.write_line(line)
+
+    summary = stale_recovery.stats.summary()
+    if summary['retries'] or summary['exhausted']:
+        terminalreporter.section("stale element recovery")
+        for line in stale_recovery.format_summary(summary):
+            terminalreporter.write_line(line)
+
+    lines = self_healing.resolutions.report(since=self_healing.resolutions.started)
+    if lines:
+        terminalreporter.section("self-healing locators")
+        for line in lines:
+            terminalreporter.write_line(line)
+
+    lines = wait_telemetry.WaitTelemetry.load().report()
+    if lines:
+        terminalreporter.section("wait telemetry")
+        for line in lines:
+            terminalreporter.write_line(line)
@@ -1,9 +1,10 @@
 """Base Page class with common UI automation methods"""
 
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import logging
+from core.element_cache import ElementCache
+from core.polling import BackoffWebDriverWait, default_poll_schedule
 
 logger = logging.getLogger(__name__)
 
@@ -11,46 +12,63 @@ logger = logging.getLogger(__name__)
 class BasePage:
     """Base class for all page objects"""
     
-    def __init__(self, driver, timeout=10):
+    def __init__(self, driver, timeout=10, poll_schedule=None):
         self.driver = driver
         self.timeout = timeout
-        self.wait = WebDriverWait(driver, timeout)
+        self.poll_schedule = poll_schedule or default_poll_schedule()
+        self.owner = type(self).__name__
+        self.wait = self.create_wait(timeout)
+        self.element_cache = ElementCache(driver, owner=self.owner)
+    
+    def create_wait(self, timeout, locator=None):
+        """Create an explicit wait polling on this page's schedule"""
+        return BackoffWebDriverWait(
+            self.driver, timeout, self.poll_schedule, locator=locator, owner=self.owner
+        )
     
     def find_element(self, locator):
         """Find element with explicit wait"""
         try:
-            element = self.wait.until(EC.presence_of_element_located(locator))
+            wait = self.create_wait(self.timeout, locator)
+            element = wait.until(EC.presence_of_element_located(locator))
+            self.element_cache.put(locator, element)
             return element
         except TimeoutException:
             logger.error(f"Element not found: {locator}")
             raise
     
     def click_element(self, locator):
-        """Click on element"""
+        """Click on element, reusing the cached handle when it is still attached"""
+        def locate():
+            wait = self.create_wait(self.timeout, locator)
+            return wait.until(EC.element_to_be_clickable(locator))
         try:
-            element = self.wait.until(EC.element_to_be_clickable(locator))
-            element.click()
+            self.element_cache.resolve(locator, locate, lambda element: element.click())
+            # The click may have navigated; the cache re-checks the URL on its next lookup
+            self.element_cache.mark_dirty()
             logger.info(f"Clicked element: {locator}")
         except Exception as e:
             logger.error(f"Failed to click element {locator}: {str(e)}")
             raise
     
     def enter_text(self, locator, text):
-        """Enter text into input field"""
-        try:
-            element = self.find_element(locator)
+        """Enter text into input field, reusing the cached handle when it is still attached"""
+        def type_text(element):
             element.clear()
             element.send_keys(text)
+        try:
+            self.element_cache.resolve(locator, lambda: self.find_element(locator), type_text)
             logger.info(f"Entered text into element: {locator}")
         except Exception as e:
             logger.error(f"Failed to enter text into {locator}: {str(e)}")
             raise
     
     def get_element_text(self, locator):
-        """Get text from element"""
+        """Get text from element, reusing the cached handle when it is still attached"""
         try:
-            element = self.find_element(locator)
-            text = element.text
+            text = self.element_cache.resolve(
+                locator, lambda: self.find_element(locator), lambda element: element.text
+            )
             logger.info(f"Retrieved text from element: {locator}")
             return text
         except Exception as e:
@@ -60,7 +78,8 @@ class BasePage:
     def is_element_visible(self, locator):
         """Check if element is visible"""
         try:
-            element = self.wait.until(EC.visibility_of_element_located(locator))
+            wait = self.create_wait(self.timeout, locator)
+            element = wait.until(EC.visibility_of_element_located(locator))
             return element.is_displayed()
         except TimeoutException:
             logger.warning(f"Element not visible: {locator}")
@@ -70,18 +89,28 @@ class BasePage:
         """Wait for element to be present"""
         wait_time = timeout if timeout else self.timeout
         try:
-            wait = WebDriverWait(self.driver, wait_time)
+            wait = self.create_wait(wait_time, locator)
             element = wait.until(EC.presence_of_element_located(locator))
             return element
         except TimeoutException:
             logger.error(f"Element not found within {wait_time} seconds: {locator}")
             raise
     
-    def navigate_to(self, url):
-        """Navigate to URL"""
+    def navigate_to(self, url, force=False):
+        """Navigate to URL, skipping the reload if already there (force=True always reloads)"""
+        if not force and self.is_current_page(url):
+            logger.info(f"Already on: {url}")
+            return
+        self.element_cache.clear()
         try:
             self.driver.get(url)
             logger.info(f"Navigated to: {url}")
         except Exception as e:
             logger.error(f"Failed to navigate to {url}: {str(e)}")
             raise
+    
+    def is_current_page(self, url):
+        """Check if the browser is on url and the document has finished loading"""
+        if self.driver.current_url.rstrip('/') != url.rstrip('/'):
+            return False
+        return self.driver.execute_script("return document.readyState") == "complete"
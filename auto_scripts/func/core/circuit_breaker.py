@@ -0,0 +1,250 @@
+"""Infrastructure circuit breaker
+
+Watches test outcomes for infrastructure-class errors: the application
+refusing connections, the browser or grid failing to create a session, page
+loads timing out. After `threshold` of them in a row the circuit opens and
+the following tests are skipped at setup instead of each failing after its
+full timeouts. Once `probe_interval` seconds have passed the circuit goes
+half-open and lets one test through as a probe: it closes again if that
+test gets past the infrastructure, and reopens if it hits the same wall.
+
+Configured by `execution.circuit_breaker` in config.yaml. Each pytest
+process (xdist worker or not) has its own breaker, flushed to its own file
+at session end and merged by the controller for the report.
+"""
+
+import glob
+import json
+import os
+import re
+import time
+
+import pytest
+from selenium.common.exceptions import (
+    InvalidSessionIdException,
+    SessionNotCreatedException,
+    TimeoutException,
+    WebDriverException,
+)
+from urllib3.exceptions import MaxRetryError, NewConnectionError, ProtocolError
+
+BASE_DIR = os.path.join(os.path.dirname(__file__), '..')
+BREAKER_DIR = os.path.join(BASE_DIR, '.cache', 'circuit_breaker')
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half-open'
+
+DEFAULT_THRESHOLD = 3
+DEFAULT_PROBE_INTERVAL = 60.0
+
+INFRASTRUCTURE_EXCEPTIONS = (
+    ConnectionError,
+    SessionNotCreatedException,
+    InvalidSessionIdException,
+    MaxRetryError,
+    NewConnectionError,
+    ProtocolError,
+)
+# WebDriver errors that mean the app or the browser is unreachable rather than the test being wrong
+INFRASTRUCTURE_MESSAGE = re.compile(
+    r'ERR_CONNECTION_(REFUSED|RESET|CLOSED|TIMED_OUT)|ERR_NAME_NOT_RESOLVED|ERR_ADDRESS_UNREACHABLE'
+    r'|ERR_INTERNET_DISCONNECTED|Timed out receiving message from renderer|session not created'
+    r'|chrome not reachable|browser has closed the connection|disconnected: not connected to DevTools',
+    re.IGNORECASE,
+)
+
+
+def is_infrastructure_error(exc):
+    """Check whether an exception, or one it was raised from, is infrastructure-class.
+
+    Element waits timing out are test failures; only page loads timing out
+    (a TimeoutException raised while loading a page) count.
+
+    Args:
+        exc (BaseException): Exception raised by a test or fixture
+
+    Returns:
+        bool: True for connection, session creation and page-load errors
+    """
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        seen.add(id(exc))
+        if isinstance(exc, INFRASTRUCTURE_EXCEPTIONS):
+            return True
+        if isinstance(exc, WebDriverException):
+            message = exc.msg or ''
+            if INFRASTRUCTURE_MESSAGE.search(message):
+                return True
+            if isinstance(exc, TimeoutException) and 'page load' in message.lower():
+                return True
+        exc = exc.__cause__ or exc.__context__
+    return False
+
+
+class CircuitBreaker:
+    """Session-level breaker over consecutive infrastructure errors."""
+
+    def __init__(self, threshold=DEFAULT_THRESHOLD, probe_interval=DEFAULT_PROBE_INTERVAL,
+                 enabled=True, clock=time.monotonic):
+        """Initialize a closed breaker.
+
+        Args:
+            threshold (int): Consecutive infrastructure errors that open the circuit
+            probe_interval (float): Seconds the circuit stays open before a probe
+            enabled (bool): False never opens the circuit
+            clock (callable): Monotonic time source
+        """
+        self.threshold = threshold
+        self.probe_interval = probe_interval
+        self.enabled = enabled
+        self.clock = clock
+        self.state = CLOSED
+        self.consecutive = 0
+        self.opened_at = None
+        self.last_error = None
+        self.trips = 0
+        self.probes = 0
+        self.skipped = []
+        # Worker id -> state, for breakers merged by load()
+        self.worker_states = {}
+
+    def configure(self, config):
+        """Apply `execution.circuit_breaker` settings.
+
+        Args:
+            config (Mapping): Parsed config.yaml
+        """
+        settings = config.get('execution', {}).get('circuit_breaker', {})
+        self.enabled = settings.get('enabled', True)
+        self.threshold = settings.get('threshold', DEFAULT_THRESHOLD)
+        self.probe_interval = settings.get('probe_interval', DEFAULT_PROBE_INTERVAL)
+
+    def _open(self):
+        self.state = OPEN
+        self.opened_at = self.clock()
+        self.trips += 1
+
+    def before_test(self, item):
+        """Skip a test while the circuit is open, or let it through as a probe.
+
+        Args:
+            item: pytest item about to be set up
+        """
+        if self.state != OPEN:
+            return
+        if self.clock() - self.opened_at >= self.probe_interval:
+            self.state = HALF_OPEN
+            self.probes += 1
+            return
+        self.skipped.append(item.nodeid)
+        pytest.skip(f"circuit breaker open after {self.consecutive} consecutive infrastructure "
+                    f"errors, last: {self.last_error}")
+
+    def record(self, report, excinfo):
+        """Count the outcome of a setup or call phase, from pytest_runtest_makereport.
+
+        Args:
+            report: TestReport of one phase
+            excinfo: ExceptionInfo of the phase, None if it raised nothing
+        """
+        if not self.enabled or report.when == 'teardown':
+            return
+        if report.skipped:
+            if self.state == HALF_OPEN:
+                # A probe skipped for its own reasons proved nothing; the next test probes
+                self.state = OPEN
+                self.probes -= 1
+            return
+        if report.passed and report.when == 'setup':
+            # Wait for the call to decide
+            return
+        if report.failed and excinfo is not None and is_infrastructure_error(excinfo.value):
+            self.consecutive += 1
+            self.last_error = f"{excinfo.typename}: {str(excinfo.value).strip().splitlines()[0][:200]}" \
+                if str(excinfo.value).strip() else excinfo.typename
+            if self.state == HALF_OPEN or (self.state == CLOSED and self.consecutive >= self.threshold):
+                self._open()
+            return
+        # The test got past the infrastructure, whatever its own outcome
+        self.state = CLOSED
+        self.consecutive = 0
+
+    def summary(self):
+        """Build the report lines.
+
+        Returns:
+            list: Lines describing trips, probes and skipped tests; empty if
+                the circuit never opened
+        """
+        if not self.trips:
+            return []
+        state = ", ".join(f"{state} on {worker}" for worker, state in sorted(self.worker_states.items())) \
+            if self.worker_states else self.state
+        lines = [f"Circuit opened {self.trips} time(s) after {self.threshold} consecutive "
+                 f"infrastructure errors, {self.probes} recovery probe(s), state now {state}",
+                 f"Last error: {self.last_error}",
+                 f"{len(self.skipped)} test(s) skipped while open"]
+        lines.extend(f"  {nodeid}" for nodeid in self.skipped[:10])
+        if len(self.skipped) > 10:
+            lines.append(f"  ... and {len(self.skipped) - 10} more")
+        return lines
+
+    def flush(self, directory=BREAKER_DIR, worker=None):
+        """Write this process' trips and skipped tests to breaker-<worker>.json.
+
+        Args:
+            directory (str): Breaker directory
+            worker (str): Worker id, the xdist worker or 'main' if None
+
+        Returns:
+            str: Written file, None if the circuit never opened
+        """
+        if not self.trips:
+            return None
+        worker = worker or os.environ.get('PYTEST_XDIST_WORKER', 'main')
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"breaker-{worker}.json")
+        record = {'worker': worker, 'state': self.state, 'threshold': self.threshold,
+                  'trips': self.trips, 'probes': self.probes, 'last_error': self.last_error,
+                  'skipped': self.skipped}
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(record, f)
+        os.replace(tmp_path, path)
+        return path
+
+    @classmethod
+    def load(cls, directory=BREAKER_DIR):
+        """Merge every flushed worker file in a directory.
+
+        Args:
+            directory (str): Breaker directory
+
+        Returns:
+            CircuitBreaker: Breaker whose summary covers every worker
+        """
+        merged = cls()
+        for path in sorted(glob.glob(os.path.join(directory, 'breaker-*.json'))):
+            with open(path) as f:
+                record = json.load(f)
+            merged.threshold = record['threshold']
+            merged.trips += record['trips']
+            merged.probes += record['probes']
+            merged.last_error = record['last_error']
+            merged.skipped.extend(record['skipped'])
+            merged.worker_states[record['worker']] = record['state']
+        return merged
+
+
+def clear_flushed(directory=BREAKER_DIR):
+    """Remove worker files left over from a previous session.
+
+    Args:
+        directory (str): Breaker directory
+    """
+    for path in glob.glob(os.path.join(directory, 'breaker-*.json')):
+        os.remove(path)
+
+
+breaker = CircuitBreaker()
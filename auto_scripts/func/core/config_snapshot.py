@@ -0,0 +1,303 @@
+"""Resolved configuration snapshot
+
+Merges config.yaml with an environment overlay, substitutes ${VAR} and
+${VAR:-default} placeholders from the process environment and validates the
+result against SCHEMA. The pytest controller does this once and hands the
+serialized snapshot to every xdist worker, which installs it instead of
+parsing and resolving the files itself, so all workers see the same config.
+The snapshot is fixed for the session: config.yaml is not re-read after
+pytest_configure. Placeholders left unresolved are reported with an
+UnresolvedPlaceholderWarning.
+
+    python -m core.config_snapshot [--env staging]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import warnings
+
+import yaml
+
+from core import config_cache
+
+# Overlay selection: TEST_ENV, else `environment.name` from config.yaml;
+# config/config.<name>.yaml is merged over the base file when it exists
+ENV_VAR = 'TEST_ENV'
+
+PLACEHOLDER = re.compile(r'\$\{([A-Za-z_][A-Za-z0-9_]*)(?::-([^}]*))?\}')
+
+NUMBER = (int, float)
+
+# Expected type of every known key; unknown keys are allowed
+SCHEMA = {
+    'ui': {
+        'browser': {
+            'default': str, 'headless': bool, 'implicit_wait': NUMBER,
+            'page_load_timeout': NUMBER, 'poll_schedule': dict, 'calibration': dict,
+            'chrome_options': list, 'firefox_options': list,
+        },
+        'base_url': str, 'registration_url': str, 'test_users': dict,
+    },
+    'api': {'base_url': str, 'timeout': NUMBER, 'retry_attempts': int, 'headers': dict},
+    'email': {
+        'enabled': bool, 'smtp_server': str, 'smtp_port': int, 'sender_email': str,
+        'sender_password': str, 'recipients': list, 'send_on_failure': bool, 'send_summary': bool,
+    },
+    'execution': {
+        'parallel': bool, 'max_workers': int, 'retry_failed_tests': bool, 'retry_count': int,
+        'retry_mode': str, 'test_budget': NUMBER, 'screenshot_on_failure': bool, 'video_recording': bool,
+        'circuit_breaker': {'enabled': bool, 'threshold': int, 'probe_interval': NUMBER},
+    },
+    'logging': {'level': str, 'format': str, 'file_logging': bool, 'log_file': str},
+    'environment': {'name': str, 'debug': bool},
+    'database': {'host': str, 'port': int, 'name': str, 'username': str, 'password': str},
+}
+REQUIRED = ('ui.base_url', 'ui.browser.default')
+# Spellings a placeholder may resolve to for keys SCHEMA expects a bool for
+BOOLEANS = {'true': True, 'yes': True, 'on': True, '1': True,
+            'false': False, 'no': False, 'off': False, '0': False}
+
+
+class ConfigError(ValueError):
+    """Raised when the resolved configuration does not match SCHEMA."""
+
+
+class UnresolvedPlaceholderWarning(UserWarning):
+    """Issued when ${VAR} placeholders are left in the resolved configuration."""
+
+
+def deep_merge(base, overlay):
+    """Merge an overlay into a base mapping.
+
+    Args:
+        base (dict): Base configuration
+        overlay (dict): Values that win; nested mappings are merged key by key
+
+    Returns:
+        dict: New merged mapping
+    """
+    merged = dict(base)
+    for key, value in overlay.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = deep_merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def convert(text, expected):
+    """Convert a substituted string to the type SCHEMA expects for its key.
+
+    Args:
+        text (str): Substituted value
+        expected: SCHEMA entry for the key, None for unknown keys
+
+    Returns:
+        The int, float or bool text spells for keys expecting one; text
+        itself otherwise, or when it does not spell one (validate reports it)
+    """
+    types = expected if isinstance(expected, tuple) else (expected,)
+    if bool in types:
+        flag = BOOLEANS.get(text.strip().lower())
+        if flag is not None:
+            return flag
+    if int in types:
+        try:
+            return int(text)
+        except ValueError:
+            pass
+    if float in types:
+        try:
+            return float(text)
+        except ValueError:
+            pass
+    return text
+
+
+def substitute(value, environ, unresolved, schema=SCHEMA):
+    """Replace ${VAR} and ${VAR:-default} placeholders in every string.
+
+    Substituted values stay strings, except that a string which is a single
+    placeholder is converted to the int, float or bool its key expects in
+    the schema, so `port: ${DB_PORT}` is an int while `sender_password:
+    ${SENDER_PASSWORD}` stays a string whatever it spells. Placeholders for
+    unset variables without a default are left as they are.
+
+    Args:
+        value: Parsed YAML value
+        environ (Mapping): Environment variables
+        unresolved (set): Receives the names of unset variables
+        schema: SCHEMA entry for value, None for unknown keys
+
+    Returns:
+        The value with placeholders substituted
+    """
+    if isinstance(value, dict):
+        schema = schema if isinstance(schema, dict) else {}
+        return {key: substitute(item, environ, unresolved, schema.get(key)) for key, item in value.items()}
+    if isinstance(value, list):
+        return [substitute(item, environ, unresolved, None) for item in value]
+    if not isinstance(value, str) or '${' not in value:
+        return value
+
+    def replace(match):
+        name, default = match.groups()
+        if name in environ:
+            return environ[name]
+        if default is not None:
+            return default
+        unresolved.add(name)
+        return match.group(0)
+
+    resolved = PLACEHOLDER.sub(replace, value)
+    if PLACEHOLDER.fullmatch(value) and resolved != value and not isinstance(schema, dict):
+        return convert(resolved, schema)
+    return resolved
+
+
+def validate(config, schema=SCHEMA, required=REQUIRED):
+    """Check a resolved configuration against the schema.
+
+    Args:
+        config (dict): Resolved configuration
+        schema (dict): Expected types by key, nested like the config
+        required (tuple): Dotted paths that must be present
+
+    Returns:
+        list: Problems found, empty when the config is valid
+    """
+    problems = []
+
+    def check(value, expected, path):
+        if isinstance(expected, dict):
+            if not isinstance(value, dict):
+                problems.append(f"{path}: expected a mapping, got {type(value).__name__}")
+                return
+            for key, item in value.items():
+                if key in expected:
+                    check(item, expected[key], f"{path}.{key}" if path else key)
+            return
+        types = expected if isinstance(expected, tuple) else (expected,)
+        # bool is an int subclass but never a valid number here
+        if value is None or (isinstance(value, bool) and bool not in types) \
+                or not isinstance(value, types):
+            names = ' or '.join(t.__name__ for t in types)
+            problems.append(f"{path}: expected {names}, got {value!r}")
+
+    check(config, schema, '')
+    for path in required:
+        node = config
+        for key in path.split('.'):
+            node = node.get(key) if isinstance(node, dict) else None
+        if node is None:
+            problems.append(f"{path}: required but missing")
+    return problems
+
+
+def build_snapshot(path=config_cache.CONFIG_PATH, environment=None, environ=None):
+    """Resolve and validate the configuration once.
+
+    Args:
+        path (str): Base config.yaml
+        environment (str): Overlay name; TEST_ENV or `environment.name` if None
+        environ (Mapping): Variables for placeholders, os.environ if None
+
+    Returns:
+        dict: {'path', 'environment', 'overlay', 'config', 'unresolved', 'digest'}
+
+    Raises:
+        ConfigError: If the resolved configuration fails validation
+
+    Warns:
+        UnresolvedPlaceholderWarning: If placeholders name unset variables
+            that have no default
+    """
+    environ = os.environ if environ is None else environ
+    path = os.path.abspath(path)
+    with open(path) as f:
+        config = yaml.safe_load(f) or {}
+    environment = environment or environ.get(ENV_VAR) or config.get('environment', {}).get('name')
+    overlay = None
+    if environment:
+        root, ext = os.path.splitext(path)
+        candidate = f"{root}.{environment}{ext}"
+        if os.path.exists(candidate):
+            overlay = candidate
+            with open(candidate) as f:
+                config = deep_merge(config, yaml.safe_load(f) or {})
+    unresolved = set()
+    config = substitute(config, environ, unresolved)
+    if unresolved:
+        warnings.warn(
+            f"Unset variables without a default left as placeholders in {path}: "
+            + ", ".join(sorted(unresolved)),
+            UnresolvedPlaceholderWarning,
+            stacklevel=2,
+        )
+    problems = validate(config)
+    if problems:
+        raise ConfigError(
+            f"Invalid configuration {path}"
+            + (f" + {overlay}" if overlay else "")
+            + ":\n  " + "\n  ".join(problems)
+        )
+    encoded = json.dumps(config, sort_keys=True, separators=(',', ':'))
+    return {
+        'path': path,
+        'environment': environment,
+        'overlay': overlay,
+        'config': config,
+        'unresolved': sorted(unresolved),
+        'digest': hashlib.sha256(encoded.encode()).hexdigest()[:16],
+    }
+
+
+def serialize(snapshot):
+    """Encode a snapshot compactly for xdist workerinput.
+
+    Args:
+        snapshot (dict): Result of build_snapshot
+
+    Returns:
+        str: Compact JSON
+    """
+    return json.dumps(snapshot, separators=(',', ':'))
+
+
+def install(snapshot):
+    """Make load_config return a snapshot's config for its file.
+
+    Args:
+        snapshot (dict or str): Result of build_snapshot, or serialize() of it
+
+    Returns:
+        dict: The installed snapshot
+    """
+    if isinstance(snapshot, str):
+        snapshot = json.loads(snapshot)
+    config_cache.pin(snapshot['path'], snapshot['config'])
+    return snapshot
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Resolve and validate config.yaml")
+    parser.add_argument('--env', help=f"overlay to merge (default: ${ENV_VAR} or environment.name)")
+    parser.add_argument('--path', default=config_cache.CONFIG_PATH, help="base config file")
+    args = parser.parse_args(argv)
+    try:
+        snapshot = build_snapshot(args.path, args.env)
+    except ConfigError as e:
+        print(e)
+        return 1
+    print(yaml.safe_dump(snapshot['config'], sort_keys=False), end='')
+    print(f"# environment={snapshot['environment']} overlay={snapshot['overlay']} "
+          f"digest={snapshot['digest']} unresolved={','.join(snapshot['unresolved']) or '-'}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
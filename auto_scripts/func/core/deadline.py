@@ -0,0 +1,85 @@
+"""Per-test Deadline Budgets
+
+Tracks a hierarchical time budget for the running test. Every explicit wait
+reads it and is cut down to the time left, so a test cannot stack dozens of
+full timeouts before failing.
+"""
+
+import time
+from contextlib import contextmanager
+
+from utils.exceptions import DeadlineExceededException
+
+# Stack of monotonic end times; nested budgets can only shrink the outer one
+_deadlines = []
+
+
+@contextmanager
+def budget(seconds):
+    """Limit every wait inside the block to `seconds` in total.
+    
+    Budgets nest: an inner budget never extends past the enclosing one.
+    
+    Args:
+        seconds (float): Budget in seconds; falsy values leave the current deadline untouched
+    """
+    if not seconds:
+        yield
+        return
+    end_time = time.monotonic() + float(seconds)
+    if _deadlines:
+        end_time = min(end_time, _deadlines[-1])
+    _deadlines.append(end_time)
+    try:
+        yield
+    finally:
+        _deadlines.pop()
+
+
+def remaining():
+    """Get time left in the current budget.
+    
+    Returns:
+        float: Seconds left, or None when no budget is active
+    """
+    if not _deadlines:
+        return None
+    return _deadlines[-1] - time.monotonic()
+
+
+def clamp(timeout):
+    """Cut a wait timeout down to the remaining budget.
+    
+    Args:
+        timeout (float): The wait's own timeout in seconds
+    
+    Returns:
+        tuple: (effective timeout, True if the budget was the limiting factor)
+    
+    Raises:
+        DeadlineExceededException: If the budget is already spent
+    """
+    left = remaining()
+    if left is None:
+        return timeout, False
+    if left <= 0:
+        raise DeadlineExceededException()
+    if left < timeout:
+        return left, True
+    return timeout, False
+
+
+def budget_for(item, default=None):
+    """Resolve the budget for a pytest item.
+    
+    Args:
+        item: Pytest item
+        default (float): Budget from configuration
+    
+    Returns:
+        float: `budget` marker argument if present, otherwise default
+    """
+    marker = item.get_closest_marker("budget")
+    if marker and marker.args:
+        return marker.args[0]
+    return default
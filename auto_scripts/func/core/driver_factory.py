@@ -3,8 +3,8 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.firefox.service import Service as FirefoxService
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
-import yaml
 import os
+from core.config_cache import load_config
 
 def get_driver(browser="chrome", headless=False):
     """Get WebDriver instance based on browser type and configuration.
@@ -20,8 +20,7 @@ def get_driver(browser="chrome", headless=False):
     # Load configuration
     config_path = os.path.join(os.path.dirname(__file__), '..', 'config', 'config.yaml')
     try:
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        config = load_config(config_path)
         browser_config = config.get('ui', {}).get('browser', {})
     except FileNotFoundError:
         browser_config = {}
@@ -57,8 +56,8 @@ def get_driver(browser="chrome", headless=False):
     else:
         raise ValueError(f"Unsupported browser: {browser}")
     
-    # Set implicit wait
-    driver.implicitly_wait(browser_config.get('implicit_wait', 10))
+    # Set implicit wait; keep it 0, every find_element of an explicit wait's poll would block on it
+    driver.implicitly_wait(browser_config.get('implicit_wait', 0))
     
     # Maximize window if not headless
     if not (headless or browser_config.get('headless', False)):
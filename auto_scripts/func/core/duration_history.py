@@ -0,0 +1,161 @@
+"""Test duration history
+
+Records how long every test takes (setup, call and teardown) and keeps a
+smoothed per-test estimate across runs, used to schedule the longest tests
+first under xdist. Each pytest process writes its own run file; the
+controller folds them into the history at session end.
+"""
+
+import glob
+import json
+import os
+import statistics
+
+BASE_DIR = os.path.join(os.path.dirname(__file__), '..')
+HISTORY_DIR = os.path.join(BASE_DIR, '.cache', 'durations')
+HISTORY_FILE = os.path.join(HISTORY_DIR, 'history.json')
+
+# Weight of the latest run in a test's estimate; the rest comes from earlier runs
+SMOOTHING = 0.5
+# Predicted seconds for a test when nothing has been recorded at all
+DEFAULT_DURATION = 1.0
+
+
+class DurationHistory:
+    """Per-test duration estimates plus the durations recorded by this process."""
+
+    def __init__(self, estimates=None):
+        """Initialize the history.
+
+        Args:
+            estimates (dict): Test node id -> estimated seconds
+        """
+        self.estimates = dict(estimates or {})
+        self.current = {}
+
+    def add(self, nodeid, seconds):
+        """Add the duration of one test phase.
+
+        Args:
+            nodeid (str): Test node id
+            seconds (float): Duration of the setup, call or teardown phase
+        """
+        self.current[nodeid] = self.current.get(nodeid, 0.0) + seconds
+
+    def restart(self, nodeid):
+        """Drop the durations added for a test, when a rerun starts a new attempt.
+
+        Args:
+            nodeid (str): Test node id
+        """
+        self.current.pop(nodeid, None)
+
+    def predict(self, nodeid):
+        """Predict how long a test will take.
+
+        Args:
+            nodeid (str): Test node id
+
+        Returns:
+            float: Estimated seconds; the median estimate for unknown tests
+        """
+        if nodeid in self.estimates:
+            return self.estimates[nodeid]
+        if self.estimates:
+            return statistics.median(self.estimates.values())
+        return DEFAULT_DURATION
+
+    def update(self, durations):
+        """Fold one run's durations into the estimates.
+
+        Args:
+            durations (dict): Test node id -> seconds measured in the run
+        """
+        for nodeid, seconds in durations.items():
+            previous = self.estimates.get(nodeid)
+            self.estimates[nodeid] = seconds if previous is None \
+                else SMOOTHING * seconds + (1 - SMOOTHING) * previous
+
+    def flush(self, directory=HISTORY_DIR, worker=None):
+        """Write the durations recorded by this process to run-<worker>.json.
+
+        Args:
+            directory (str): History directory
+            worker (str): Worker id, the xdist worker or 'main' if None
+
+        Returns:
+            str: Written file, None if nothing was recorded
+        """
+        if not self.current:
+            return None
+        worker = worker or os.environ.get('PYTEST_XDIST_WORKER', 'main')
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"run-{worker}.json")
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self.current, f)
+        os.replace(tmp_path, path)
+        return path
+
+    def save(self, path=HISTORY_FILE):
+        """Write the estimates.
+
+        Args:
+            path (str): History file
+        """
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self.estimates, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path=HISTORY_FILE):
+        """Load the estimates.
+
+        Args:
+            path (str): History file
+
+        Returns:
+            DurationHistory: History, empty if the file is missing or unreadable
+        """
+        try:
+            with open(path) as f:
+                return cls(json.load(f))
+        except (OSError, ValueError):
+            return cls()
+
+
+def clear_runs(directory=HISTORY_DIR):
+    """Remove run files left over from a previous session.
+
+    Args:
+        directory (str): History directory
+    """
+    for path in glob.glob(os.path.join(directory, 'run-*.json')):
+        os.remove(path)
+
+
+def update_history(directory=HISTORY_DIR, path=HISTORY_FILE):
+    """Fold every run file of the session into the history file (controller only).
+
+    Args:
+        directory (str): Directory holding the run files
+        path (str): History file
+
+    Returns:
+        DurationHistory: Updated history
+    """
+    durations = {}
+    for run in sorted(glob.glob(os.path.join(directory, 'run-*.json'))):
+        with open(run) as f:
+            durations.update(json.load(f))
+        os.remove(run)
+    history = DurationHistory.load(path)
+    if durations:
+        history.update(durations)
+        history.save(path)
+    return history
+
+
+history = DurationHistory()
@@ -0,0 +1,86 @@
+"""Duration-aware xdist scheduling
+
+Only imported when pytest-xdist asks for a scheduler, see
+pytest_xdist_make_scheduler in conftest.py.
+"""
+
+from xdist.scheduler import LoadScheduling
+
+from core.duration_history import DurationHistory
+
+# Tests assigned to a worker at a time: the running one plus one queued
+QUEUE_DEPTH = 2
+
+
+class DurationScheduling(LoadScheduling):
+    """Load scheduling that hands out the longest predicted tests first.
+
+    Pending tests are ordered by their predicted duration from the history,
+    longest first, and a worker is only topped up to QUEUE_DEPTH tests, so
+    the next longest test always goes to the worker that frees up first
+    (greedy longest-processing-time list scheduling). A slow UI test can no
+    longer start last on one worker while the others sit idle.
+    """
+
+    def __init__(self, config, log=None, history=None):
+        """Initialize the scheduler.
+
+        Args:
+            config: pytest config
+            log: xdist Producer for scheduler logging
+            history (DurationHistory): Estimates, loaded from disk if None
+        """
+        super().__init__(config, log)
+        self.history = history if history is not None else DurationHistory.load()
+
+    def schedule(self):
+        """Order the collection by predicted duration and start every worker."""
+        assert self.collection_is_completed
+
+        if self.collection is not None:
+            super().schedule()
+            return
+
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = list(self.node2collection.values())[0]
+        self.pending[:] = sorted(
+            range(len(self.collection)),
+            key=lambda index: self.history.predict(self.collection[index]),
+            reverse=True,
+        )
+        if not self.collection:
+            return
+        if self.maxschedchunk is None:
+            self.maxschedchunk = len(self.collection)
+
+        # Deal the longest tests out one at a time so each worker starts on one
+        for _ in range(QUEUE_DEPTH):
+            for node in self.nodes:
+                if self.pending:
+                    self._send_tests(node, 1)
+
+        if not self.pending:
+            for node in self.nodes:
+                node.shutdown()
+
+    def check_schedule(self, node, duration=0):
+        """Top a worker up to QUEUE_DEPTH tests from the front of the pending list.
+
+        Args:
+            node: Worker node that finished a test or joined
+            duration (float): Duration of its last test, unused
+        """
+        if node.shutting_down:
+            return
+
+        if self.pending:
+            missing = QUEUE_DEPTH - len(self.node2pending[node])
+            if missing > 0:
+                self._send_tests(node, missing)
+        else:
+            node.shutdown()
+
+        self.log("num items waiting for node:", len(self.pending))
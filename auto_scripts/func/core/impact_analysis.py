@@ -0,0 +1,47 @@
+"""Test impact analysis
+
+Selects only the test modules that import, directly or transitively, a file
+changed since a git ref; any change that cannot be traced through imports
+(config, Locators.json, files outside the repository) selects every test.
+
+One implementation serves every suite: the repository's
+core/impact_analysis.py, whose import graph spans the whole repository, so
+a change to a shared page or to another suite's module selects the func
+tests depending on it. This suite's own `core` package shadows the
+repository's, so the module is loaded from its file and re-exported here.
+
+    pytest --impacted-by origin/main
+    python -m core.impact_analysis [REF]
+"""
+
+import importlib.util
+import os
+import sys
+
+SHARED_MODULE = 'repository_impact_analysis'
+SHARED_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'core', 'impact_analysis.py'))
+
+
+def _load_shared():
+    module = sys.modules.get(SHARED_MODULE)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(SHARED_MODULE, SHARED_PATH)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[SHARED_MODULE] = module
+        spec.loader.exec_module(module)
+    return module
+
+
+_shared = _load_shared()
+BASE_DIR = _shared.BASE_DIR
+ImportGraph = _shared.ImportGraph
+add_option = _shared.add_option
+changed_files = _shared.changed_files
+deselect_unaffected = _shared.deselect_unaffected
+extract_imports = _shared.extract_imports
+is_test_module = _shared.is_test_module
+main = _shared.main
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,161 @@
+"""Failed test reruns
+
+Honors `execution.retry_failed_tests` / `retry_count` (or the older
+`retry_on_failure` / `max_retries`) from config.yaml by turning on
+pytest-rerunfailures with that many reruns, unless --reruns is given on the
+command line. A test whose setup, call or teardown fails is run again right
+away inside the same pytest session; failed attempts that get another try
+are reported with the plugin's `rerun` outcome and only the last attempt
+counts. The browser of a failed attempt is reset and handed to the next one
+through a session-scoped pool instead of being quit and started again.
+"""
+
+import logging
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+logger = logging.getLogger(__name__)
+
+# pytest-rerunfailures reruns a failed test before the next one starts
+MODES = ('immediate',)
+
+FAILED_KEY = pytest.StashKey[bool]()
+
+RESET_STORAGE_SCRIPT = "try { localStorage.clear(); sessionStorage.clear(); } catch (e) {}"
+
+
+def settings(config):
+    """Read the rerun settings.
+
+    Args:
+        config (Mapping): Parsed config.yaml
+
+    Returns:
+        int: Reruns of a failed test, 0 when reruns are disabled
+
+    Raises:
+        pytest.UsageError: If `execution.retry_mode` is not a supported mode
+    """
+    execution = config.get('execution', {})
+    if 'retry_failed_tests' in execution:
+        enabled, retries = execution['retry_failed_tests'], execution.get('retry_count', 1)
+    else:
+        enabled, retries = execution.get('retry_on_failure', False), execution.get('max_retries', 1)
+    mode = execution.get('retry_mode', 'immediate')
+    if mode not in MODES:
+        raise pytest.UsageError(f"execution.retry_mode must be one of {', '.join(MODES)}, got {mode!r}")
+    return max(int(retries), 0) if enabled else 0
+
+
+def configure(config, settings_source):
+    """Turn on pytest-rerunfailures for the configured reruns, from pytest_configure.
+
+    Args:
+        config: pytest config
+        settings_source (Mapping): Parsed config.yaml
+
+    Raises:
+        pytest.UsageError: If reruns are configured but pytest-rerunfailures
+            is not installed
+    """
+    retries = settings(settings_source)
+    if not retries or config.getoption('reruns', default=None) is not None:
+        # Disabled, or --reruns on the command line wins
+        return
+    if not config.pluginmanager.hasplugin('rerunfailures'):
+        raise pytest.UsageError("execution.retry_failed_tests needs pytest-rerunfailures; "
+                                "install requirements.txt")
+    config.option.reruns = retries
+
+
+class BrowserPool:
+    """Idle browsers kept between the attempts of a rerun test."""
+
+    def __init__(self, size=1):
+        """Initialize the pool.
+
+        Args:
+            size (int): Most idle browsers kept; extra ones are quit
+        """
+        self.size = size
+        self.idle = []
+
+    def acquire(self):
+        """Take an idle browser.
+
+        Returns:
+            WebDriver: Reset browser, None if the pool is empty
+        """
+        return self.idle.pop() if self.idle else None
+
+    def release(self, driver):
+        """Reset a browser and keep it, or quit it if it is unusable or the pool is full.
+
+        Args:
+            driver: WebDriver instance
+
+        Returns:
+            bool: True if the browser was kept
+        """
+        if len(self.idle) < self.size:
+            try:
+                driver.execute_script(RESET_STORAGE_SCRIPT)
+                driver.delete_all_cookies()
+                driver.get('about:blank')
+            except WebDriverException as e:
+                logger.warning(f"Browser not reusable for a rerun: {e.msg}")
+            else:
+                self.idle.append(driver)
+                return True
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+        return False
+
+    def close(self):
+        """Quit every idle browser."""
+        while self.idle:
+            try:
+                self.idle.pop().quit()
+            except WebDriverException:
+                pass
+
+
+def attempt(item):
+    """Get the attempt an item is on.
+
+    Args:
+        item: pytest item
+
+    Returns:
+        int: 1 for the first run, 2 for the first rerun, ...
+    """
+    return getattr(item, 'execution_count', 1)
+
+
+def note_report(item, report):
+    """Remember whether the current attempt failed, from pytest_runtest_makereport.
+
+    Args:
+        item: pytest item
+        report: TestReport of one phase
+    """
+    if report.when == 'setup':
+        item.stash[FAILED_KEY] = report.failed
+    elif report.failed:
+        item.stash[FAILED_KEY] = True
+
+
+def will_retry(item):
+    """Check whether the current attempt failed and the item gets another one.
+
+    Args:
+        item: pytest item
+
+    Returns:
+        bool: True if the item will be run again
+    """
+    retries = item.config.getoption('reruns', default=None) or 0
+    return item.stash.get(FAILED_KEY, False) and attempt(item) <= retries
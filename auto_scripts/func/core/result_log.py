@@ -0,0 +1,161 @@
+"""Cross-worker test result log
+
+Every pytest process appends one compact JSON line per finished test to its
+own file (results-<worker>.jsonl), as soon as the test finishes, so a worker
+that dies mid-run still leaves its completed results behind. The controller
+reads all of them at session end and builds the one summary of the session;
+under xdist no single worker sees more than its own slice.
+"""
+
+import glob
+import json
+import os
+from datetime import datetime
+
+BASE_DIR = os.path.join(os.path.dirname(__file__), '..')
+RESULTS_DIR = os.path.join(BASE_DIR, '.cache', 'results')
+
+OUTCOMES = ('passed', 'failed', 'error', 'skipped')
+
+
+def make_record(item, report, attempt=1):
+    """Build the result record for a report, if it decides the test's outcome.
+
+    The call phase decides a test's outcome; a setup that fails or skips
+    replaces it, and a failing teardown turns it into an error.
+
+    Args:
+        item: pytest item
+        report: TestReport of one phase
+        attempt (int): Attempt of a rerun test, 1 for its first run
+
+    Returns:
+        dict: {'nodeid', 'name', 'outcome', 'duration', 'timestamp'} plus
+            'error' for failures and 'attempt' for reruns, None for reports
+            that decide nothing
+    """
+    if report.when == 'call':
+        outcome = report.outcome
+    elif report.skipped:
+        outcome = 'skipped'
+    elif report.failed:
+        outcome = 'error'
+    else:
+        return None
+    record = {
+        'nodeid': item.nodeid,
+        'name': item.name,
+        'outcome': outcome,
+        'duration': round(report.duration, 3),
+        'timestamp': datetime.now().isoformat(),
+    }
+    if report.failed:
+        record['error'] = report.longreprtext
+    if attempt > 1:
+        record['attempt'] = attempt
+    return record
+
+
+class ResultLog:
+    """Append-only result records of one pytest process."""
+
+    def __init__(self, directory=RESULTS_DIR, worker=None):
+        """Initialize the log.
+
+        Args:
+            directory (str): Results directory
+            worker (str): Worker id, the xdist worker or 'main' if None
+        """
+        self.directory = directory
+        self.worker = worker
+
+    @property
+    def path(self):
+        worker = self.worker or os.environ.get('PYTEST_XDIST_WORKER', 'main')
+        return os.path.join(self.directory, f"results-{worker}.jsonl")
+
+    def append(self, record):
+        """Append one record and flush it to disk.
+
+        Args:
+            record (dict): Result of make_record
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self.path, 'a') as f:
+            f.write(json.dumps(record, separators=(',', ':')) + '\n')
+
+
+def load_results(directory=RESULTS_DIR):
+    """Merge every worker's records, the last one per test winning.
+
+    A record from a rerun keeps the outcome of the test's first attempt as
+    'first_outcome'. A truncated last line (a worker killed mid-write) is skipped.
+
+    Args:
+        directory (str): Results directory
+
+    Returns:
+        list: Records in the order their tests first finished
+    """
+    merged = {}
+    for path in sorted(glob.glob(os.path.join(directory, 'results-*.jsonl'))):
+        with open(path) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                previous = merged.get(record['nodeid'])
+                if previous is not None and record.get('attempt', 1) > 1:
+                    record['first_outcome'] = previous.get('first_outcome', previous['outcome'])
+                merged[record['nodeid']] = record
+    return list(merged.values())
+
+
+def export(records, path, **fields):
+    """Write records as JSON Lines, e.g. for utils.merge_reports.
+
+    Args:
+        records (list): Result records
+        path (str): Output file
+        **fields: Values added to every record, such as the shard
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w') as f:
+        for record in records:
+            f.write(json.dumps(dict(record, **fields), separators=(',', ':')) + '\n')
+
+
+def summarize(records):
+    """Count records by outcome.
+
+    Args:
+        records (list): Result records
+
+    Returns:
+        dict: 'total', a count for every outcome in OUTCOMES and 'flaky',
+            the tests that passed on a rerun
+    """
+    summary = dict.fromkeys(OUTCOMES, 0)
+    summary['flaky'] = 0
+    for record in records:
+        summary[record['outcome']] = summary.get(record['outcome'], 0) + 1
+        if record['outcome'] == 'passed' and record.get('first_outcome') in ('failed', 'error'):
+            summary['flaky'] += 1
+    summary['total'] = len(records)
+    return summary
+
+
+def clear_results(directory=RESULTS_DIR):
+    """Remove result files left over from a previous session.
+
+    Args:
+        directory (str): Results directory
+    """
+    for path in glob.glob(os.path.join(directory, 'results-*.jsonl')):
+        os.remove(path)
+
+
+results = ResultLog()
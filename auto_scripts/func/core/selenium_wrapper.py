@@ -1,23 +1,72 @@
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.support.ui import Select
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 import time
+from core.action_sequence import ActionSequence
+from core.polling import BackoffWebDriverWait, default_poll_schedule
+from core.stale_recovery import DEFAULT_STALE_RETRIES, run_with_recovery
+
+# Selects the option(s) of the <select> in arguments[0] whose text or value
+# (arguments[1]) equals arguments[2], firing input/change like a user would.
+# Returns true when selected, false when no option matches and null when the
+# element or option needs Select's own handling (not a <select>, disabled).
+SELECT_OPTION_SCRIPT = """
+var select = arguments[0], attribute = arguments[1], wanted = arguments[2];
+if (!select || select.tagName.toLowerCase() !== 'select') { return null; }
+var matched = [];
+for (var i = 0; i < select.options.length; i++) {
+    var option = select.options[i];
+    if ((attribute === 'text' ? option.text : option.value) !== wanted) { continue; }
+    if (option.disabled) { return null; }
+    matched.push(option);
+    if (!select.multiple) { break; }
+}
+if (!matched.length) { return false; }
+var changed = false;
+matched.forEach(function (option) {
+    if (!option.selected) { option.selected = true; changed = true; }
+});
+if (changed) {
+    select.dispatchEvent(new Event('input', {bubbles: true}));
+    select.dispatchEvent(new Event('change', {bubbles: true}));
+}
+return true;
+"""
 
 class SeleniumWrapper:
     """Wrapper class for common Selenium WebDriver operations."""
     
-    def __init__(self, driver, default_timeout=10):
+    def __init__(self, driver, default_timeout=10, poll_schedule=None, owner=None,
+                 stale_retries=DEFAULT_STALE_RETRIES):
         """Initialize wrapper with WebDriver instance.
         
         Args:
             driver: WebDriver instance
             default_timeout (int): Default timeout for wait operations
+            poll_schedule (PollSchedule): Wait poll schedule, config default if None
+            owner (str): Page class using this instance, used for timeout calibration
+            stale_retries (int): Times an action re-locates an element that went stale
         """
         self.driver = driver
         self.default_timeout = default_timeout
-        self.wait = WebDriverWait(driver, default_timeout)
+        self.poll_schedule = poll_schedule or default_poll_schedule()
+        self.owner = owner
+        self.stale_retries = stale_retries
+        self.wait = self.create_wait(default_timeout)
+    
+    def create_wait(self, timeout, locator=None):
+        """Create an explicit wait polling on this wrapper's schedule.
+        
+        Args:
+            timeout (float): Wait timeout in seconds
+            locator (tuple): Locator being waited on, used for timeout calibration
+        
+        Returns:
+            BackoffWebDriverWait: Configured wait
+        """
+        return BackoffWebDriverWait(
+            self.driver, timeout, self.poll_schedule, locator=locator, owner=self.owner
+        )
     
     def wait_for_element(self, locator, timeout=None):
         """Wait for element to be present in DOM.
@@ -30,7 +79,7 @@ class SeleniumWrapper:
             WebElement: Found element
         """
         timeout = timeout or self.default_timeout
-        wait = WebDriverWait(self.driver, timeout)
+        wait = self.create_wait(timeout, locator)
         return wait.until(EC.presence_of_element_located(locator))
     
     def wait_for_element_visible(self, locator, timeout=None):
@@ -44,7 +93,7 @@ class SeleniumWrapper:
             WebElement: Visible element
         """
         timeout = timeout or self.default_timeout
-        wait = WebDriverWait(self.driver, timeout)
+        wait = self.create_wait(timeout, locator)
         return wait.until(EC.visibility_of_element_located(locator))
     
     def wait_for_element_clickable(self, locator, timeout=None):
@@ -58,9 +107,22 @@ class SeleniumWrapper:
             WebElement: Clickable element
         """
         timeout = timeout or self.default_timeout
-        wait = WebDriverWait(self.driver, timeout)
+        wait = self.create_wait(timeout, locator)
         return wait.until(EC.element_to_be_clickable(locator))
     
+    def _with_fresh_element(self, locator, locate, action):
+        """Run action on the located element, re-locating it if it goes stale.
+        
+        Args:
+            locator (tuple): Element locator
+            locate (callable): Zero-arg callable returning a fresh element
+            action (callable): Callable receiving the element
+        
+        Returns:
+            Whatever action returns
+        """
+        return run_with_recovery(locate, action, locator, self.owner, self.stale_retries)
+    
     def click_element(self, locator, timeout=None):
         """Click element after waiting for it to be clickable.
         
@@ -68,8 +130,11 @@ class SeleniumWrapper:
             locator (tuple): Element locator
             timeout (int): Custom timeout
         """
-        element = self.wait_for_element_clickable(locator, timeout)
-        element.click()
+        self._with_fresh_element(
+            locator,
+            lambda: self.wait_for_element_clickable(locator, timeout),
+            lambda element: element.click(),
+        )
     
     def enter_text(self, locator, text, clear_first=True, timeout=None):
         """Enter text into element.
@@ -80,10 +145,13 @@ class SeleniumWrapper:
             clear_first (bool): Clear existing text before entering new text
             timeout (int): Custom timeout
         """
-        element = self.wait_for_element_visible(locator, timeout)
-        if clear_first:
-            element.clear()
-        element.send_keys(text)
+        def type_text(element):
+            if clear_first:
+                element.clear()
+            element.send_keys(text)
+        self._with_fresh_element(
+            locator, lambda: self.wait_for_element_visible(locator, timeout), type_text
+        )
     
     def get_element_text(self, locator, timeout=None):
         """Get text content of element.
@@ -95,8 +163,11 @@ class SeleniumWrapper:
         Returns:
             str: Element text content
         """
-        element = self.wait_for_element_visible(locator, timeout)
-        return element.text
+        return self._with_fresh_element(
+            locator,
+            lambda: self.wait_for_element_visible(locator, timeout),
+            lambda element: element.text,
+        )
     
     def is_element_visible(self, locator, timeout=5):
         """Check if element is visible within timeout.
@@ -109,7 +180,7 @@ class SeleniumWrapper:
             bool: True if element is visible, False otherwise
         """
         try:
-            wait = WebDriverWait(self.driver, timeout)
+            wait = self.create_wait(timeout, locator)
             wait.until(EC.visibility_of_element_located(locator))
             return True
         except TimeoutException:
@@ -126,46 +197,91 @@ class SeleniumWrapper:
             bool: True if element is present, False otherwise
         """
         try:
-            wait = WebDriverWait(self.driver, timeout)
+            wait = self.create_wait(timeout, locator)
             wait.until(EC.presence_of_element_located(locator))
             return True
         except TimeoutException:
             return False
     
-    def select_dropdown_by_text(self, locator, text, timeout=None):
+    def select_dropdown_by_text(self, locator, text, timeout=None, use_script=True):
         """Select dropdown option by visible text.
         
+        The option is found and selected inside the page in a single call;
+        Selenium's Select is used when the script cannot handle the element.
+        
         Args:
             locator (tuple): Dropdown element locator
             text (str): Visible text to select
             timeout (int): Custom timeout
+            use_script (bool): Set to False to always go through Select
+        
+        Raises:
+            NoSuchElementException: If no option has the given text
         """
         element = self.wait_for_element_visible(locator, timeout)
-        select = Select(element)
-        select.select_by_visible_text(text)
+        selected = self._select_option_by_script(element, 'text', text) if use_script else None
+        if selected is None:
+            Select(element).select_by_visible_text(text)
+        elif not selected:
+            raise NoSuchElementException(f"Could not locate element with visible text: {text}")
     
-    def select_dropdown_by_value(self, locator, value, timeout=None):
+    def select_dropdown_by_value(self, locator, value, timeout=None, use_script=True):
         """Select dropdown option by value.
         
         Args:
             locator (tuple): Dropdown element locator
             value (str): Value to select
             timeout (int): Custom timeout
+            use_script (bool): Set to False to always go through Select
+        
+        Raises:
+            NoSuchElementException: If no option has the given value
         """
         element = self.wait_for_element_visible(locator, timeout)
-        select = Select(element)
-        select.select_by_value(value)
+        selected = self._select_option_by_script(element, 'value', value) if use_script else None
+        if selected is None:
+            Select(element).select_by_value(value)
+        elif not selected:
+            raise NoSuchElementException(f"Cannot locate option with value: {value}")
+    
+    def _select_option_by_script(self, element, attribute, wanted):
+        """Select matching dropdown option(s) with one script round trip.
+        
+        Args:
+            element: Dropdown WebElement
+            attribute (str): 'text' or 'value'
+            wanted (str): Option text or value to select
+        
+        Returns:
+            bool: True if selected, False if no option matches,
+                None if Select has to handle it instead
+        """
+        try:
+            return self.driver.execute_script(SELECT_OPTION_SCRIPT, element, attribute, wanted)
+        except WebDriverException:
+            return None
+    
+    def actions(self, timeout=None):
+        """Start a batched sequence of pointer and keyboard actions.
+        
+        Args:
+            timeout (int): Custom timeout for locating the sequence's targets
+        
+        Returns:
+            ActionSequence: Empty sequence, sent as one request by perform()
+        """
+        return ActionSequence(
+            self.driver, lambda locator: self.wait_for_element_visible(locator, timeout)
+        )
     
     def hover_over_element(self, locator, timeout=None):
-        """Hover over element using ActionChains.
+        """Hover over element.
         
         Args:
             locator (tuple): Element locator
             timeout (int): Custom timeout
         """
-        element = self.wait_for_element_visible(locator, timeout)
-        actions = ActionChains(self.driver)
-        actions.move_to_element(element).perform()
+        self.actions(timeout).hover(locator).perform()
     
     def scroll_to_element(self, locator, timeout=None):
         """Scroll to element to bring it into view.
@@ -184,5 +300,5 @@ class SeleniumWrapper:
         Args:
             timeout (int): Timeout for page load
         """
-        wait = WebDriverWait(self.driver, timeout)
+        wait = self.create_wait(timeout)
         wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
\ No newline at end of file
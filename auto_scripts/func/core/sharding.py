@@ -0,0 +1,105 @@
+"""Deterministic test sharding across machines
+
+`pytest --shard i/N` keeps the i-th of N partitions of the collected tests
+and deselects the rest, so N CI machines running the same command with
+i = 1..N run every test exactly once. Tests are dealt longest predicted
+duration first to the least loaded shard, using the duration history; when
+the history knows none of the tests they are dealt round robin in the order
+of a stable hash of their node ids. Every shard must see the same collection
+and the same history file (--shard-history) to agree on the partition.
+"""
+
+import heapq
+import zlib
+
+import pytest
+
+from core.duration_history import HISTORY_FILE, DurationHistory
+
+
+def parse_shard(value):
+    """Parse an `i/N` shard specification.
+
+    Args:
+        value (str): 1-based shard index and shard count, e.g. '2/4'
+
+    Returns:
+        tuple: (index, total)
+
+    Raises:
+        ValueError: If value is not a valid `i/N`
+    """
+    try:
+        index, total = (int(part) for part in value.split('/'))
+    except ValueError:
+        raise ValueError(f"expected i/N, got {value!r}")
+    if not 1 <= index <= total:
+        raise ValueError(f"shard index must be between 1 and {total}, got {index}")
+    return index, total
+
+
+def partition(nodeids, total, history=None):
+    """Split test node ids into shards of similar predicted duration.
+
+    Args:
+        nodeids (iterable): Test node ids
+        total (int): Number of shards
+        history (DurationHistory): Duration estimates, loaded from disk if None
+
+    Returns:
+        list: One list of node ids per shard
+    """
+    history = history if history is not None else DurationHistory.load()
+    nodeids = sorted(set(nodeids))
+    shards = [[] for _ in range(total)]
+    if not any(nodeid in history.estimates for nodeid in nodeids):
+        # Dealt round robin in stable hash order: even counts, modules spread out
+        ordered = sorted(nodeids, key=lambda nodeid: (zlib.crc32(nodeid.encode()), nodeid))
+        for position, nodeid in enumerate(ordered):
+            shards[position % total].append(nodeid)
+        return shards
+    # Longest first onto the least loaded shard; ties go to the lowest index
+    loads = [(0.0, index) for index in range(total)]
+    for nodeid in sorted(nodeids, key=lambda nodeid: (-history.predict(nodeid), nodeid)):
+        load, index = heapq.heappop(loads)
+        shards[index].append(nodeid)
+        heapq.heappush(loads, (load + history.predict(nodeid), index))
+    return shards
+
+
+def add_options(parser):
+    """Register --shard and --shard-history.
+
+    Args:
+        parser: pytest argument parser
+    """
+    parser.addoption('--shard', metavar='i/N', default=None,
+                     help="only run the i-th of N deterministic partitions of the tests")
+    parser.addoption('--shard-history', metavar='PATH', default=HISTORY_FILE,
+                     help="duration history used to balance the shards; must be the same on every shard")
+
+
+def deselect_other_shards(config, items):
+    """Deselect the items that belong to other shards than --shard.
+
+    Args:
+        config: pytest config
+        items (list): Collected items, modified in place
+
+    Raises:
+        pytest.UsageError: If --shard is not a valid `i/N`
+    """
+    value = config.getoption('shard')
+    if not value:
+        return
+    try:
+        index, total = parse_shard(value)
+    except ValueError as e:
+        raise pytest.UsageError(f"--shard: {e}")
+    history = DurationHistory.load(config.getoption('shard_history'))
+    keep = set(partition((item.nodeid for item in items), total, history)[index - 1])
+    selected = [item for item in items if item.nodeid in keep]
+    deselected = [item for item in items if item.nodeid not in keep]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
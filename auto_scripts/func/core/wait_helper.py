@@ -1,22 +1,39 @@
 # core/wait_helper.py
 
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from core.polling import BackoffWebDriverWait, default_poll_schedule
 
 class WaitHelper:
     """Enhanced wait helper for common wait scenarios in registration flow"""
     
-    def __init__(self, driver, timeout=10):
+    def __init__(self, driver, timeout=10, poll_schedule=None, owner=None):
         """Initialize WaitHelper
         
         Args:
             driver: WebDriver instance
             timeout (int): Default timeout in seconds
+            poll_schedule (PollSchedule): Wait poll schedule, config default if None
+            owner (str): Page class using this helper, used for timeout calibration
         """
         self.driver = driver
         self.timeout = timeout
-        self.wait = WebDriverWait(driver, timeout)
+        self.poll_schedule = poll_schedule or default_poll_schedule()
+        self.owner = owner
+        self.wait = self.create_wait()
+    
+    def create_wait(self, locator=None):
+        """Create an explicit wait polling on this helper's schedule
+        
+        Args:
+            locator (tuple): Locator being waited on, used for timeout calibration
+        
+        Returns:
+            BackoffWebDriverWait: Configured wait
+        """
+        return BackoffWebDriverWait(
+            self.driver, self.timeout, self.poll_schedule, locator=locator, owner=self.owner
+        )
     
     def wait_for_element_visible(self, locator):
         """Wait for element to be visible
@@ -28,7 +45,7 @@ class WaitHelper:
             WebElement: The visible element
         """
         try:
-            return self.wait.until(EC.visibility_of_element_located(locator))
+            return self.create_wait(locator).until(EC.visibility_of_element_located(locator))
         except TimeoutException:
             raise TimeoutException(f"Element {locator} not visible after {self.timeout} seconds")
     
@@ -42,7 +59,7 @@ class WaitHelper:
             WebElement: The clickable element
         """
         try:
-            return self.wait.until(EC.element_to_be_clickable(locator))
+            return self.create_wait(locator).until(EC.element_to_be_clickable(locator))
         except TimeoutException:
             raise TimeoutException(f"Element {locator} not clickable after {self.timeout} seconds")
     
@@ -56,7 +73,7 @@ class WaitHelper:
             WebElement: The present element
         """
         try:
-            return self.wait.until(EC.presence_of_element_located(locator))
+            return self.create_wait(locator).until(EC.presence_of_element_located(locator))
         except TimeoutException:
             raise TimeoutException(f"Element {locator} not present after {self.timeout} seconds")
     
@@ -71,7 +88,7 @@ class WaitHelper:
             bool: True if text appears in element
         """
         try:
-            return self.wait.until(EC.text_to_be_present_in_element(locator, text))
+            return self.create_wait(locator).until(EC.text_to_be_present_in_element(locator, text))
         except TimeoutException:
             raise TimeoutException(f"Text '{text}' not found in element {locator} after {self.timeout} seconds")
     
@@ -1,42 +1,59 @@
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from core.element_cache import ElementCache
+from core.polling import BackoffWebDriverWait, default_poll_schedule
 
 class BasePage:
     """Base page class containing common functionality for all page objects."""
     
-    def __init__(self, driver):
+    def __init__(self, driver, poll_schedule=None):
         """Initialize base page with WebDriver instance."""
         self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
+        self.poll_schedule = poll_schedule or default_poll_schedule()
+        self.owner = type(self).__name__
+        self.wait = self.create_wait(10)
+        self.element_cache = ElementCache(driver, owner=self.owner)
+    
+    def create_wait(self, timeout, locator=None):
+        """Create an explicit wait polling on this page's schedule."""
+        return BackoffWebDriverWait(
+            self.driver, timeout, self.poll_schedule, locator=locator, owner=self.owner
+        )
     
     def find_element(self, locator):
         """Find element using the provided locator."""
         try:
-            return self.wait.until(EC.presence_of_element_located(locator))
+            wait = self.create_wait(10, locator)
+            return wait.until(EC.presence_of_element_located(locator))
         except TimeoutException:
             raise NoSuchElementException(f"Element not found: {locator}")
     
     def click_element(self, locator):
-        """Click element after waiting for it to be clickable."""
-        element = self.wait.until(EC.element_to_be_clickable(locator))
-        element.click()
+        """Click element after waiting for it to be clickable, reusing its cached handle."""
+        def locate():
+            wait = self.create_wait(10, locator)
+            return wait.until(EC.element_to_be_clickable(locator))
+        self.element_cache.resolve(locator, locate, lambda element: element.click())
+        # The click may have navigated; the cache re-checks the URL on its next lookup
+        self.element_cache.mark_dirty()
     
     def enter_text(self, locator, text):
-        """Enter text into element after clearing existing content."""
-        element = self.find_element(locator)
-        element.clear()
-        element.send_keys(text)
+        """Enter text into element after clearing existing content, reusing its cached handle."""
+        def type_text(element):
+            element.clear()
+            element.send_keys(text)
+        self.element_cache.resolve(locator, lambda: self.find_element(locator), type_text)
     
     def get_element_text(self, locator):
-        """Get text content of element."""
-        element = self.find_element(locator)
-        return element.text
+        """Get text content of element, reusing its cached handle."""
+        return self.element_cache.resolve(
+            locator, lambda: self.find_element(locator), lambda element: element.text
+        )
     
     def is_element_visible(self, locator, timeout=5):
         """Check if element is visible within timeout period."""
         try:
-            wait = WebDriverWait(self.driver, timeout)
+            wait = self.create_wait(timeout, locator)
             wait.until(EC.visibility_of_element_located(locator))
             return True
         except TimeoutException:
@@ -44,5 +61,5 @@ class BasePage:
     
     def wait_for_element(self, locator, timeout=10):
         """Wait for element to be present."""
-        wait = WebDriverWait(self.driver, timeout)
+        wait = self.create_wait(timeout, locator)
         return wait.until(EC.presence_of_element_located(locator))
\ No newline at end of file
@@ -1,8 +1,8 @@
 import pytest
-import yaml
 from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
 from pages.registration_page import RegistrationPage
+from core.config_cache import load_config
 from core.driver_factory import get_driver
 from core.selenium_wrapper import SeleniumWrapper
 from utils.send_email_report import send_report
@@ -13,8 +13,7 @@ class TestRegistration:
     @pytest.fixture(scope="function")
     def setup(self):
         """Setup test environment"""
-        with open('config/config.yaml') as f:
-            self.config = yaml.safe_load(f)
+        self.config = load_config('config/config.yaml')
         self.driver = get_driver(self.config['browser'])
         self.registration_page = RegistrationPage(self.driver)
         yield
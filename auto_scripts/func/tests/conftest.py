@@ -7,6 +7,7 @@ import pytest
 import logging
 import os
 from datetime import datetime
+from core.config_cache import load_config
 from core.driver_factory import get_driver, quit_driver
 from utils.logger import setup_logger, log_test_start, log_test_end
 
@@ -72,12 +73,10 @@ def test_config():
     Returns:
         dict: Test configuration
     """
-    import yaml
     config_path = os.path.join(os.path.dirname(__file__), '..', 'config', 'config.yaml')
     
     try:
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        config = load_config(config_path)
         logger.info("Test configuration loaded successfully")
         return config
     except FileNotFoundError:
@@ -0,0 +1,90 @@
+"""Large Dropdown Selection Tests
+
+Stress tests for SeleniumWrapper dropdown selection on a <select> with
+thousands of options, as found on category pickers.
+"""
+
+import time
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import Select
+from core.selenium_wrapper import SeleniumWrapper
+
+OPTION_COUNT = 5000
+DROPDOWN = (By.ID, "category")
+
+BUILD_DROPDOWN_SCRIPT = """
+var select = document.createElement('select');
+select.id = 'category';
+for (var i = 0; i < arguments[0]; i++) {
+    select.add(new Option('Category ' + i, 'cat-' + i));
+}
+window.changeEvents = 0;
+select.addEventListener('change', function () { window.changeEvents++; });
+document.body.appendChild(select);
+"""
+
+
+@pytest.fixture(scope="function")
+def large_dropdown(driver):
+    """Load a page holding a dropdown with OPTION_COUNT options.
+
+    Args:
+        driver: WebDriver instance
+
+    Returns:
+        SeleniumWrapper: Wrapper bound to the loaded page
+    """
+    driver.get("data:text/html;charset=utf-8,<html><body></body></html>")
+    driver.execute_script(BUILD_DROPDOWN_SCRIPT, OPTION_COUNT)
+    return SeleniumWrapper(driver)
+
+
+def selected_option(driver):
+    """Return (text, value) of the dropdown's selected option."""
+    option = Select(driver.find_element(*DROPDOWN)).first_selected_option
+    return option.text, option.get_attribute("value")
+
+
+@pytest.mark.ui
+@pytest.mark.regression
+class TestLargeDropdown:
+    """Test class for selection in very large dropdowns."""
+
+    def test_select_last_option_by_text(self, large_dropdown, driver):
+        """Verify the last of 5,000 options is selected by text and fires one change event."""
+        last = OPTION_COUNT - 1
+        started = time.monotonic()
+        large_dropdown.select_dropdown_by_text(DROPDOWN, f"Category {last}")
+        elapsed = time.monotonic() - started
+
+        assert selected_option(driver) == (f"Category {last}", f"cat-{last}")
+        assert driver.execute_script("return window.changeEvents") == 1
+        assert elapsed < 5, f"Selecting from {OPTION_COUNT} options took {elapsed:.2f}s"
+
+    def test_select_last_option_by_value(self, large_dropdown, driver):
+        """Verify the last of 5,000 options is selected by value and fires one change event."""
+        last = OPTION_COUNT - 1
+        large_dropdown.select_dropdown_by_value(DROPDOWN, f"cat-{last}")
+
+        assert selected_option(driver) == (f"Category {last}", f"cat-{last}")
+        assert driver.execute_script("return window.changeEvents") == 1
+
+    def test_reselecting_current_option_fires_no_change(self, large_dropdown, driver):
+        """Verify selecting the already selected option does not fire change again."""
+        large_dropdown.select_dropdown_by_value(DROPDOWN, "cat-2500")
+        large_dropdown.select_dropdown_by_value(DROPDOWN, "cat-2500")
+
+        assert driver.execute_script("return window.changeEvents") == 1
+
+    def test_missing_option_raises(self, large_dropdown):
+        """Verify a missing option raises NoSuchElementException like Select does."""
+        with pytest.raises(NoSuchElementException):
+            large_dropdown.select_dropdown_by_text(DROPDOWN, f"Category {OPTION_COUNT}")
+
+    def test_select_fallback_matches_script_path(self, large_dropdown, driver):
+        """Verify the Select fallback selects the same option as the script path."""
+        large_dropdown.select_dropdown_by_text(DROPDOWN, "Category 4321", use_script=False)
+
+        assert selected_option(driver) == ("Category 4321", "cat-4321")
@@ -0,0 +1,56 @@
+"""Unit test fixtures
+
+Runs the small pytest sessions some core unit tests need in a fresh
+interpreter, so the suite's own conftest and plugins stay out of them.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+SUITE_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+
+class SessionResult:
+    """Exit code, output and outcome counts of a pytest session run by run_pytest."""
+
+    def __init__(self, completed):
+        """Initialize from a finished process.
+
+        Args:
+            completed (subprocess.CompletedProcess): The pytest process
+        """
+        self.ret = completed.returncode
+        self.stdout = completed.stdout
+        self.lines = completed.stdout.splitlines()
+
+    def outcomes(self):
+        """Count the outcomes on the summary line.
+
+        Returns:
+            dict: Outcome -> count, e.g. {'passed': 2, 'rerun': 1}
+        """
+        return pytest.RunResult.parse_summary_nouns(self.lines)
+
+
+@pytest.fixture
+def run_pytest(tmp_path):
+    """Run a pytest session over files in tmp_path with the suite root importable.
+
+    Returns:
+        callable: run_pytest(files, *args) writing files ({name: source})
+            into tmp_path, then returning the SessionResult
+    """
+    def run(files, *args):
+        for name, source in files.items():
+            (tmp_path / name).write_text(source)
+        python_path = [SUITE_ROOT] + ([os.environ['PYTHONPATH']] if os.environ.get('PYTHONPATH') else [])
+        completed = subprocess.run(
+            [sys.executable, '-m', 'pytest', '-p', 'no:cacheprovider', '--rootdir', str(tmp_path), *args],
+            cwd=tmp_path, env=dict(os.environ, PYTHONPATH=os.pathsep.join(python_path)),
+            capture_output=True, text=True,
+        )
+        return SessionResult(completed)
+    return run
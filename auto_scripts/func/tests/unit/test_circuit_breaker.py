@@ -0,0 +1,234 @@
+"""Circuit Breaker Tests
+
+Drives core.circuit_breaker with fake phase reports and a controllable
+clock and checks when the circuit opens, probes and closes again, and which
+errors count as infrastructure errors.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from selenium.common.exceptions import SessionNotCreatedException, TimeoutException, WebDriverException
+from core import circuit_breaker
+from core.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+class FakeClock:
+    """Monotonic clock that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+def item(name='test_case'):
+    """Build a stand-in for a pytest item."""
+    return SimpleNamespace(nodeid=f"tests/ui/test_module.py::{name}")
+
+
+def report(outcome, when='call'):
+    """Build a stand-in for a TestReport of one phase."""
+    return SimpleNamespace(when=when, passed=outcome == 'passed', failed=outcome == 'failed',
+                           skipped=outcome == 'skipped')
+
+
+def excinfo(exc):
+    """Build the ExceptionInfo of a raised exception."""
+    try:
+        raise exc
+    except BaseException:
+        return pytest.ExceptionInfo.from_current()
+
+
+def refused():
+    """ExceptionInfo of the application refusing connections."""
+    return excinfo(WebDriverException("unknown error: net::ERR_CONNECTION_REFUSED"))
+
+
+@pytest.fixture
+def clock():
+    """Fake clock for the breaker."""
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(clock):
+    """Closed breaker opening after 3 errors and probing after 60 seconds."""
+    return CircuitBreaker(threshold=3, probe_interval=60.0, clock=clock)
+
+
+def fail(breaker, times=1, error=refused):
+    """Record failing call phases."""
+    for _ in range(times):
+        breaker.record(report('failed'), error())
+
+
+def assert_skipped(breaker, name='test_case'):
+    """Check the breaker skips a test at setup."""
+    with pytest.raises(pytest.skip.Exception, match='circuit breaker open'):
+        breaker.before_test(item(name))
+
+
+class TestInfrastructureErrors:
+    """Test class for telling infrastructure errors from test failures."""
+
+    @pytest.mark.parametrize('exc', [
+        ConnectionRefusedError(111, 'Connection refused'),
+        SessionNotCreatedException('session not created: Chrome failed to start'),
+        WebDriverException('unknown error: net::ERR_NAME_NOT_RESOLVED'),
+        TimeoutException('timeout: Timed out receiving message from renderer: 30.000'),
+        TimeoutException('Page load timed out after 30 seconds'),
+    ])
+    def test_infrastructure_errors(self, exc):
+        """Verify connection, session creation and page-load errors count."""
+        assert circuit_breaker.is_infrastructure_error(exc)
+
+    @pytest.mark.parametrize('exc', [
+        TimeoutException('Message: '),
+        TimeoutException('waiting for element #submit to be clickable'),
+        AssertionError('expected the dashboard'),
+        WebDriverException('element click intercepted'),
+    ])
+    def test_test_failures(self, exc):
+        """Verify element wait timeouts and assertion errors do not count."""
+        assert not circuit_breaker.is_infrastructure_error(exc)
+
+    def test_cause_chain(self):
+        """Verify an infrastructure error raised from a wrapped one counts."""
+        try:
+            try:
+                raise ConnectionResetError('reset by peer')
+            except ConnectionResetError as e:
+                raise RuntimeError('could not open the login page') from e
+        except RuntimeError as e:
+            assert circuit_breaker.is_infrastructure_error(e)
+
+
+class TestCircuitBreaker:
+    """Test class for opening, probing and closing the circuit."""
+
+    def test_opens_at_threshold(self, breaker):
+        """Verify the circuit stays closed below the threshold and opens at it."""
+        fail(breaker, times=2)
+        assert breaker.state == CLOSED
+        breaker.before_test(item())
+
+        fail(breaker)
+        assert breaker.state == OPEN
+        assert breaker.trips == 1
+        assert_skipped(breaker, 'test_skipped')
+        assert breaker.skipped == ['tests/ui/test_module.py::test_skipped']
+        assert 'ERR_CONNECTION_REFUSED' in breaker.last_error
+
+    def test_test_getting_through_resets_count(self, breaker):
+        """Verify errors must be consecutive: a test failing on its own merits resets the count."""
+        fail(breaker, times=2)
+        breaker.record(report('failed'), excinfo(AssertionError('wrong title')))
+        fail(breaker, times=2)
+        assert breaker.state == CLOSED
+
+    def test_element_timeout_not_counted(self, breaker):
+        """Verify element wait timeouts never open the circuit."""
+        fail(breaker, times=5, error=lambda: excinfo(TimeoutException('Message: ')))
+        assert breaker.state == CLOSED
+        assert breaker.consecutive == 0
+
+    def test_setup_error_counted_and_passed_setup_waits_for_call(self, breaker):
+        """Verify setup errors count and a passing setup decides nothing on its own."""
+        fail(breaker, times=2)
+        breaker.record(report('passed', when='setup'), None)
+        assert breaker.consecutive == 2
+        breaker.record(report('failed', when='setup'), refused())
+        assert breaker.state == OPEN
+
+    def test_half_open_after_probe_interval(self, breaker, clock):
+        """Verify tests are skipped until probe_interval has passed, then one probe runs."""
+        fail(breaker, times=3)
+        clock.advance(59.9)
+        assert_skipped(breaker)
+        clock.advance(0.1)
+        breaker.before_test(item('test_probe'))
+        assert breaker.state == HALF_OPEN
+        assert breaker.probes == 1
+
+    def test_failed_probe_reopens(self, breaker, clock):
+        """Verify a probe hitting the same error reopens the circuit for another interval."""
+        fail(breaker, times=3)
+        clock.advance(60)
+        breaker.before_test(item('test_probe'))
+        fail(breaker)
+        assert breaker.state == OPEN
+        assert breaker.trips == 2
+        clock.advance(30)
+        assert_skipped(breaker)
+
+    def test_passed_probe_closes(self, breaker, clock):
+        """Verify a probe getting past the infrastructure closes the circuit."""
+        fail(breaker, times=3)
+        clock.advance(60)
+        breaker.before_test(item('test_probe'))
+        breaker.record(report('passed'), None)
+        assert breaker.state == CLOSED
+        assert breaker.consecutive == 0
+        breaker.before_test(item())
+
+    def test_skipped_probe_hands_probe_on(self, breaker, clock):
+        """Verify a probe skipped for another reason reopens the circuit and the next test probes."""
+        fail(breaker, times=3)
+        clock.advance(60)
+        breaker.before_test(item('test_probe'))
+        breaker.record(report('skipped', when='setup'), None)
+        assert breaker.state == OPEN
+        assert breaker.probes == 0
+        breaker.before_test(item('test_next'))
+        assert breaker.state == HALF_OPEN
+        fail(breaker)
+        assert breaker.state == OPEN
+        assert_skipped(breaker)
+
+    def test_disabled_never_opens(self, breaker):
+        """Verify a disabled breaker ignores every error."""
+        breaker.configure({'execution': {'circuit_breaker': {'enabled': False}}})
+        fail(breaker, times=10)
+        assert breaker.state == CLOSED
+
+    def test_summary(self, breaker):
+        """Verify the summary is empty until the circuit opens, then lists the skipped tests."""
+        assert breaker.summary() == []
+        fail(breaker, times=3)
+        assert_skipped(breaker)
+        lines = breaker.summary()
+        assert lines[0].startswith('Circuit opened 1 time(s) after 3 consecutive')
+        assert lines[-1] == '  tests/ui/test_module.py::test_case'
+
+
+class TestWorkerSummaries:
+    """Test class for merging the breakers of several pytest processes."""
+
+    def test_nothing_flushed_without_trips(self, breaker, tmp_path):
+        """Verify a breaker that never opened writes no file."""
+        assert breaker.flush(str(tmp_path), worker='gw0') is None
+        assert CircuitBreaker.load(str(tmp_path)).summary() == []
+
+    def test_workers_merged(self, clock, tmp_path):
+        """Verify the controller's summary adds up every worker's trips and skipped tests."""
+        for worker, name in (('gw0', 'test_a'), ('gw1', 'test_b')):
+            breaker = CircuitBreaker(threshold=3, probe_interval=60.0, clock=clock)
+            fail(breaker, times=3)
+            assert_skipped(breaker, name)
+            breaker.flush(str(tmp_path), worker=worker)
+        CircuitBreaker(clock=clock).flush(str(tmp_path), worker='gw2')
+
+        lines = CircuitBreaker.load(str(tmp_path)).summary()
+        assert lines[0] == ("Circuit opened 2 time(s) after 3 consecutive infrastructure errors, "
+                            "0 recovery probe(s), state now open on gw0, open on gw1")
+        assert lines[2:] == ['2 test(s) skipped while open', '  tests/ui/test_module.py::test_a',
+                             '  tests/ui/test_module.py::test_b']
+
+        circuit_breaker.clear_flushed(str(tmp_path))
+        assert CircuitBreaker.load(str(tmp_path)).summary() == []
@@ -0,0 +1,71 @@
+"""Configuration Cache Tests
+
+Loads YAML files written to a temporary directory through core.config_cache
+and checks when they are parsed again, that the result is read-only, and
+that a pinned config is served instead of the file.
+"""
+
+import os
+
+import pytest
+from core import config_cache
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    """config.yaml in tmp_path, with the process-wide cache emptied around the test."""
+    path = tmp_path / 'config.yaml'
+    path.write_text("ui:\n  browser:\n    default: chrome\n    options: [--headless]\n")
+    config_cache.clear()
+    yield path
+    config_cache.clear()
+
+
+def rewrite(path, text):
+    """Replace the file content and move its mtime on, as a later edit would."""
+    stat = os.stat(path)
+    path.write_text(text)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestConfigCache:
+    """Test class for the per-process YAML config cache."""
+
+    def test_parsed_once(self, config_file):
+        """Verify the same mapping is returned while the file is unchanged."""
+        config = config_cache.load_config(str(config_file))
+        assert config['ui']['browser']['default'] == 'chrome'
+        assert config_cache.load_config(str(config_file)) is config
+
+    def test_reparsed_after_change(self, config_file):
+        """Verify an edited file is parsed again."""
+        config = config_cache.load_config(str(config_file))
+        rewrite(config_file, "ui:\n  browser:\n    default: firefox\n")
+        reloaded = config_cache.load_config(str(config_file))
+        assert reloaded is not config
+        assert reloaded['ui']['browser']['default'] == 'firefox'
+
+    def test_read_only(self, config_file):
+        """Verify nested mappings cannot be modified and lists become tuples."""
+        browser = config_cache.load_config(str(config_file))['ui']['browser']
+        with pytest.raises(TypeError):
+            browser['default'] = 'edge'
+        assert browser['options'] == ('--headless',)
+
+    def test_empty_and_missing_files(self, config_file, tmp_path):
+        """Verify an empty file is an empty mapping and a missing one an error."""
+        rewrite(config_file, "")
+        assert dict(config_cache.load_config(str(config_file))) == {}
+        with pytest.raises(FileNotFoundError):
+            config_cache.load_config(str(tmp_path / 'missing.yaml'))
+
+    def test_pinned_config_wins(self, config_file):
+        """Verify a pinned config is served, frozen, whatever the file says, until cleared."""
+        config_cache.pin(str(config_file), {'ui': {'browser': {'default': 'edge'}}})
+        rewrite(config_file, "ui:\n  browser:\n    default: firefox\n")
+        pinned = config_cache.load_config(str(config_file))
+        assert pinned['ui']['browser']['default'] == 'edge'
+        with pytest.raises(TypeError):
+            pinned['ui'] = {}
+        config_cache.clear()
+        assert config_cache.load_config(str(config_file))['ui']['browser']['default'] == 'firefox'
@@ -0,0 +1,150 @@
+"""Config Snapshot Tests
+
+Checks placeholder substitution, schema validation and building, serializing
+and installing the resolved configuration snapshot.
+"""
+
+import pytest
+from core import config_cache, config_snapshot
+
+BASE_CONFIG = """
+ui:
+  base_url: "${APP_URL:-https://example.com}"
+  browser:
+    default: chrome
+    headless: "${HEADLESS:-false}"
+environment:
+  name: "${ENV_NAME:-local}"
+database:
+  port: "${DB_PORT:-5432}"
+  password: "${DB_PASSWORD}"
+"""
+
+
+def substitute(value, environ):
+    """Substitute placeholders and return (result, unresolved names)."""
+    unresolved = set()
+    return config_snapshot.substitute(value, environ, unresolved), unresolved
+
+
+@pytest.fixture(autouse=True)
+def clean_cache():
+    """Drop configs pinned by a test."""
+    yield
+    config_cache.clear()
+
+
+class TestSubstitute:
+    """Test class for ${VAR} placeholder substitution."""
+
+    @pytest.mark.parametrize('secret', ['12345', '0123', 'yes', 'null', 'a: b', '[1, 2]', ''])
+    def test_strings_stay_strings(self, secret):
+        """Verify a value whose key expects a string is never reinterpreted as YAML."""
+        config, _ = substitute({'email': {'sender_password': '${SENDER_PASSWORD}'}}, {'SENDER_PASSWORD': secret})
+        assert config['email']['sender_password'] == secret
+        assert not [problem for problem in config_snapshot.validate(config) if problem.startswith('email.')]
+
+    def test_unknown_keys_stay_strings(self):
+        """Verify keys missing from the schema keep the substituted text."""
+        config, _ = substitute({'custom': {'retries': '${RETRIES}'}, 'flags': ['${FLAG}']},
+                               {'RETRIES': '3', 'FLAG': 'on'})
+        assert config == {'custom': {'retries': '3'}, 'flags': ['on']}
+
+    @pytest.mark.parametrize('key, text, expected', [
+        (('database', 'port'), '5432', 5432),
+        (('database', 'port'), '0123', 123),
+        (('execution', 'test_budget'), '2.5', 2.5),
+        (('execution', 'test_budget'), '30', 30),
+        (('email', 'enabled'), 'true', True),
+        (('email', 'enabled'), 'No', False),
+        (('email', 'enabled'), '0', False),
+    ])
+    def test_converted_where_schema_expects_number_or_bool(self, key, text, expected):
+        """Verify a whole placeholder takes the int, float or bool type its key expects."""
+        section, name = key
+        config, _ = substitute({section: {name: '${VALUE}'}}, {'VALUE': text})
+        assert config[section][name] == expected
+        assert type(config[section][name]) is type(expected)
+
+    def test_unconvertible_value_left_for_validation(self):
+        """Verify text that does not spell the expected type is kept and reported by validate."""
+        config, _ = substitute({'database': {'port': '${DB_PORT}'}}, {'DB_PORT': 'five'})
+        assert config['database']['port'] == 'five'
+        assert config_snapshot.validate(config) == ["database.port: expected int, got 'five'",
+                                                    'ui.base_url: required but missing',
+                                                    'ui.browser.default: required but missing']
+
+    def test_embedded_placeholder_is_never_converted(self):
+        """Verify a placeholder inside longer text yields a string."""
+        config, _ = substitute({'database': {'port': '${DB_PORT}0'}}, {'DB_PORT': '543'})
+        assert config['database']['port'] == '5430'
+
+    def test_defaults_and_unresolved(self):
+        """Verify defaults apply to unset variables and placeholders without one are kept and listed."""
+        config, unresolved = substitute({'ui': {'base_url': '${APP_URL:-http://localhost}/${PATH_PART}'}}, {})
+        assert config['ui']['base_url'] == 'http://localhost/${PATH_PART}'
+        assert unresolved == {'PATH_PART'}
+
+
+class TestValidate:
+    """Test class for schema validation."""
+
+    def test_bool_is_not_a_number(self):
+        """Verify a bool is rejected where a number is expected."""
+        problems = config_snapshot.validate({'ui': {'base_url': 'x', 'browser': {'default': 'chrome',
+                                                                                 'implicit_wait': True}}})
+        assert problems == ['ui.browser.implicit_wait: expected int or float, got True']
+
+    def test_mapping_expected(self):
+        """Verify a scalar where a section is expected is reported."""
+        problems = config_snapshot.validate({'ui': 'chrome'})
+        assert problems[0] == 'ui: expected a mapping, got str'
+
+
+class TestBuildSnapshot:
+    """Test class for resolving, serializing and installing the snapshot."""
+
+    def test_overlay_and_environment(self, tmp_path):
+        """Verify the named overlay is merged over the base file and placeholders are resolved."""
+        base = tmp_path / 'config.yaml'
+        base.write_text(BASE_CONFIG)
+        (tmp_path / 'config.staging.yaml').write_text("ui:\n  base_url: https://staging.example.com\n")
+        snapshot = config_snapshot.build_snapshot(str(base), 'staging', {'DB_PASSWORD': '0123', 'HEADLESS': 'true'})
+        assert snapshot['overlay'] == str(tmp_path / 'config.staging.yaml')
+        assert snapshot['config']['ui']['base_url'] == 'https://staging.example.com'
+        assert snapshot['config']['ui']['browser']['headless'] is True
+        assert snapshot['config']['database'] == {'port': 5432, 'password': '0123'}
+        assert snapshot['unresolved'] == []
+
+    def test_unresolved_placeholders_warn(self, tmp_path):
+        """Verify placeholders of unset variables without a default are warned about."""
+        base = tmp_path / 'config.yaml'
+        base.write_text(BASE_CONFIG)
+        with pytest.warns(config_snapshot.UnresolvedPlaceholderWarning, match='DB_PASSWORD'):
+            snapshot = config_snapshot.build_snapshot(str(base), environ={})
+        assert snapshot['unresolved'] == ['DB_PASSWORD']
+        assert snapshot['config']['database']['password'] == '${DB_PASSWORD}'
+
+    def test_invalid_configuration(self, tmp_path):
+        """Verify a configuration failing validation raises ConfigError naming the problem."""
+        base = tmp_path / 'config.yaml'
+        base.write_text(BASE_CONFIG)
+        with pytest.raises(config_snapshot.ConfigError, match='database.port: expected int'):
+            config_snapshot.build_snapshot(str(base), environ={'DB_PORT': 'five', 'DB_PASSWORD': 'x'})
+
+    def test_digest_is_stable(self, tmp_path):
+        """Verify the same resolved configuration gets the same digest."""
+        base = tmp_path / 'config.yaml'
+        base.write_text(BASE_CONFIG)
+        environ = {'DB_PASSWORD': 'secret'}
+        assert config_snapshot.build_snapshot(str(base), environ=environ)['digest'] == \
+            config_snapshot.build_snapshot(str(base), environ=dict(environ))['digest']
+
+    def test_install_pins_serialized_snapshot(self, tmp_path):
+        """Verify an installed snapshot is what load_config returns, even after the file changes."""
+        base = tmp_path / 'config.yaml'
+        base.write_text(BASE_CONFIG)
+        snapshot = config_snapshot.build_snapshot(str(base), environ={'DB_PORT': '6543', 'DB_PASSWORD': 'x'})
+        config_snapshot.install(config_snapshot.serialize(snapshot))
+        base.write_text("ui: {}\n")
+        assert config_cache.load_config(str(base))['database']['port'] == 6543
@@ -0,0 +1,122 @@
+"""Test Impact Analysis Tests
+
+Builds the import graph of a small suite written to a temporary directory
+and checks which test modules changed files select.
+"""
+
+import subprocess
+
+import pytest
+from core import impact_analysis
+
+SUITE = {
+    'core/helper.py': "VALUE = 1\n",
+    'core/base_test.py': "from core.helper import VALUE\n",
+    'utils/test_helpers.py': "from core import helper\n",
+    'pages/login_page.py': "from core.helper import VALUE\n\nclass LoginPage:\n    pass\n",
+    'pages/cart_page.py': "def open_cart():\n    from . import login_page\n",
+    'tests/conftest.py': "import pytest\n",
+    'tests/ui/test_login.py': "from pages.login_page import LoginPage\n",
+    'tests/ui/test_cart.py': "from pages.cart_page import open_cart\n",
+    'tests/ui/test_plain.py': "import json\n",
+    'README.md': "# suite\n",
+    'config/config.yaml': "ui: {}\n",
+}
+
+
+@pytest.fixture
+def graph(tmp_path):
+    """Import graph of SUITE, its hash cache kept outside the scanned tree."""
+    base = tmp_path / 'suite'
+    for name, source in SUITE.items():
+        path = base / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(source)
+    return impact_analysis.ImportGraph(str(base), roots=('',), cache_file=str(tmp_path / 'imports.json')).build()
+
+
+class TestIsTestModule:
+    """Test class for telling test modules from support modules."""
+
+    @pytest.mark.parametrize('path', ['test_registration.py', 'tests/ui/test_login.py',
+                                      'auto_scripts/api/tests/api/login_test.py'])
+    def test_test_modules(self, path):
+        """Verify files matching python_files outside support packages are test modules."""
+        assert impact_analysis.is_test_module(path)
+
+    @pytest.mark.parametrize('path', ['utils/test_helpers.py', 'core/base_test.py', 'pages/test_page.py',
+                                      'auto_scripts/func/utils/test_helpers.py', 'tests/conftest.py'])
+    def test_support_modules(self, path):
+        """Verify helpers named like tests inside core/, utils/ or pages/ are not test modules."""
+        assert not impact_analysis.is_test_module(path)
+
+    def test_suite_patterns(self):
+        """Verify the suite's python_files patterns are used when given."""
+        assert not impact_analysis.is_test_module('tests/login_test.py', ('test_*.py',))
+        assert impact_analysis.is_test_module('tests/check_login.py', ('check_*.py',))
+
+
+class TestImportGraph:
+    """Test class for mapping changed files to the tests depending on them."""
+
+    def test_imports_inside_functions_and_relative(self):
+        """Verify every import statement is extracted, with its level."""
+        imports = impact_analysis.extract_imports("import os\ndef f():\n    from . import sibling\n")
+        assert imports == [('os', [], 0), ('', ['sibling'], 1)]
+
+    def test_transitive_dependents(self, graph):
+        """Verify a core change selects the tests reaching it through pages, and only those."""
+        assert graph.impacted_tests({'core/helper.py'}) == {'tests/ui/test_login.py', 'tests/ui/test_cart.py'}
+
+    def test_helpers_named_like_tests_are_not_selected(self, graph):
+        """Verify utils/test_helpers.py and core/base_test.py are never reported as tests."""
+        assert graph.impacted_tests({'utils/test_helpers.py', 'core/base_test.py'}) == set()
+
+    def test_conftest_change_selects_its_tests(self, graph):
+        """Verify a conftest change selects every test module under it."""
+        assert graph.impacted_tests({'tests/conftest.py'}) == \
+            {'tests/ui/test_login.py', 'tests/ui/test_cart.py', 'tests/ui/test_plain.py'}
+
+    def test_docs_select_nothing(self, graph):
+        """Verify documentation changes select no test."""
+        assert graph.impacted_tests({'README.md'}) == set()
+
+    @pytest.mark.parametrize('changed', ['config/config.yaml', 'core/removed.py', '../shared/pages/page.py'])
+    def test_untraceable_changes_select_everything(self, graph, changed):
+        """Verify config, removed and out-of-tree files select every test."""
+        assert graph.impacted_tests({changed}) is None
+
+    def test_cache_follows_file_changes(self, graph, tmp_path):
+        """Verify a rebuilt graph re-parses a file whose content changed."""
+        (tmp_path / 'suite' / 'tests' / 'ui' / 'test_plain.py').write_text("from core.helper import VALUE\n")
+        rebuilt = impact_analysis.ImportGraph(str(tmp_path / 'suite'), roots=('',),
+                                              cache_file=str(tmp_path / 'imports.json')).build()
+        assert 'tests/ui/test_plain.py' in rebuilt.impacted_tests({'core/helper.py'})
+
+
+class TestChangedFiles:
+    """Test class for listing the files changed since a git ref."""
+
+    def git(self, directory, *args):
+        """Run git quietly in directory."""
+        subprocess.run(['git', '-c', 'user.name=test', '-c', 'user.email=test@example.com', *args],
+                       cwd=directory, check=True, capture_output=True)
+
+    def test_outside_base_dir_kept(self, tmp_path):
+        """Verify committed, untracked and out-of-base changes are all listed."""
+        (tmp_path / 'suite').mkdir()
+        (tmp_path / 'suite' / 'page.py').write_text("A = 1\n")
+        (tmp_path / 'shared.py').write_text("B = 1\n")
+        self.git(tmp_path, 'init', '-q')
+        self.git(tmp_path, 'add', '.')
+        self.git(tmp_path, 'commit', '-qm', 'base')
+        (tmp_path / 'suite' / 'page.py').write_text("A = 2\n")
+        (tmp_path / 'shared.py').write_text("B = 2\n")
+        (tmp_path / 'suite' / 'new.py').write_text("C = 1\n")
+        assert impact_analysis.changed_files('HEAD', str(tmp_path / 'suite')) == {'page.py', 'new.py', '../shared.py'}
+
+    def test_unknown_ref(self, tmp_path):
+        """Verify a ref git cannot diff against is a ValueError."""
+        self.git(tmp_path, 'init', '-q')
+        with pytest.raises(ValueError):
+            impact_analysis.changed_files('no-such-ref', str(tmp_path))
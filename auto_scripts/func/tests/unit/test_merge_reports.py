@@ -0,0 +1,128 @@
+"""Shard Report Merging Tests
+
+Merges small JUnit XML reports and JSON Lines result records the way the
+shards of a `--shard i/N` run write them and checks the totals, duplicate
+tests and missing shards reported.
+"""
+
+import json
+import xml.etree.ElementTree as ET
+
+from utils import merge_reports
+
+SHARD_1_JUNIT = """<?xml version="1.0" encoding="utf-8"?>
+<testsuites>
+  <testsuite name="pytest" tests="3" failures="1" errors="0" skipped="1" time="3.5">
+    <testcase classname="tests.ui.test_login" name="test_valid" time="1.0"/>
+    <testcase classname="tests.ui.test_login" name="test_invalid" time="2.0">
+      <failure message="assert False">AssertionError</failure>
+    </testcase>
+    <testcase classname="tests.ui.test_login" name="test_later" time="0.5">
+      <skipped message="not ready"/>
+    </testcase>
+  </testsuite>
+</testsuites>
+"""
+
+SHARD_2_JUNIT = """<?xml version="1.0" encoding="utf-8"?>
+<testsuite name="pytest" tests="2" failures="0" errors="1" skipped="0" time="1.25">
+  <testcase classname="tests.ui.test_signup" name="test_signup" time="1.0">
+    <error message="setup failed">RuntimeError</error>
+  </testcase>
+  <testcase classname="tests.ui.test_signup" name="test_terms" time="0.25"/>
+</testsuite>
+"""
+
+
+def write(path, text):
+    """Write text to path and return the path as a string."""
+    path.write_text(text, encoding='utf-8')
+    return str(path)
+
+
+def write_records(path, records, extra_lines=()):
+    """Write result records as JSON Lines, then any raw extra lines."""
+    lines = [json.dumps(record) for record in records] + list(extra_lines)
+    return write(path, "\n".join(lines) + "\n")
+
+
+def record(nodeid, outcome='passed', shard=None):
+    """Build a result record as core.result_log writes it."""
+    record = {'nodeid': nodeid, 'name': nodeid, 'outcome': outcome, 'duration': 0.1}
+    if shard:
+        record['shard'] = shard
+    return record
+
+
+class TestMergeJunit:
+    """Test class for merging JUnit XML reports."""
+
+    def test_totals_counted_from_test_cases(self, tmp_path):
+        """Verify the merged root carries totals counted over every shard's test cases."""
+        out = tmp_path / 'junit.xml'
+        totals = merge_reports.merge_junit(
+            [write(tmp_path / 'shard-1.xml', SHARD_1_JUNIT), write(tmp_path / 'shard-2.xml', SHARD_2_JUNIT)],
+            str(out))
+        assert totals == {'tests': 5, 'failures': 1, 'errors': 1, 'skipped': 1, 'time': 4.75, 'duplicates': []}
+
+        root = ET.parse(out).getroot()
+        assert root.tag == 'testsuites'
+        assert {name: root.get(name) for name in ('tests', 'failures', 'errors', 'skipped', 'time')} == \
+            {'tests': '5', 'failures': '1', 'errors': '1', 'skipped': '1', 'time': '4.750'}
+        suites = root.findall('testsuite')
+        assert [len(suite.findall('testcase')) for suite in suites] == [3, 2]
+        assert suites[0].get('tests') == '3'
+        assert suites[0].find("testcase[@name='test_invalid']/failure").get('message') == 'assert False'
+
+    def test_duplicate_test_cases(self, tmp_path):
+        """Verify a test case reported by two shards is listed as a duplicate and counted twice."""
+        first = write(tmp_path / 'shard-1.xml', SHARD_1_JUNIT)
+        second = write(tmp_path / 'shard-2.xml', SHARD_1_JUNIT)
+        totals = merge_reports.merge_junit([first, second], str(tmp_path / 'junit.xml'))
+        assert totals['tests'] == 6
+        assert totals['duplicates'] == [('tests.ui.test_login', 'test_valid'),
+                                        ('tests.ui.test_login', 'test_invalid'),
+                                        ('tests.ui.test_login', 'test_later')]
+
+
+class TestMergeResults:
+    """Test class for merging JSON Lines result records."""
+
+    def test_counts_and_merged_records(self, tmp_path):
+        """Verify outcomes are counted, unreadable lines dropped and records copied in order."""
+        first = write_records(tmp_path / 'shard-1.jsonl', [record('a', shard='1/2'), record('b', 'failed', '1/2')],
+                              extra_lines=['{not json'])
+        second = write_records(tmp_path / 'shard-2.jsonl', [record('c', 'skipped', '2/2')])
+        out = tmp_path / 'results.jsonl'
+        summary = merge_reports.merge_results([first, second], str(out))
+        assert summary == {'passed': 1, 'failed': 1, 'error': 0, 'skipped': 1, 'total': 3,
+                           'duplicates': [], 'missing_shards': []}
+        merged = [json.loads(line) for line in out.read_text(encoding='utf-8').splitlines()]
+        assert [item['nodeid'] for item in merged] == ['a', 'b', 'c']
+
+    def test_duplicate_records(self, tmp_path):
+        """Verify a node id recorded by two shards is listed as a duplicate."""
+        first = write_records(tmp_path / 'shard-1.jsonl', [record('a', shard='1/2')])
+        second = write_records(tmp_path / 'shard-2.jsonl', [record('a', shard='2/2'), record('b', shard='2/2')])
+        summary = merge_reports.merge_results([first, second], str(tmp_path / 'results.jsonl'))
+        assert summary['duplicates'] == ['a']
+
+    def test_missing_shards(self, tmp_path):
+        """Verify shards of the run that wrote no records are listed."""
+        first = write_records(tmp_path / 'shard-1.jsonl', [record('a', shard='1/4')])
+        third = write_records(tmp_path / 'shard-3.jsonl', [record('b', shard='3/4')])
+        summary = merge_reports.merge_results([first, third], str(tmp_path / 'results.jsonl'))
+        assert summary['missing_shards'] == ['2/4', '4/4']
+
+    def test_missing_shards_needs_shard_records(self, tmp_path):
+        """Verify no shard is reported missing when the records carry no shard."""
+        results = write_records(tmp_path / 'results-in.jsonl', [record('a'), record('b')])
+        summary = merge_reports.merge_results([results], str(tmp_path / 'results.jsonl'))
+        assert summary['missing_shards'] == []
+
+    def test_main_fails_on_missing_shard(self, tmp_path, capsys):
+        """Verify the command exits non-zero and names the missing shard."""
+        first = write_records(tmp_path / 'shard-1.jsonl', [record('a', shard='1/2')])
+        code = merge_reports.main([first, '--json-out', str(tmp_path / 'results.jsonl')])
+        assert code == 1
+        assert 'MISSING shard 2/2' in capsys.readouterr().out
@@ -0,0 +1,140 @@
+"""Explicit Wait Polling and Deadline Budget Tests
+
+Drives core.polling with plain callables in place of expected conditions and
+checks the backoff schedule, timeouts and how nested deadline budgets cut
+waits short.
+"""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from core import deadline
+from core.polling import BackoffWebDriverWait, PollSchedule
+from utils.exceptions import DeadlineExceededException
+
+FAST = PollSchedule(initial=0.001, factor=2.0, maximum=0.01)
+
+
+class Condition:
+    """Condition that is met on the given poll and counts its calls."""
+
+    def __init__(self, met_on=None, missing=False):
+        self.met_on = met_on
+        self.missing = missing
+        self.calls = 0
+
+    def __call__(self, driver):
+        self.calls += 1
+        if self.met_on is not None and self.calls >= self.met_on:
+            return 'element'
+        if self.missing:
+            raise NoSuchElementException('missing')
+        return False
+
+
+def wait(timeout):
+    """Build a wait on FAST polling without a driver."""
+    return BackoffWebDriverWait(None, timeout, poll_schedule=FAST,
+                                ignored_exceptions=(NoSuchElementException,))
+
+
+class TestPollSchedule:
+    """Test class for the backoff poll schedule."""
+
+    def test_intervals_grow_to_cap(self):
+        """Verify intervals start at initial, grow by factor and stop at max."""
+        intervals = PollSchedule(initial=0.1, factor=3.0, maximum=0.5).intervals()
+        assert [next(intervals) for _ in range(5)] == pytest.approx([0.1, 0.3, 0.5, 0.5, 0.5])
+
+    @pytest.mark.parametrize('initial, factor, maximum', [(0, 2.0, 0.5), (0.1, 0.5, 0.5), (1.0, 2.0, 0.5)])
+    def test_invalid_schedule(self, initial, factor, maximum):
+        """Verify schedules that never grow or start above their cap are rejected."""
+        with pytest.raises(ValueError):
+            PollSchedule(initial, factor, maximum)
+
+    def test_from_config(self):
+        """Verify config keys are read and missing ones fall back to the defaults."""
+        schedule = PollSchedule.from_config({'initial': '0.05', 'max': 1})
+        assert (schedule.initial, schedule.factor, schedule.maximum) == (0.05, 2.0, 1.0)
+        assert PollSchedule.from_config(None).initial == 0.025
+
+
+class TestBackoffWebDriverWait:
+    """Test class for waits polling on a PollSchedule."""
+
+    def test_returns_condition_value(self):
+        """Verify the wait returns once the condition is met, ignoring missing elements before."""
+        condition = Condition(met_on=3, missing=True)
+        assert wait(1).until(condition) == 'element'
+        assert condition.calls == 3
+
+    def test_timeout(self):
+        """Verify a condition never met times out close to the timeout."""
+        started = time.monotonic()
+        with pytest.raises(TimeoutException):
+            wait(0.05).until(Condition())
+        assert time.monotonic() - started < 0.5
+
+    def test_until_not_on_missing_element(self):
+        """Verify until_not is met as soon as the element is gone."""
+        assert wait(1).until_not(Condition(missing=True)) is True
+
+
+class TestDeadline:
+    """Test class for per-test deadline budgets."""
+
+    def test_no_budget(self):
+        """Verify waits keep their own timeout outside a budget."""
+        assert deadline.remaining() is None
+        assert deadline.clamp(10) == (10, False)
+
+    def test_falsy_budget_leaves_deadline_untouched(self):
+        """Verify budget(0) and budget(None) do not start a budget."""
+        with deadline.budget(0), deadline.budget(None):
+            assert deadline.remaining() is None
+
+    def test_inner_budget_cannot_extend_outer(self):
+        """Verify a nested budget is capped by the enclosing one and restored after it."""
+        with deadline.budget(1):
+            with deadline.budget(60):
+                assert deadline.remaining() <= 1
+            with deadline.budget(0.5):
+                assert deadline.remaining() <= 0.5
+            assert 0.5 < deadline.remaining() <= 1
+        assert deadline.remaining() is None
+
+    def test_clamp_to_budget(self):
+        """Verify a timeout longer than the budget is cut down and flagged."""
+        with deadline.budget(1):
+            timeout, limited = deadline.clamp(10)
+            assert timeout <= 1 and limited
+            assert deadline.clamp(0.1) == (0.1, False)
+
+    def test_spent_budget(self):
+        """Verify clamping in a spent budget raises at once."""
+        with deadline.budget(0.001):
+            time.sleep(0.01)
+            with pytest.raises(DeadlineExceededException):
+                deadline.clamp(10)
+
+    def test_wait_cut_by_budget(self):
+        """Verify a wait limited by the budget ends early with DeadlineExceededException."""
+        started = time.monotonic()
+        with deadline.budget(0.05):
+            with pytest.raises(DeadlineExceededException):
+                wait(10).until(Condition())
+        assert time.monotonic() - started < 1
+
+    def test_budget_for_marker(self):
+        """Verify the budget marker wins over the configured default."""
+        class Item:
+            def __init__(self, marker):
+                self.marker = marker
+
+            def get_closest_marker(self, name):
+                return self.marker if name == 'budget' else None
+
+        assert deadline.budget_for(Item(SimpleNamespace(args=(5,))), default=30) == 5
+        assert deadline.budget_for(Item(None), default=30) == 30
@@ -0,0 +1,229 @@
+"""Failed Test Rerun Tests
+
+Runs small pytest sessions wired to core.rerun the way conftest.py wires it
+and checks what pytest-rerunfailures reruns, how the attempts are reported,
+and that a rerun gets the browser of its failed attempt.
+"""
+
+import importlib.util
+import json
+
+import pytest
+from core import rerun, result_log
+
+needs_rerunfailures = pytest.mark.skipif(importlib.util.find_spec('pytest_rerunfailures') is None,
+                                         reason="pytest-rerunfailures is not installed")
+
+RERUN_CONFTEST = """
+import json
+import pytest
+from core import duration_history, rerun
+
+CONFIG = {{'execution': {{'retry_failed_tests': True, 'retry_count': {retries}}}}}
+
+class FakeBrowser:
+    created = 0
+
+    def __init__(self):
+        FakeBrowser.created += 1
+        self.number = FakeBrowser.created
+        self.calls = []
+
+    def execute_script(self, script):
+        self.calls.append('reset storage')
+
+    def delete_all_cookies(self):
+        self.calls.append('delete cookies')
+
+    def get(self, url):
+        self.calls.append(url)
+
+    def quit(self):
+        self.calls.append('quit')
+
+def pytest_configure(config):
+    rerun.configure(config, CONFIG)
+
+@pytest.hookimpl(tryfirst=True, hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    rerun.note_report(item, report)
+    if report.when == 'setup':
+        duration_history.history.restart(item.nodeid)
+    duration_history.history.add(item.nodeid, report.duration)
+
+def pytest_sessionfinish(session):
+    with open('durations.json', 'w') as f:
+        json.dump(duration_history.history.current, f)
+
+@pytest.fixture(scope='session')
+def browser_pool():
+    pool = rerun.BrowserPool()
+    yield pool
+    pool.close()
+
+@pytest.fixture
+def driver(request, browser_pool):
+    browser = browser_pool.acquire() if rerun.attempt(request.node) > 1 else None
+    browser = browser or FakeBrowser()
+    yield browser
+    if rerun.will_retry(request.node):
+        browser_pool.release(browser)
+    else:
+        browser.quit()
+    with open('browsers.txt', 'a') as f:
+        f.write(f"{{browser.number}} {{','.join(browser.calls)}}\\n")
+"""
+
+# Appends every test run to runs.txt so the order of attempts can be checked
+FLAKY_TESTS = """
+import pathlib
+
+def run(name):
+    path = pathlib.Path('runs.txt')
+    runs = path.read_text().split() if path.exists() else []
+    path.write_text(' '.join(runs + [name]))
+    return runs.count(name) + 1
+
+def test_flaky():
+    assert run('flaky') > 1
+
+def test_stable():
+    run('stable')
+"""
+
+FLAKY_MODULE_FIXTURE = """
+import pytest
+
+setups = []
+
+@pytest.fixture(scope='module')
+def resource():
+    setups.append(1)
+    if len(setups) == 1:
+        raise RuntimeError('resource unavailable')
+    return 'ready'
+
+def test_first(resource):
+    assert resource == 'ready'
+
+def test_second(resource):
+    assert resource == 'ready'
+"""
+
+
+def run_session(run_pytest, source, *args, retries=1):
+    """Run source as a test module under the rerun hooks.
+
+    Returns:
+        SessionResult: Outcome of the inner session
+    """
+    return run_pytest({'conftest.py': RERUN_CONFTEST.format(retries=retries), 'test_module.py': source}, *args)
+
+
+class TestSettings:
+    """Test class for reading the rerun settings from config.yaml."""
+
+    def test_disabled_by_default(self):
+        """Verify reruns are off without retry settings."""
+        assert rerun.settings({}) == 0
+
+    def test_current_and_older_keys(self):
+        """Verify both the retry_failed_tests and the older retry_on_failure keys are read."""
+        assert rerun.settings({'execution': {'retry_failed_tests': True, 'retry_count': 2}}) == 2
+        assert rerun.settings({'execution': {'retry_on_failure': True, 'max_retries': 3,
+                                             'retry_mode': 'immediate'}}) == 3
+        assert rerun.settings({'execution': {'retry_failed_tests': False, 'retry_count': 2}}) == 0
+
+    def test_unsupported_mode_is_rejected(self):
+        """Verify a retry_mode pytest-rerunfailures cannot honor is a usage error."""
+        with pytest.raises(pytest.UsageError):
+            rerun.settings({'execution': {'retry_failed_tests': True, 'retry_mode': 'end'}})
+
+
+@needs_rerunfailures
+class TestRerun:
+    """Test class for rerunning failed tests through pytest-rerunfailures."""
+
+    def test_failed_test_rerun_right_away(self, run_pytest, tmp_path):
+        """Verify a failed test is rerun before the next test and then passes."""
+        result = run_session(run_pytest, FLAKY_TESTS)
+        assert result.outcomes() == {'passed': 2, 'rerun': 1}
+        assert (tmp_path / 'runs.txt').read_text().split() == ['flaky', 'flaky', 'stable']
+
+    def test_retries_run_out(self, run_pytest):
+        """Verify the last failed attempt fails the session."""
+        result = run_session(run_pytest, "def test_broken():\n    assert False\n", retries=2)
+        assert result.outcomes() == {'failed': 1, 'rerun': 2}
+        assert result.ret == pytest.ExitCode.TESTS_FAILED
+
+    def test_command_line_reruns_win(self, run_pytest):
+        """Verify --reruns on the command line overrides config.yaml."""
+        result = run_session(run_pytest, FLAKY_TESTS, '--reruns', '0', retries=2)
+        assert result.outcomes() == {'failed': 1, 'passed': 1}
+
+    def test_failed_module_fixture_is_set_up_again(self, run_pytest):
+        """Verify a module fixture that failed once is set up anew instead of replaying its error."""
+        result = run_session(run_pytest, FLAKY_MODULE_FIXTURE)
+        assert result.outcomes() == {'passed': 2, 'rerun': 1}
+
+    def test_rerun_reuses_reset_browser(self, run_pytest, tmp_path):
+        """Verify the rerun gets the failed attempt's browser, reset, and other tests get their own."""
+        source = FLAKY_TESTS.replace("def test_flaky():", "def test_flaky(driver):") \
+            .replace("def test_stable():", "def test_stable(driver):")
+        result = run_session(run_pytest, source)
+        assert result.outcomes() == {'passed': 2, 'rerun': 1}
+        assert (tmp_path / 'browsers.txt').read_text().splitlines() == [
+            '1 reset storage,delete cookies,about:blank',
+            '1 reset storage,delete cookies,about:blank,quit',
+            '2 quit',
+        ]
+
+    def test_only_last_attempt_duration_recorded(self, run_pytest, tmp_path):
+        """Verify a slow failed attempt does not add to the rerun test's duration."""
+        source = """
+import time
+
+attempts = []
+
+def test_flaky():
+    attempts.append(1)
+    if len(attempts) == 1:
+        time.sleep(0.5)
+        assert False
+"""
+        result = run_session(run_pytest, source)
+        assert result.outcomes() == {'passed': 1, 'rerun': 1}
+        durations = json.loads((tmp_path / 'durations.json').read_text())
+        assert durations['test_module.py::test_flaky'] < 0.4
+
+
+class TestRerunResults:
+    """Test class for merging the result records of rerun tests."""
+
+    def record(self, nodeid, outcome, attempt=1):
+        """Build a result record as make_record does."""
+        record = {'nodeid': nodeid, 'name': nodeid, 'outcome': outcome, 'duration': 0.1}
+        if attempt > 1:
+            record['attempt'] = attempt
+        return record
+
+    def test_first_outcome_and_flaky_count(self, tmp_path):
+        """Verify the last attempt wins, keeps the first attempt's outcome and counts as flaky."""
+        log = result_log.ResultLog(str(tmp_path), worker='gw0')
+        log.append(self.record('test_flaky', 'failed'))
+        log.append(self.record('test_flaky', 'failed', attempt=2))
+        log.append(self.record('test_flaky', 'passed', attempt=3))
+        log.append(self.record('test_broken', 'error'))
+        log.append(self.record('test_broken', 'failed', attempt=2))
+        log.append(self.record('test_stable', 'passed'))
+
+        records = {record['nodeid']: record for record in result_log.load_results(str(tmp_path))}
+        assert records['test_flaky']['outcome'] == 'passed'
+        assert records['test_flaky']['first_outcome'] == 'failed'
+        assert records['test_broken']['first_outcome'] == 'error'
+        assert 'first_outcome' not in records['test_stable']
+
+        summary = result_log.summarize(records.values())
+        assert summary == {'passed': 2, 'failed': 1, 'error': 0, 'skipped': 0, 'flaky': 1, 'total': 3}
@@ -0,0 +1,161 @@
+"""Self-healing Locator Tests
+
+Checks which candidates ResolutionCache hands to the fallback script, how
+heals are recorded and merged into the file on disk, and how
+healing_condition falls back when the primary misses.
+"""
+
+import json
+import pickle
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from core.self_healing import HealingLocator, ResolutionCache, healing_condition
+
+PRIMARY = (By.ID, 'login-submit')
+BY_NAME = (By.NAME, 'login-submit')
+BY_TEXT = (By.XPATH, "//button[normalize-space()='Login']")
+SUBMIT = HealingLocator(PRIMARY, BY_NAME, BY_TEXT)
+
+
+class FakeElement:
+    """Element that is displayed and enabled."""
+
+    def is_displayed(self):
+        return True
+
+    def is_enabled(self):
+        return True
+
+
+class FakeDriver:
+    """Driver on which only the given locators match."""
+
+    def __init__(self, *present):
+        self.present = set(present)
+        self.scripts = []
+
+    def find_element(self, by, value):
+        if (by, value) not in self.present:
+            raise NoSuchElementException(value)
+        return FakeElement()
+
+    def execute_script(self, script, locators):
+        self.scripts.append([tuple(locator) for locator in locators])
+        return [[index, FakeElement()] for index, locator in enumerate(locators)
+                if tuple(locator) in self.present]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Empty resolution cache backed by a file in tmp_path."""
+    return ResolutionCache(str(tmp_path / 'healing' / 'resolutions.json'))
+
+
+class TestHealingLocator:
+    """Test class for locators carrying fallbacks."""
+
+    def test_behaves_as_primary(self):
+        """Verify the locator unpacks and compares as its primary."""
+        by, value = SUBMIT
+        assert (by, value) == PRIMARY and SUBMIT == PRIMARY
+        assert SUBMIT.fallbacks == (BY_NAME, BY_TEXT)
+
+    def test_pickles_with_fallbacks(self):
+        """Verify fallbacks survive pickling, as the compiled locator cache does."""
+        assert pickle.loads(pickle.dumps(SUBMIT)).fallbacks == SUBMIT.fallbacks
+
+
+class TestResolutionCache:
+    """Test class for persisting the fallbacks that healed a locator."""
+
+    def test_candidates_without_resolution(self, cache):
+        """Verify only the fallbacks are tried when nothing is cached."""
+        assert cache.candidates('LoginPage', SUBMIT) == [BY_NAME, BY_TEXT]
+
+    def test_candidates_with_resolution(self, cache):
+        """Verify a cached fallback comes right after the primary, ahead of the others."""
+        cache.record('LoginPage', SUBMIT, BY_TEXT)
+        assert cache.candidates('LoginPage', SUBMIT) == [PRIMARY, BY_TEXT, BY_NAME]
+        assert cache.candidates('ProfilePage', SUBMIT) == [BY_NAME, BY_TEXT]
+
+    def test_resolution_no_longer_declared(self, cache):
+        """Verify a cached fallback the page no longer declares is ignored."""
+        cache.record('LoginPage', SUBMIT, BY_TEXT)
+        assert cache.preferred('LoginPage', HealingLocator(PRIMARY, BY_NAME)) is None
+
+    def test_record_counts_heals(self, cache):
+        """Verify the same fallback adds up heals and another one starts over."""
+        cache.record('LoginPage', SUBMIT, BY_NAME)
+        cache.record('LoginPage', SUBMIT, BY_NAME)
+        assert cache.entries['LoginPage|id|login-submit']['heals'] == 2
+        cache.record('LoginPage', SUBMIT, BY_TEXT)
+        assert cache.entries['LoginPage|id|login-submit']['heals'] == 1
+        assert cache.preferred('LoginPage', SUBMIT) == BY_TEXT
+
+    def test_primary_match_clears_resolution(self, cache):
+        """Verify the entry is dropped once the primary matches again."""
+        cache.record('LoginPage', SUBMIT, BY_NAME)
+        cache.record('LoginPage', SUBMIT, PRIMARY)
+        assert cache.preferred('LoginPage', SUBMIT) is None
+
+    def test_save_and_reload(self, cache):
+        """Verify saved resolutions are tried first by a later run."""
+        cache.record('LoginPage', SUBMIT, BY_NAME)
+        cache.save()
+        later = ResolutionCache(cache.path)
+        assert later.candidates('LoginPage', SUBMIT) == [PRIMARY, BY_NAME, BY_TEXT]
+        assert later.report()[1].startswith("  LoginPage id='login-submit' -> name='login-submit' (healed 1x")
+
+    def test_save_merges_other_workers(self, cache):
+        """Verify save keeps what other processes saved and applies this one's removals."""
+        other = ResolutionCache(cache.path)
+        other.record('LoginPage', SUBMIT, BY_NAME)
+        other.record('ProfilePage', SUBMIT, BY_TEXT)
+        other.save()
+        cache.record('LoginPage', SUBMIT, PRIMARY)
+        cache.record('SettingsPage', SUBMIT, BY_NAME)
+        cache.save()
+        with open(cache.path) as f:
+            assert sorted(json.load(f)) == ['ProfilePage|id|login-submit', 'SettingsPage|id|login-submit']
+
+    def test_save_without_changes_writes_nothing(self, cache, tmp_path):
+        """Verify a run that healed nothing leaves no file behind."""
+        cache.save()
+        assert not (tmp_path / 'healing').exists()
+
+
+class TestHealingCondition:
+    """Test class for waits falling back when the primary misses."""
+
+    def test_plain_locator_unchanged(self, cache):
+        """Verify conditions on locators without fallbacks are not wrapped."""
+        method = EC.presence_of_element_located(PRIMARY)
+        assert healing_condition(method, PRIMARY, 'LoginPage', cache) is method
+
+    def test_unsupported_condition_unchanged(self, cache):
+        """Verify conditions a substitute element cannot meet are not wrapped."""
+        method = EC.text_to_be_present_in_element(SUBMIT, 'Login')
+        assert healing_condition(method, SUBMIT, 'LoginPage', cache) is method
+
+    def test_primary_match(self, cache):
+        """Verify a matching primary needs no script call."""
+        driver = FakeDriver(PRIMARY)
+        condition = healing_condition(EC.presence_of_element_located(SUBMIT), SUBMIT, 'LoginPage', cache)
+        assert condition(driver)
+        assert driver.scripts == []
+
+    def test_fallbacks_in_one_call(self, cache):
+        """Verify every fallback goes in a single script call and the match is recorded."""
+        driver = FakeDriver(BY_TEXT)
+        condition = healing_condition(EC.element_to_be_clickable(SUBMIT), SUBMIT, 'LoginPage', cache)
+        assert isinstance(condition(driver), FakeElement)
+        assert driver.scripts == [[BY_NAME, BY_TEXT]]
+        assert cache.preferred('LoginPage', SUBMIT) == BY_TEXT
+
+    def test_nothing_matches(self, cache):
+        """Verify the condition is not met when no candidate matches."""
+        condition = healing_condition(EC.presence_of_element_located(SUBMIT), SUBMIT, 'LoginPage', cache)
+        assert condition(FakeDriver()) is False
@@ -0,0 +1,84 @@
+"""Test Sharding Tests
+
+Checks the `--shard i/N` specification parsing and that the partition of
+the collected tests is complete, disjoint and the same on every machine.
+"""
+
+import pytest
+from core import sharding
+from core.duration_history import DurationHistory
+
+NODEIDS = [f"tests/ui/test_module_{module}.py::test_case_{case}" for module in range(4) for case in range(7)]
+
+
+def flatten(shards):
+    """Join the shards of a partition into one list."""
+    return [nodeid for shard in shards for nodeid in shard]
+
+
+class TestParseShard:
+    """Test class for parsing `i/N` shard specifications."""
+
+    def test_valid_specification(self):
+        """Verify index and total are returned as ints."""
+        assert sharding.parse_shard('2/4') == (2, 4)
+        assert sharding.parse_shard('1/1') == (1, 1)
+
+    @pytest.mark.parametrize('value', ['', '3', 'a/b', '1/2/3', '1.5/2'])
+    def test_malformed_specification(self, value):
+        """Verify anything but two integers separated by a slash is rejected."""
+        with pytest.raises(ValueError, match='expected i/N'):
+            sharding.parse_shard(value)
+
+    @pytest.mark.parametrize('value', ['0/3', '4/3', '-1/3', '1/0'])
+    def test_index_out_of_range(self, value):
+        """Verify the index must be between 1 and the shard count."""
+        with pytest.raises(ValueError, match='shard index must be between'):
+            sharding.parse_shard(value)
+
+
+class TestPartition:
+    """Test class for splitting tests into shards."""
+
+    @pytest.fixture(params=['no history', 'history'])
+    def history(self, request):
+        """Empty history, or one with an estimate for every other test."""
+        if request.param == 'no history':
+            return DurationHistory()
+        return DurationHistory({nodeid: 0.5 + index % 5 for index, nodeid in enumerate(NODEIDS[::2])})
+
+    @pytest.mark.parametrize('total', [1, 3, 5, 40])
+    def test_every_test_in_exactly_one_shard(self, history, total):
+        """Verify the shards together hold every test once and nothing else."""
+        shards = sharding.partition(NODEIDS, total, history)
+        assert len(shards) == total
+        assert sorted(flatten(shards)) == sorted(NODEIDS)
+
+    def test_same_partition_for_same_input(self, history):
+        """Verify collection order and repeated node ids do not change the partition."""
+        shards = sharding.partition(NODEIDS, 3, history)
+        assert sharding.partition(list(reversed(NODEIDS)) + NODEIDS[:5], 3, history) == shards
+        assert sharding.partition(NODEIDS, 3, history) == shards
+
+    def test_no_history_deals_evenly(self):
+        """Verify tests unknown to the history are dealt round robin."""
+        shards = sharding.partition(NODEIDS, 3, DurationHistory())
+        sizes = [len(shard) for shard in shards]
+        assert max(sizes) - min(sizes) <= 1
+
+    def test_no_history_ignores_estimates_of_other_tests(self):
+        """Verify a history knowing none of the tests falls back to round robin."""
+        unrelated = DurationHistory({'tests/ui/test_gone.py::test_gone': 100.0})
+        assert sharding.partition(NODEIDS, 3, unrelated) == sharding.partition(NODEIDS, 3, DurationHistory())
+
+    def test_history_balances_predicted_duration(self):
+        """Verify the longest test gets a shard to itself when it outweighs the rest."""
+        history = DurationHistory({'slow': 10.0, 'a': 1.0, 'b': 1.0, 'c': 1.0})
+        assert sharding.partition(['a', 'b', 'c', 'slow'], 2, history) == [['slow'], ['a', 'b', 'c']]
+
+    def test_history_predicts_unknown_tests(self):
+        """Verify tests missing from a history that knows others are still placed."""
+        history = DurationHistory({'a': 4.0, 'b': 2.0})
+        shards = sharding.partition(['a', 'b', 'new_1', 'new_2'], 2, history)
+        assert sorted(flatten(shards)) == ['a', 'b', 'new_1', 'new_2']
+        assert shards[0][0] == 'a'
@@ -72,3 +72,11 @@ class ValidationException(AutomationFrameworkException):
         self.actual = actual
         self.message = f"{message}: Expected '{expected}', but got '{actual}'"
         super().__init__(self.message)
+
+
+class DeadlineExceededException(AutomationFrameworkException):
+    """Raised when a test has spent its whole time budget on waits."""
+    
+    def __init__(self, message="Test time budget exhausted"):
+        self.message = message
+        super().__init__(self.message)
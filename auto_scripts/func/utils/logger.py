@@ -7,7 +7,7 @@ for the automation framework.
 import logging
 import os
 from datetime import datetime
-import yaml
+from core.config_cache import load_config
 
 
 def setup_logger(name=None, log_file=None, level=None):
@@ -24,9 +24,7 @@ def setup_logger(name=None, log_file=None, level=None):
     # Load configuration
     config_path = os.path.join(os.path.dirname(__file__), '..', 'config', 'config.yaml')
     try:
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
-            logging_config = config.get('logging', {})
+        logging_config = load_config(config_path).get('logging', {})
     except FileNotFoundError:
         logging_config = {}
     
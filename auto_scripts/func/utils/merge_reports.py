@@ -0,0 +1,167 @@
+"""Shard Report Merging
+
+Combines the JUnit XML reports and JSON Lines result records written by the
+shards of a `--shard i/N` run into one report each, in a single streaming
+pass over the inputs: test cases and records are copied out as they are
+read, so memory does not grow with the size of the reports. Tests reported
+by more than one shard and shards missing from the results are listed.
+
+    python -m utils.merge_reports --junit-out reports/junit.xml \\
+        --json-out reports/results.jsonl shard-*/junit.xml shard-*/results.jsonl
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import xml.etree.ElementTree as ET
+from xml.sax.saxutils import quoteattr
+
+from core.result_log import OUTCOMES
+
+# JUnit child elements marking a test case's outcome, and the total they count towards
+JUNIT_OUTCOMES = {'failure': 'failures', 'error': 'errors', 'skipped': 'skipped'}
+
+
+def _start_tag(tag, attributes):
+    return f"<{tag}" + "".join(f" {name}={quoteattr(str(value))}" for name, value in attributes.items()) + ">"
+
+
+def merge_junit(paths, out):
+    """Merge JUnit XML reports into one <testsuites> document.
+
+    Every input <testsuite> is kept with its own attributes; the root gets
+    the totals counted from the test cases themselves.
+
+    Args:
+        paths (list): JUnit XML files
+        out (str): Merged report path
+
+    Returns:
+        dict: 'tests', 'failures', 'errors', 'skipped', 'time' and
+            'duplicates', the (classname, name) of tests found more than once
+    """
+    totals = {'tests': 0, 'failures': 0, 'errors': 0, 'skipped': 0, 'time': 0.0}
+    seen = set()
+    duplicates = []
+    with tempfile.TemporaryFile('w+', encoding='utf-8') as body:
+        for path in paths:
+            suites = []
+            for event, element in ET.iterparse(path, events=('start', 'end')):
+                if element.tag == 'testsuite':
+                    if event == 'start':
+                        suites.append(element)
+                        body.write(_start_tag('testsuite', element.attrib))
+                    else:
+                        suites.pop()
+                        body.write('</testsuite>')
+                    continue
+                # Only complete direct children of a suite are copied, then dropped
+                if event != 'end' or not suites or element not in list(suites[-1]):
+                    continue
+                if element.tag == 'testcase':
+                    key = (element.get('classname', ''), element.get('name', ''))
+                    if key in seen:
+                        duplicates.append(key)
+                    seen.add(key)
+                    totals['tests'] += 1
+                    totals['time'] += float(element.get('time') or 0)
+                    for child in element:
+                        if child.tag in JUNIT_OUTCOMES:
+                            totals[JUNIT_OUTCOMES[child.tag]] += 1
+                            break
+                element.tail = None
+                body.write(ET.tostring(element, encoding='unicode'))
+                suites[-1].remove(element)
+        body.seek(0)
+        with open(out, 'w', encoding='utf-8') as f:
+            f.write('<?xml version="1.0" encoding="utf-8"?>')
+            f.write(_start_tag('testsuites', dict(
+                name='merged', tests=totals['tests'], failures=totals['failures'],
+                errors=totals['errors'], skipped=totals['skipped'], time=f"{totals['time']:.3f}",
+            )))
+            while True:
+                chunk = body.read(1 << 16)
+                if not chunk:
+                    break
+                f.write(chunk)
+            f.write('</testsuites>\n')
+    totals['duplicates'] = duplicates
+    return totals
+
+
+def merge_results(paths, out):
+    """Concatenate JSON Lines result records (core.result_log) into one file.
+
+    Unreadable lines are dropped.
+
+    Args:
+        paths (list): Result record files
+        out (str): Merged records path
+
+    Returns:
+        dict: 'total' and a count per outcome, 'duplicates', the node ids
+            found more than once, and 'missing_shards', the `i/N` shards
+            with no records when records carry a shard
+    """
+    summary = dict.fromkeys(OUTCOMES, 0)
+    summary['total'] = 0
+    seen = set()
+    duplicates = []
+    shards = set()
+    with open(out, 'w', encoding='utf-8') as f:
+        for path in paths:
+            with open(path, encoding='utf-8') as records:
+                for line in records:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    if record['nodeid'] in seen:
+                        duplicates.append(record['nodeid'])
+                    seen.add(record['nodeid'])
+                    summary['total'] += 1
+                    summary[record['outcome']] = summary.get(record['outcome'], 0) + 1
+                    if record.get('shard'):
+                        shards.add(record['shard'])
+                    f.write(json.dumps(record, separators=(',', ':')) + '\n')
+    summary['duplicates'] = duplicates
+    summary['missing_shards'] = []
+    counts = {shard.split('/')[1] for shard in shards}
+    if len(counts) == 1:
+        total = int(counts.pop())
+        summary['missing_shards'] = [f"{index}/{total}" for index in range(1, total + 1)
+                                     if f"{index}/{total}" not in shards]
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Merge the reports of a sharded test run")
+    parser.add_argument('inputs', nargs='+', help="per-shard JUnit .xml files and .jsonl result records")
+    parser.add_argument('--junit-out', default='reports/junit.xml', help="merged JUnit XML report")
+    parser.add_argument('--json-out', default='reports/results.jsonl', help="merged result records")
+    args = parser.parse_args(argv)
+    junit = [path for path in args.inputs if path.endswith('.xml')]
+    records = [path for path in args.inputs if not path.endswith('.xml')]
+    problems = 0
+    if junit:
+        totals = merge_junit(junit, args.junit_out)
+        print(f"{args.junit_out}: {totals['tests']} tests, {totals['failures']} failures, "
+              f"{totals['errors']} errors, {totals['skipped']} skipped from {len(junit)} report(s)")
+        for classname, name in totals['duplicates']:
+            print(f"  DUPLICATE {classname}::{name}")
+        problems += len(totals['duplicates'])
+    if records:
+        summary = merge_results(records, args.json_out)
+        print(f"{args.json_out}: " + ", ".join(f"{summary[outcome]} {outcome}" for outcome in OUTCOMES)
+              + f" of {summary['total']} tests from {len(records)} file(s)")
+        for nodeid in summary['duplicates']:
+            print(f"  DUPLICATE {nodeid}")
+        for shard in summary['missing_shards']:
+            print(f"  MISSING shard {shard}")
+        problems += len(summary['duplicates']) + len(summary['missing_shards'])
+    return 1 if problems else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
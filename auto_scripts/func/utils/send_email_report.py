@@ -5,8 +5,8 @@ from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
 from email import encoders
 from datetime import datetime
-import yaml
 import logging
+from core.config_cache import load_config
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -20,8 +20,7 @@ def load_email_config():
     """
     config_path = os.path.join(os.path.dirname(__file__), '..', 'config', 'config.yaml')
     try:
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        config = load_config(config_path)
         return config.get('email', {})
     except FileNotFoundError:
         logger.warning("Config file not found, using default email settings")
@@ -151,7 +150,7 @@ def send_test_summary_report(total_tests, passed_tests, failed_tests, test_resul
         total_tests (int): Total number of tests executed
         passed_tests (int): Number of tests that passed
         failed_tests (int): Number of tests that failed
-        test_results (list): Detailed test results
+        test_results (list): Detailed test results, records from core.result_log
     
     Returns:
         bool: True if email sent successfully, False otherwise
@@ -171,9 +170,9 @@ def send_test_summary_report(total_tests, passed_tests, failed_tests, test_resul
     if test_results:
         message += "\nDetailed Results:\n"
         for result in test_results:
-            status = "PASS" if result.get('passed', False) else "FAIL"
+            status = result.get('outcome', 'failed').upper()
             message += f"- {result.get('name', 'Unknown')}: {status}\n"
-            if not result.get('passed', False) and result.get('error'):
+            if result.get('error'):
                 message += f"  Error: {result.get('error')}\n"
     
     return send_report(message, subject)
\ No newline at end of file
@@ -7,26 +7,28 @@ and common test operations.
 import logging
 import yaml
 import os
-from typing import Any, Dict
+from typing import Any, Mapping
+from core import config_cache
 
 
 logger = logging.getLogger(__name__)
 
 
-def load_config(config_path: str = "config/config.yaml") -> Dict[str, Any]:
+def load_config(config_path: str = "config/config.yaml") -> Mapping[str, Any]:
     """Load configuration from YAML file.
     
+    The configuration is shared by the whole process and read-only.
+    
     Args:
         config_path (str): Path to the configuration file
         
     Returns:
-        Dict[str, Any]: Configuration dictionary
+        Mapping[str, Any]: Read-only configuration mapping (MappingProxyType)
     """
     try:
-        with open(config_path, 'r') as file:
-            config = yaml.safe_load(file)
-            logger.info(f"Configuration loaded from {config_path}")
-            return config
+        config = config_cache.load_config(config_path)
+        logger.info(f"Configuration loaded from {config_path}")
+        return config
     except FileNotFoundError:
         logger.error(f"Configuration file not found: {config_path}")
         raise
@@ -35,7 +37,7 @@ def load_config(config_path: str = "config/config.yaml") -> Dict[str, Any]:
         raise
 
 
-def get_test_data(test_name: str, config_path: str = "config/config.yaml") -> Dict[str, Any]:
+def get_test_data(test_name: str, config_path: str = "config/config.yaml") -> Mapping[str, Any]:
     """Retrieve test data for a specific test.
     
     Args:
@@ -43,7 +45,7 @@ def get_test_data(test_name: str, config_path: str = "config/config.yaml") -> Di
         config_path (str): Path to the configuration file
         
     Returns:
-        Dict[str, Any]: Test data dictionary
+        Mapping[str, Any]: Read-only test data mapping
     """
     config = load_config(config_path)
     test_data = config.get('test_data', {}).get(test_name, {})
@@ -0,0 +1,49 @@
+import os
+import threading
+from types import MappingProxyType
+
+import yaml
+
+BASE_DIR = os.path.join(os.path.dirname(__file__), '..')
+CONFIG_PATH = os.path.join(BASE_DIR, 'config', 'config.yaml')
+
+# absolute path -> ((mtime_ns, size), frozen config)
+_cache = {}
+_lock = threading.Lock()
+
+
+def freeze(value):
+    """Read-only copy of parsed YAML: mappings become MappingProxyType, lists tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def load_config(path=CONFIG_PATH):
+    """Parsed YAML file as a read-only mapping shared by the whole process
+
+    The file is parsed on first use and again only when its modification
+    time or size changes, so call sites need no caching of their own.
+    Relative paths are resolved against the working directory, as open() would.
+
+    Raises:
+        FileNotFoundError: If path does not exist
+    """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    entry = _cache.get(path)
+    if entry is None or entry[0] != signature:
+        with _lock:
+            entry = _cache.get(path)
+            if entry is None or entry[0] != signature:
+                with open(path) as f:
+                    entry = _cache[path] = (signature, freeze(yaml.safe_load(f) or {}))
+    return entry[1]
+
+
+def clear():
+    """Forget every parsed file"""
+    _cache.clear()
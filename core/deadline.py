@@ -0,0 +1,60 @@
+import time
+from contextlib import contextmanager
+
+# Stack of monotonic end times; nested budgets can only shrink the outer one
+_deadlines = []
+
+
+class DeadlineExceeded(Exception):
+    """Raised when the running test has spent its whole time budget"""
+
+
+@contextmanager
+def budget(seconds):
+    """Limit every wait inside the block to `seconds` in total
+
+    Budgets nest: an inner budget never extends past the enclosing one.
+    A falsy `seconds` leaves the current deadline untouched.
+    """
+    if not seconds:
+        yield
+        return
+    end_time = time.monotonic() + float(seconds)
+    if _deadlines:
+        end_time = min(end_time, _deadlines[-1])
+    _deadlines.append(end_time)
+    try:
+        yield
+    finally:
+        _deadlines.pop()
+
+
+def remaining():
+    """Seconds left in the current budget, or None when no budget is active"""
+    if not _deadlines:
+        return None
+    return _deadlines[-1] - time.monotonic()
+
+
+def clamp(timeout):
+    """Return (timeout, limited) where timeout is cut down to the remaining budget
+
+    Raises:
+        DeadlineExceeded: If the budget is already spent
+    """
+    left = remaining()
+    if left is None:
+        return timeout, False
+    if left <= 0:
+        raise DeadlineExceeded("Test time budget exhausted")
+    if left < timeout:
+        return left, True
+    return timeout, False
+
+
+def budget_for(item, default=None):
+    """Budget in seconds for a pytest item: `budget` marker first, then default"""
+    marker = item.get_closest_marker("budget")
+    if marker and marker.args:
+        return marker.args[0]
+    return default
@@ -34,6 +34,7 @@ def get_driver(browser_name="chrome", headless=False):
     else:
         raise ValueError(f"Unsupported browser: {browser_name}")
     
-    driver.implicitly_wait(10)
+    # Explicit waits poll with find_element; an implicit wait would block each poll
+    driver.implicitly_wait(0)
     driver.maximize_window()
     return driver
\ No newline at end of file
@@ -0,0 +1,285 @@
+import ast
+import fnmatch
+import hashlib
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict, deque
+
+import pytest
+
+BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+CACHE_FILE = os.path.join(BASE_DIR, '.cache', 'impact', 'imports.json')
+
+# Directories put on sys.path by the suites, relative to BASE_DIR; a module
+# resolves against the deepest one containing it first, as its suite would
+SOURCE_ROOTS = ('', 'auto_scripts/func', 'auto_scripts/func-script')
+SKIPPED_DIRS = {'.git', '.cache', '__pycache__', '.pytest_cache', '.venv', 'venv', 'node_modules'}
+# Changed files that cannot affect a test run; any other non-Python change selects every test
+IGNORED_SUFFIXES = ('.md', '.rst')
+# pytest's default python_files, used when no pytest config is at hand
+PYTHON_FILES = ('test_*.py', '*_test.py')
+# Support packages of the suites; their modules are never collected, whatever their name
+NON_TEST_DIRS = {'core', 'utils', 'pages', 'Pages', 'config'}
+
+
+def is_test_module(path, patterns=PYTHON_FILES):
+    """Whether pytest collects path: it matches python_files and is outside core/, utils/ and pages/"""
+    directories = os.path.dirname(path).split('/')
+    if NON_TEST_DIRS.intersection(directories):
+        return False
+    name = os.path.basename(path)
+    return any(fnmatch.fnmatch(name, pattern) for pattern in patterns)
+
+
+def extract_imports(source, filename='<unknown>'):
+    """(module, names, level) for every import statement, including those inside functions
+
+    Raises:
+        SyntaxError: If the source cannot be parsed
+    """
+    found = []
+    for node in ast.walk(ast.parse(source, filename=filename)):
+        if isinstance(node, ast.Import):
+            found.extend((alias.name, [], 0) for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            found.append((node.module or '', [alias.name for alias in node.names], node.level))
+    return found
+
+
+class ImportGraph:
+    """Static import graph of every Python file under a directory
+
+    Nodes are paths relative to the directory. A file depends on the
+    repository modules it imports (and the packages they live in) and, for
+    test modules, on the conftest.py files pytest loads for them.
+    """
+
+    def __init__(self, base_dir=BASE_DIR, roots=SOURCE_ROOTS, cache_file=CACHE_FILE,
+                 python_files=PYTHON_FILES):
+        self.base_dir = base_dir
+        self.roots = sorted(roots, key=len, reverse=True)
+        self.cache_file = cache_file
+        self.python_files = tuple(python_files)
+        self.files = set()
+        self.dirs = set()
+        self.dependencies = {}
+
+    def _scan(self):
+        for directory, subdirs, names in os.walk(self.base_dir):
+            subdirs[:] = sorted(d for d in subdirs if d not in SKIPPED_DIRS and not d.startswith('.'))
+            relative = os.path.relpath(directory, self.base_dir).replace(os.sep, '/')
+            relative = '' if relative == '.' else relative
+            for name in names:
+                if name.endswith('.py'):
+                    self.files.add(f"{relative}/{name}" if relative else name)
+        for path in self.files:
+            parent = os.path.dirname(path)
+            while parent and parent not in self.dirs:
+                self.dirs.add(parent)
+                parent = os.path.dirname(parent)
+
+    def _parse_all(self):
+        """Imports of every file, parsed only for files whose content hash is not cached"""
+        try:
+            with open(self.cache_file) as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
+        parsed = {}
+        changed = len(cache) != len(self.files)
+        for path in self.files:
+            with open(os.path.join(self.base_dir, path), 'rb') as f:
+                source = f.read()
+            digest = hashlib.sha1(source).hexdigest()
+            entry = cache.get(path)
+            if entry is None or entry[0] != digest:
+                try:
+                    imports = extract_imports(source, path)
+                except (SyntaxError, ValueError):
+                    imports = []
+                entry = [digest, imports]
+                changed = True
+            parsed[path] = entry
+        if changed:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            tmp_path = f"{self.cache_file}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(parsed, f, separators=(',', ':'))
+            os.replace(tmp_path, self.cache_file)
+        return {path: entry[1] for path, entry in parsed.items()}
+
+    def _join(self, *parts):
+        return '/'.join(part for part in parts if part)
+
+    def _module_file(self, directory, parts):
+        base = self._join(directory, *parts)
+        for candidate in (f"{base}.py", self._join(base, '__init__.py')):
+            if candidate in self.files:
+                return candidate
+        return None
+
+    def _resolve_in(self, directory, parts, names):
+        """Files an import executes when resolved from directory, None if it is not there"""
+        if not parts:
+            found = []
+        elif self._module_file(directory, parts[:1]) or self._join(directory, parts[0]) in self.dirs:
+            found = []
+            for depth in range(1, len(parts) + 1):
+                module = self._module_file(directory, parts[:depth])
+                if module:
+                    found.append(module)
+                elif self._join(directory, *parts[:depth]) not in self.dirs:
+                    break
+        else:
+            return None
+        # `from package import module` also imports the submodule
+        for name in names:
+            module = self._module_file(directory, parts + [name])
+            if module:
+                found.append(module)
+        return found
+
+    def resolve(self, path, module, names=(), level=0):
+        """Repository files imported by one import statement of a file; empty for third-party modules"""
+        parts = module.split('.') if module else []
+        names = [name for name in names if name != '*']
+        if level:
+            directory = os.path.dirname(path)
+            for _ in range(level - 1):
+                directory = os.path.dirname(directory)
+            return self._resolve_in(directory, parts, names) or []
+        for root in self.roots:
+            if root and not path.startswith(root + '/'):
+                continue
+            found = self._resolve_in(root, parts, names)
+            if found is not None:
+                return found
+        return []
+
+    def build(self):
+        """Scan, parse (through the hash cache) and resolve; returns self"""
+        self._scan()
+        for path, imports in self._parse_all().items():
+            dependencies = set()
+            for module, names, level in imports:
+                dependencies.update(self.resolve(path, module, names, level))
+            if is_test_module(path, self.python_files):
+                directory = os.path.dirname(path)
+                while True:
+                    conftest = self._join(directory, 'conftest.py')
+                    if conftest in self.files:
+                        dependencies.add(conftest)
+                    if not directory:
+                        break
+                    directory = os.path.dirname(directory)
+            dependencies.discard(path)
+            self.dependencies[path] = dependencies
+        return self
+
+    def dependents(self, changed):
+        """Every file that is one of `changed` or transitively imports one"""
+        reverse = defaultdict(set)
+        for path, dependencies in self.dependencies.items():
+            for dependency in dependencies:
+                reverse[dependency].add(path)
+        impacted = set(changed)
+        queue = deque(impacted)
+        while queue:
+            for dependent in reverse[queue.popleft()]:
+                if dependent not in impacted:
+                    impacted.add(dependent)
+                    queue.append(dependent)
+        return impacted
+
+    def impacted_tests(self, changed):
+        """Test modules affected by changed files (relative paths), or None when every test is
+
+        Changes that cannot be traced through imports select everything:
+        non-Python files other than docs (config, Locators.json), Python
+        files no longer in the tree or outside it.
+        """
+        python = set()
+        for path in changed:
+            if path.endswith('.py'):
+                if path not in self.files:
+                    return None
+                python.add(path)
+            elif not path.endswith(IGNORED_SUFFIXES):
+                return None
+        return {path for path in self.dependents(python) if is_test_module(path, self.python_files)}
+
+
+def changed_files(ref='HEAD', base_dir=BASE_DIR):
+    """Files changed since a git ref (committed, staged, unstaged and untracked), relative to base_dir
+
+    Files outside base_dir are kept as ../ paths; the graph cannot map them,
+    so they select every test.
+
+    Raises:
+        ValueError: If git cannot diff against ref
+    """
+    def git(*args):
+        result = subprocess.run(['git', *args], cwd=base_dir, capture_output=True, text=True)
+        if result.returncode:
+            raise ValueError(result.stderr.strip() or f"git {' '.join(args)} failed")
+        return result.stdout.splitlines()
+
+    toplevel = git('rev-parse', '--show-toplevel')[0]
+    # Both list paths relative to the toplevel, untracked files from all of it
+    names = git('diff', '--name-only', ref, '--') + git('ls-files', '--others', '--exclude-standard', '--full-name',
+                                                       toplevel)
+    return {os.path.relpath(os.path.join(toplevel, name), base_dir).replace(os.sep, '/') for name in names}
+
+
+def add_option(parser):
+    try:
+        parser.addoption('--impacted-by', metavar='REF', default=None,
+                         help="only run tests importing, directly or not, a module changed since "
+                              "the git ref REF (working tree changes included)")
+    except ValueError:
+        # Already added by the conftest of another suite in the same run
+        pass
+
+
+def deselect_unaffected(config, items):
+    """Deselect items whose test module does not depend on any file changed since --impacted-by"""
+    ref = config.getoption('impacted_by')
+    if not ref:
+        return
+    try:
+        changed = changed_files(ref)
+    except ValueError as e:
+        raise pytest.UsageError(f"--impacted-by {ref}: {e}")
+    tests = ImportGraph(python_files=config.getini('python_files')).build().impacted_tests(changed)
+    if tests is None:
+        return
+    selected, deselected = [], []
+    for item in items:
+        path = os.path.relpath(str(item.path), BASE_DIR).replace(os.sep, '/')
+        (selected if path in tests else deselected).append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    ref = argv[0] if argv else 'HEAD'
+    try:
+        changed = changed_files(ref)
+    except ValueError as e:
+        print(e)
+        return 1
+    tests = ImportGraph().build().impacted_tests(changed)
+    print(f"{len(changed)} changed file(s) since {ref}")
+    if tests is None:
+        print("Non-Python or removed files changed: every test is impacted")
+    else:
+        print("\n".join(sorted(tests)) or "No impacted tests")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
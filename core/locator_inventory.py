@@ -0,0 +1,126 @@
+import ast
+import glob
+import os
+from collections import namedtuple
+
+from selenium.webdriver.common.by import By
+
+from core import locators as locator_store
+
+BASE_DIR = os.path.join(os.path.dirname(__file__), '..')
+
+# Page object modules scanned by default, relative to the repository root
+PAGE_GLOBS = ('auto_scripts/Pages/*.py', 'pages/*.py', 'Pages/*.py')
+
+PageLocator = namedtuple('PageLocator', 'source page name by value lineno')
+PageLocator.__doc__ = """One locator declared by a page class (or Locators.json page)"""
+
+
+def _by_value(node):
+    # `By.ID` -> 'id'
+    if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id == 'By':
+        return getattr(By, node.attr, None)
+    return None
+
+
+def _locator(node):
+    """(By, value) for a `(By.X, "value")`, HealingLocator primary or LocatorRef('Page.path') node, else None"""
+    if isinstance(node, ast.Call) and getattr(node.func, 'id', None) == 'HealingLocator' and node.args:
+        return _locator(node.args[0])
+    if isinstance(node, ast.Tuple) and len(node.elts) == 2:
+        by = _by_value(node.elts[0])
+        value = node.elts[1]
+        if by and isinstance(value, ast.Constant) and isinstance(value.value, str):
+            return by, value.value
+    if (isinstance(node, ast.Call) and getattr(node.func, 'id', None) == 'LocatorRef'
+            and node.args and isinstance(node.args[0], ast.Constant)):
+        try:
+            resolved = locator_store.get_locators().resolve(node.args[0].value)
+        except (AttributeError, KeyError):
+            return None
+        if isinstance(resolved, tuple):
+            return resolved
+    return None
+
+
+def scan_file(path):
+    """Locators declared as class attributes in a page object module
+
+    Picks up `NAME = (By.X, "value")`, `NAME = LocatorRef(...)` and dicts of
+    such tuples (reported as NAME['key']) without importing the module.
+
+    Raises:
+        SyntaxError: If the module cannot be parsed
+    """
+    with open(path) as f:
+        tree = ast.parse(f.read(), filename=path)
+    source = os.path.relpath(path, BASE_DIR)
+    found = []
+    for cls in (node for node in tree.body if isinstance(node, ast.ClassDef)):
+        for statement in cls.body:
+            if isinstance(statement, ast.Assign):
+                targets = [t.id for t in statement.targets if isinstance(t, ast.Name)]
+            elif isinstance(statement, ast.AnnAssign) and isinstance(statement.target, ast.Name):
+                targets = [statement.target.id]
+            else:
+                continue
+            value = statement.value
+            entries = []
+            locator = _locator(value) if value is not None else None
+            if locator:
+                entries.append(('', locator))
+            elif isinstance(value, ast.Dict):
+                for key, item in zip(value.keys, value.values):
+                    item_locator = _locator(item)
+                    if item_locator and isinstance(key, ast.Constant):
+                        entries.append((f"[{key.value!r}]", item_locator))
+            for target in targets:
+                for suffix, (by, selector) in entries:
+                    found.append(PageLocator(source, cls.name, target + suffix, by, selector,
+                                             statement.lineno))
+    return found
+
+
+def _walk(tree, prefix=''):
+    for key, value in tree.items():
+        if isinstance(value, dict):
+            yield from _walk(value, f"{prefix}{key}.")
+        elif isinstance(value, tuple):
+            yield f"{prefix}{key}", value
+
+
+def scan_locator_repository(store=None):
+    """Locators of every page in the Locators.json repository (shards and monolithic file)"""
+    store = store or locator_store.get_locators()
+    sources = {}
+    if os.path.exists(store.fallback_file):
+        for page, tree in locator_store.load_compiled(store.fallback_file, store.cache_dir).items():
+            sources[page] = (store.fallback_file, tree)
+    for shard in glob.glob(os.path.join(store.shard_dir, '*.json')):
+        page = os.path.splitext(os.path.basename(shard))[0]
+        sources[page] = (shard, locator_store.load_compiled(shard, store.cache_dir))
+    found = []
+    for page, (path, tree) in sorted(sources.items()):
+        source = os.path.relpath(path, BASE_DIR)
+        for name, (by, value) in _walk(tree):
+            found.append(PageLocator(source, page, name, by, value, None))
+    return found
+
+
+def collect(patterns=PAGE_GLOBS, include_repository=True):
+    """Every locator from the page modules matching patterns plus Locators.json
+
+    Returns:
+        (list of PageLocator, dict of unparseable module path -> error message)
+    """
+    found = []
+    errors = {}
+    for pattern in patterns:
+        for path in sorted(glob.glob(os.path.join(BASE_DIR, pattern))):
+            try:
+                found.extend(scan_file(path))
+            except SyntaxError as e:
+                errors[os.path.relpath(path, BASE_DIR)] = f"{e.msg} (line {e.lineno})"
+    if include_repository:
+        found.extend(scan_locator_repository())
+    return found, errors
@@ -0,0 +1,84 @@
+import inspect
+import os
+import re
+from collections import defaultdict
+
+import pytest
+
+from core.locator_inventory import BASE_DIR, collect
+
+# "<placeholder>", "placeholder_admin_login_locator", empty values
+PLACEHOLDER_PATTERN = re.compile(r'^\s*$|^<[^>]*>$|^placeholder([_-]|$)', re.I)
+
+PROBLEMS_KEY = pytest.StashKey[list]()
+
+
+class LocatorPreflightError(Exception):
+    """Raised instead of running a test whose page classes declare unusable locators"""
+
+
+def find_problems(page_locators):
+    """Placeholder and duplicate locators, as {(source, page class): [messages]}"""
+    problems = defaultdict(list)
+    seen = defaultdict(dict)
+    for locator in page_locators:
+        key = (locator.source, locator.page)
+        described = f"{locator.name} = ({locator.by!r}, {locator.value!r}) at line {locator.lineno}"
+        if PLACEHOLDER_PATTERN.search(locator.value):
+            problems[key].append(f"{described} is a placeholder")
+            continue
+        first = seen[key].setdefault((locator.by, locator.value), locator.name)
+        if first != locator.name:
+            problems[key].append(f"{described} duplicates {first}")
+    return problems
+
+
+def page_classes_used(module):
+    """(source, class name) of every class a test module has imported"""
+    used = set()
+    for value in vars(module).values():
+        if not inspect.isclass(value):
+            continue
+        try:
+            path = inspect.getsourcefile(value)
+        except TypeError:
+            continue
+        if path:
+            used.add((os.path.relpath(path, BASE_DIR), value.__name__))
+    return used
+
+
+def check_items(items):
+    """Attach locator problems of the page classes each test's module uses
+
+    Called from pytest_collection_modifyitems; the page modules are scanned
+    statically once per session.
+    """
+    page_locators, _ = collect(include_repository=False)
+    problems = find_problems(page_locators)
+    if not problems:
+        return
+    by_module = {}
+    for item in items:
+        module = getattr(item, 'module', None)
+        if module is None:
+            continue
+        if module.__name__ not in by_module:
+            by_module[module.__name__] = [
+                f"{page} ({source}): {problem}"
+                for source, page in sorted(page_classes_used(module))
+                for problem in problems.get((source, page), [])
+            ]
+        if by_module[module.__name__]:
+            item.stash[PROBLEMS_KEY] = by_module[module.__name__]
+
+
+def raise_for_item(item):
+    """Fail a test flagged by check_items before any of its fixtures start a browser"""
+    __tracebackhide__ = True
+    problems = item.stash.get(PROBLEMS_KEY, None)
+    if problems:
+        raise LocatorPreflightError(
+            "Page locators are not usable, fix them before running this test:\n  "
+            + "\n  ".join(problems)
+        )
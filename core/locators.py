@@ -0,0 +1,303 @@
+import contextlib
+import hashlib
+import json
+import os
+import pickle
+import re
+import sys
+from functools import lru_cache
+
+from selenium.webdriver.common.by import By
+
+from core.config_cache import load_config
+from core.self_healing import HealingLocator
+
+BASE_DIR = os.path.join(os.path.dirname(__file__), '..')
+CONFIG_PATH = os.path.join(BASE_DIR, 'config', 'config.yaml')
+LOCATORS_FILE = os.path.join(BASE_DIR, 'Locators', 'Locators.json')
+# One <PageName>.json per page; a page found here is never read from LOCATORS_FILE
+SHARD_DIR = os.path.join(BASE_DIR, 'Locators', 'pages')
+CACHE_DIR = os.path.join(BASE_DIR, '.cache', 'locators')
+
+# Prefixes accepted in Locators.json, e.g. "id=login-email"
+STRATEGIES = {
+    'id': By.ID,
+    'name': By.NAME,
+    'css': By.CSS_SELECTOR,
+    'xpath': By.XPATH,
+    'class': By.CLASS_NAME,
+    'tag': By.TAG_NAME,
+    'link': By.LINK_TEXT,
+    'partial_link': By.PARTIAL_LINK_TEXT,
+}
+PREFIX_PATTERN = re.compile(r'^(%s)=(.*)$' % '|'.join(STRATEGIES), re.S)
+TEXT_PATTERN = re.compile(r'''^text=(['"]?)(.*)\1$''', re.S)
+URL_PATTERN = re.compile(r'^https?://')
+
+
+def xpath_literal(text):
+    """Quote text as an XPath string literal, whatever quotes it contains"""
+    if "'" not in text:
+        return f"'{text}'"
+    if '"' not in text:
+        return f'"{text}"'
+    parts = text.split("'")
+    return "concat(%s)" % ", \"'\", ".join(f"'{part}'" for part in parts)
+
+
+def parse_locator(text):
+    """Turn a Locators.json string into a (By, value) tuple
+
+    Understands `<strategy>=value` prefixes (see STRATEGIES), `text='...'`
+    for an exact text match, bare XPath (starting with / or () and bare CSS.
+    """
+    text = text.strip()
+    match = PREFIX_PATTERN.match(text)
+    if match:
+        return STRATEGIES[match.group(1)], match.group(2)
+    match = TEXT_PATTERN.match(text)
+    if match:
+        return By.XPATH, f"//*[text()={xpath_literal(match.group(2))}]"
+    if text.startswith(('/', '(')):
+        return By.XPATH, text
+    return By.CSS_SELECTOR, text
+
+
+def compile_locators(data, _interned=None):
+    """Compile parsed Locators.json into nested dicts of interned (By, value) tuples
+
+    URLs are kept as plain strings. Identical locators share one tuple object.
+    A list of locator strings is a HealingLocator: the first is the primary,
+    the rest are its fallbacks, best first.
+    """
+    interned = {} if _interned is None else _interned
+    compiled = {}
+    for name, value in data.items():
+        if isinstance(value, dict):
+            compiled[name] = compile_locators(value, interned)
+        elif isinstance(value, list):
+            primary, *fallbacks = (parse_locator(text) for text in value)
+            compiled[name] = HealingLocator(primary, *fallbacks)
+        elif isinstance(value, str) and not URL_PATTERN.match(value):
+            by, selector = parse_locator(value)
+            locator = (by, sys.intern(selector))
+            compiled[name] = interned.setdefault(locator, locator)
+        else:
+            compiled[name] = value
+    return compiled
+
+
+class LocatorGroup:
+    """Attribute access to a compiled locator tree: locators.LoginPage.inputs.emailField
+
+    Names that are not valid identifiers are reachable with item access.
+    """
+
+    def __init__(self, name, entries):
+        self._name = name
+        for key, value in entries.items():
+            if isinstance(value, dict):
+                value = LocatorGroup(f"{name}.{key}", value)
+            self.__dict__[key] = value
+
+    def _entries(self):
+        return {key: value for key, value in self.__dict__.items() if key != '_name'}
+
+    def __getattr__(self, key):
+        raise AttributeError(
+            f"No locator '{key}' in {self._name}; available: {', '.join(self._entries())}"
+        )
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+    def __contains__(self, key):
+        return key in self._entries()
+
+    def __iter__(self):
+        return iter(self._entries())
+
+    def __repr__(self):
+        return f"LocatorGroup({self._name}: {', '.join(self._entries())})"
+
+
+def load_compiled(path=LOCATORS_FILE, cache_dir=CACHE_DIR):
+    """Compiled locator tree for path, reusing the on-disk cache while the file hash matches"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    stem = os.path.splitext(os.path.basename(path))[0]
+    cache_file = os.path.join(cache_dir, f"{stem}.{hashlib.sha256(raw).hexdigest()[:16]}.pickle")
+    try:
+        with open(cache_file, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+    compiled = compile_locators(json.loads(raw))
+    os.makedirs(cache_dir, exist_ok=True)
+    for stale in os.listdir(cache_dir):
+        if stale.startswith(f"{stem}.") and stale.endswith('.pickle'):
+            # Another xdist worker rebuilding at the same time may have removed it already
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(os.path.join(cache_dir, stale))
+    tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+    with open(tmp_file, 'wb') as f:
+        pickle.dump(compiled, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_file, cache_file)
+    return compiled
+
+
+class LocatorStore:
+    """Locator repository sharded by page and loaded one page at a time
+
+    A page is read from SHARD_DIR/<page>.json when that file exists, otherwise
+    from the monolithic LOCATORS_FILE, which is then parsed once for all the
+    pages it holds. Either way only pages that are actually used get loaded,
+    and each source goes through the hash-keyed compile cache. With
+    hot_reload on, every access re-checks the source file's mtime so edits
+    show up without restarting the session.
+    """
+
+    def __init__(self, shard_dir=SHARD_DIR, fallback_file=LOCATORS_FILE,
+                 cache_dir=CACHE_DIR, hot_reload=False):
+        self.shard_dir = shard_dir
+        self.fallback_file = fallback_file
+        self.cache_dir = cache_dir
+        self.hot_reload = hot_reload
+        self._pages = {}
+        self._fallback = None
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return self.page(name)
+
+    def __getitem__(self, name):
+        return self.page(name)
+
+    @property
+    def loaded_pages(self):
+        return sorted(self._pages)
+
+    @staticmethod
+    def _mtime(path):
+        try:
+            return os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _is_current(self, source, mtime):
+        return not self.hot_reload or self._mtime(source) == mtime
+
+    def page(self, name):
+        """LocatorGroup of one page, loading (or hot reloading) it on demand"""
+        entry = self._pages.get(name)
+        if entry is not None and self._is_current(entry[1], entry[2]):
+            return entry[0]
+        shard = os.path.join(self.shard_dir, f"{name}.json")
+        mtime = self._mtime(shard)
+        if mtime is not None:
+            group = LocatorGroup(f"locators.{name}", load_compiled(shard, self.cache_dir))
+            source = shard
+        else:
+            source = self.fallback_file
+            pages, mtime = self._fallback_pages()
+            if name not in pages:
+                raise AttributeError(
+                    f"No locators for page '{name}' in {self.shard_dir} or {self.fallback_file}"
+                )
+            group = LocatorGroup(f"locators.{name}", pages[name])
+        self._pages[name] = (group, source, mtime)
+        return group
+
+    def _fallback_pages(self):
+        if self._fallback is None or not self._is_current(self.fallback_file, self._fallback[1]):
+            mtime = self._mtime(self.fallback_file)
+            pages = load_compiled(self.fallback_file, self.cache_dir) if mtime is not None else {}
+            self._fallback = (pages, mtime)
+        return self._fallback
+
+    def resolve(self, path):
+        """Look up a dotted path such as 'LoginPage.inputs.emailField'"""
+        page, *keys = path.split('.')
+        value = self.page(page)
+        for key in keys:
+            value = value[key]
+        return value
+
+    def clear(self):
+        self._pages.clear()
+        self._fallback = None
+
+
+class LocatorRef:
+    """Page object class attribute resolved through the locator store on first access
+
+        class LoginPage:
+            EMAIL_FIELD = LocatorRef('LoginPage.inputs.emailField')
+
+    Nothing is loaded at import time; with hot reload on, every access
+    returns the current value from the source file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._value = None
+
+    def __get__(self, instance, owner):
+        store = get_locators()
+        if self._value is None or store.hot_reload:
+            self._value = store.resolve(self.path)
+        return self._value
+
+    def __repr__(self):
+        return f"LocatorRef({self.path!r})"
+
+
+@lru_cache(maxsize=None)
+def get_locators():
+    """Process-wide LocatorStore configured from `locators` in config.yaml
+
+    LOCATORS_HOT_RELOAD=1 in the environment turns hot reload on for a dev session.
+    """
+    try:
+        config = load_config(CONFIG_PATH)
+    except FileNotFoundError:
+        config = {}
+    settings = config.get('locators') or {}
+    hot_reload = os.environ.get('LOCATORS_HOT_RELOAD', str(settings.get('hot_reload', False)))
+    return LocatorStore(
+        shard_dir=os.path.join(BASE_DIR, settings.get('shard_dir', 'Locators/pages')),
+        fallback_file=os.path.join(BASE_DIR, settings.get('file', 'Locators/Locators.json')),
+        hot_reload=hot_reload.lower() in ('1', 'true', 'yes'),
+    )
+
+
+def shard(source=LOCATORS_FILE, shard_dir=SHARD_DIR, overwrite=False):
+    """Split a monolithic locator file into one SHARD_DIR/<page>.json per page"""
+    with open(source) as f:
+        pages = json.load(f)
+    os.makedirs(shard_dir, exist_ok=True)
+    written = []
+    for name, entries in pages.items():
+        path = os.path.join(shard_dir, f"{name}.json")
+        if os.path.exists(path) and not overwrite:
+            continue
+        with open(path, 'w') as f:
+            json.dump(entries, f, indent=2)
+            f.write('\n')
+        written.append(path)
+    return written
+
+
+def __getattr__(name):
+    # `from core.locators import locators` creates the store on first use only
+    if name == 'locators':
+        return get_locators()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] != ['shard']:
+        sys.exit("usage: python -m core.locators shard [--overwrite]")
+    for path in shard(overwrite='--overwrite' in sys.argv):
+        print(f"wrote {path}")
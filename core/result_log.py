@@ -0,0 +1,89 @@
+import glob
+import json
+import os
+from datetime import datetime
+
+BASE_DIR = os.path.join(os.path.dirname(__file__), '..')
+RESULTS_DIR = os.path.join(BASE_DIR, '.cache', 'results')
+
+OUTCOMES = ('passed', 'failed', 'error', 'skipped')
+
+
+def make_record(item, report):
+    """Result record for a report that decides the test's outcome, else None
+
+    The call phase decides the outcome; a setup that fails or skips replaces
+    it and a failing teardown turns it into an error.
+    """
+    if report.when == 'call':
+        outcome = report.outcome
+    elif report.skipped:
+        outcome = 'skipped'
+    elif report.failed:
+        outcome = 'error'
+    else:
+        return None
+    record = {
+        'nodeid': item.nodeid,
+        'name': item.name,
+        'outcome': outcome,
+        'duration': round(report.duration, 3),
+        'timestamp': datetime.now().isoformat(),
+    }
+    if report.failed:
+        record['error'] = report.longreprtext
+    return record
+
+
+class ResultLog:
+    """Append-only result records of one pytest process, in results-<worker>.jsonl
+
+    Each record is written as soon as its test finishes so the controller can
+    merge every xdist worker's results, including those of a worker that died.
+    """
+
+    def __init__(self, directory=RESULTS_DIR, worker=None):
+        self.directory = directory
+        self.worker = worker
+
+    @property
+    def path(self):
+        worker = self.worker or os.environ.get('PYTEST_XDIST_WORKER', 'main')
+        return os.path.join(self.directory, f"results-{worker}.jsonl")
+
+    def append(self, record):
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self.path, 'a') as f:
+            f.write(json.dumps(record, separators=(',', ':')) + '\n')
+
+
+def load_results(directory=RESULTS_DIR):
+    """Every worker's records, the last one per test winning; truncated lines are skipped"""
+    merged = {}
+    for path in sorted(glob.glob(os.path.join(directory, 'results-*.jsonl'))):
+        with open(path) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                merged[record['nodeid']] = record
+    return list(merged.values())
+
+
+def summarize(records):
+    """'total' plus a count for every outcome in OUTCOMES"""
+    summary = dict.fromkeys(OUTCOMES, 0)
+    for record in records:
+        summary[record['outcome']] = summary.get(record['outcome'], 0) + 1
+    summary['total'] = len(records)
+    return summary
+
+
+def clear_results(directory=RESULTS_DIR):
+    """Remove result files left over from a previous session"""
+    for path in glob.glob(os.path.join(directory, 'results-*.jsonl')):
+        os.remove(path)
+
+
+results = ResultLog()
@@ -1,19 +1,31 @@
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.action_chains import ActionChains
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from core.action_sequence import ActionSequence
+from core.polling import BackoffWebDriverWait, default_poll_schedule
+from core.stale_recovery import DEFAULT_STALE_RETRIES, run_with_recovery
 
 class SeleniumWrapper:
     """Wrapper class for common Selenium operations"""
     
-    def __init__(self, driver):
+    def __init__(self, driver, poll_schedule=None, owner=None, stale_retries=DEFAULT_STALE_RETRIES,
+                 element_cache=None):
         self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
+        self.poll_schedule = poll_schedule or default_poll_schedule()
+        self.owner = owner
+        self.stale_retries = stale_retries
+        self.element_cache = element_cache
+        self.wait = self.create_wait(10)
+    
+    def create_wait(self, timeout, locator=None):
+        """Create an explicit wait polling on this wrapper's schedule"""
+        return BackoffWebDriverWait(
+            self.driver, timeout, self.poll_schedule, locator=locator, owner=self.owner
+        )
     
     def wait_for_element(self, locator, timeout=10):
         """Wait for element to be present and return it"""
         try:
-            wait = WebDriverWait(self.driver, timeout)
+            wait = self.create_wait(timeout, locator)
             return wait.until(EC.presence_of_element_located(locator))
         except TimeoutException:
             raise TimeoutException(f"Element {locator} not found within {timeout} seconds")
@@ -21,28 +33,48 @@ class SeleniumWrapper:
     def wait_for_element_clickable(self, locator, timeout=10):
         """Wait for element to be clickable and return it"""
         try:
-            wait = WebDriverWait(self.driver, timeout)
+            wait = self.create_wait(timeout, locator)
             return wait.until(EC.element_to_be_clickable(locator))
         except TimeoutException:
             raise TimeoutException(f"Element {locator} not clickable within {timeout} seconds")
     
+    def _with_fresh_element(self, locator, locate, action):
+        """Run action on the located element, re-locating it if it goes stale
+
+        With an element cache the cached handle is tried before locating again.
+        """
+        if self.element_cache is not None:
+            return self.element_cache.resolve(locator, locate, action, self.stale_retries)
+        return run_with_recovery(locate, action, locator, self.owner, self.stale_retries)
+    
     def click_element(self, locator, timeout=10):
         """Click on element after waiting for it to be clickable"""
-        element = self.wait_for_element_clickable(locator, timeout)
-        element.click()
+        def click(element):
+            element.click()
+            return element
+        element = self._with_fresh_element(
+            locator, lambda: self.wait_for_element_clickable(locator, timeout), click
+        )
+        if self.element_cache is not None:
+            # The click may have navigated; the cache re-checks the URL on its next lookup
+            self.element_cache.mark_dirty()
         return element
     
     def enter_text(self, locator, text, timeout=10):
         """Enter text into element after waiting for it"""
-        element = self.wait_for_element(locator, timeout)
-        element.clear()
-        element.send_keys(text)
-        return element
+        def type_text(element):
+            element.clear()
+            element.send_keys(text)
+            return element
+        return self._with_fresh_element(
+            locator, lambda: self.wait_for_element(locator, timeout), type_text
+        )
     
     def get_text(self, locator, timeout=10):
         """Get text from element"""
-        element = self.wait_for_element(locator, timeout)
-        return element.text
+        return self._with_fresh_element(
+            locator, lambda: self.wait_for_element(locator, timeout), lambda element: element.text
+        )
     
     def is_element_present(self, locator):
         """Check if element is present"""
@@ -55,17 +87,20 @@ class SeleniumWrapper:
     def is_element_visible(self, locator, timeout=5):
         """Check if element is visible"""
         try:
-            wait = WebDriverWait(self.driver, timeout)
+            wait = self.create_wait(timeout, locator)
             wait.until(EC.visibility_of_element_located(locator))
             return True
         except TimeoutException:
             return False
     
+    def actions(self, timeout=10):
+        """Start an ActionSequence whose locators are waited for up to timeout seconds"""
+        return ActionSequence(self.driver, lambda locator: self.wait_for_element(locator, timeout))
+    
     def hover_over_element(self, locator, timeout=10):
         """Hover over element"""
         element = self.wait_for_element(locator, timeout)
-        actions = ActionChains(self.driver)
-        actions.move_to_element(element).perform()
+        self.actions().hover(element).perform()
         return element
     
     def scroll_to_element(self, locator, timeout=10):
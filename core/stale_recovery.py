@@ -0,0 +1,71 @@
+from collections import Counter
+
+from selenium.common.exceptions import StaleElementReferenceException
+
+# Re-resolutions allowed per wrapper call before the stale error is raised
+DEFAULT_STALE_RETRIES = 2
+
+
+class StaleRecoveryStats:
+    """Process-wide counters of stale-element re-resolutions, keyed by page class and locator"""
+
+    def __init__(self):
+        self.retries = Counter()
+        self.recovered = Counter()
+        self.exhausted = Counter()
+
+    @staticmethod
+    def key(owner, locator):
+        return f"{owner or '-'}|{locator[0]}|{locator[1]}" if locator else owner or '-'
+
+    def summary(self):
+        """Totals plus per-locator retry counts, most frequent first"""
+        return {
+            'retries': sum(self.retries.values()),
+            'recovered': sum(self.recovered.values()),
+            'exhausted': sum(self.exhausted.values()),
+            'by_locator': dict(self.retries.most_common()),
+        }
+
+    def reset(self):
+        self.retries.clear()
+        self.recovered.clear()
+        self.exhausted.clear()
+
+
+stats = StaleRecoveryStats()
+
+
+def run_with_recovery(locate, action, locator=None, owner=None, retries=DEFAULT_STALE_RETRIES):
+    """Run action on a freshly located element, re-locating it when the DOM re-renders
+
+    A StaleElementReferenceException raised by action triggers a new locate()
+    and another attempt, at most `retries` times, before it is re-raised.
+    """
+    key = stats.key(owner, locator)
+    attempt = 0
+    while True:
+        element = locate()
+        try:
+            result = action(element)
+        except StaleElementReferenceException:
+            if attempt >= retries:
+                stats.exhausted[key] += 1
+                raise
+            attempt += 1
+            stats.retries[key] += 1
+            continue
+        if attempt:
+            stats.recovered[key] += 1
+        return result
+
+
+def format_summary(summary, top=5):
+    """Human readable lines for a StaleRecoveryStats summary"""
+    lines = [
+        f"Stale element recovery: {summary['retries']} re-resolutions, "
+        f"{summary['recovered']} calls recovered, {summary['exhausted']} gave up"
+    ]
+    for key, count in list(summary['by_locator'].items())[:top]:
+        lines.append(f"  {count:>4}  {key}")
+    return lines
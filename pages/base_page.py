@@ -1,19 +1,24 @@
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 from selenium.webdriver.common.by import By
 from core.selenium_wrapper import SeleniumWrapper
+from core.element_cache import ElementCache
 
 class BasePage:
     """Base page class with common functionality for all page objects"""
     
-    def __init__(self, driver):
+    def __init__(self, driver, poll_schedule=None):
         self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
-        self.selenium_wrapper = SeleniumWrapper(driver)
+        self.element_cache = ElementCache(driver, owner=type(self).__name__)
+        self.selenium_wrapper = SeleniumWrapper(driver, poll_schedule, owner=type(self).__name__,
+                                                element_cache=self.element_cache)
+        self.wait = self.selenium_wrapper.create_wait(10)
     
     def wait_for_element(self, locator, timeout=10):
         """Wait for element to be present"""
-        return self.selenium_wrapper.wait_for_element(locator, timeout)
+        element = self.selenium_wrapper.wait_for_element(locator, timeout)
+        self.element_cache.put(locator, element)
+        return element
     
     def click_element(self, locator):
         """Click on element"""
@@ -25,17 +30,31 @@ class BasePage:
     
     def get_text(self, locator):
         """Get text from element"""
-        element = self.wait_for_element(locator)
-        return element.text
+        return self.selenium_wrapper.get_text(locator)
     
     def is_element_visible(self, locator):
-        """Check if element is visible"""
+        """Check if element is visible; an exhausted test budget still raises DeadlineExceeded"""
         try:
-            element = self.wait_for_element(locator)
-            return element.is_displayed()
-        except:
+            return self.element_cache.resolve(
+                locator,
+                lambda: self.selenium_wrapper.wait_for_element(locator),
+                lambda element: element.is_displayed(),
+            )
+        except (TimeoutException, NoSuchElementException, StaleElementReferenceException):
             return False
     
-    def navigate_to(self, url):
-        """Navigate to specified URL"""
-        self.driver.get(url)
\ No newline at end of file
+    def navigate_to(self, url, force=False):
+        """Navigate to specified URL, unless the browser is already on it and loaded
+        
+        Pass force=True to reload the page anyway.
+        """
+        if not force and self.is_current_page(url):
+            return
+        self.element_cache.clear()
+        self.driver.get(url)
+    
+    def is_current_page(self, url):
+        """Check if the browser is on url and the document has finished loading"""
+        if self.driver.current_url.rstrip('/') != url.rstrip('/'):
+            return False
+        return self.driver.execute_script("return document.readyState") == "complete"
\ No newline at end of file
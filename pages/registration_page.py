@@ -1,6 +1,6 @@
 from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
-import yaml
+from core.config_cache import load_config
 
 class RegistrationPage(BasePage):
     """Page object for user registration functionality"""
@@ -17,8 +17,7 @@ class RegistrationPage(BasePage):
     
     def __init__(self, driver):
         super().__init__(driver)
-        with open('config/config.yaml') as f:
-            self.config = yaml.safe_load(f)
+        self.config = load_config()
     
     def navigate_to_registration(self):
         """Navigate to registration page"""
@@ -1,15 +1,21 @@
+import time
+
 import pytest
-import yaml
-import os
 from core.driver_factory import get_driver
-from utils.send_email_report import send_email_report
+from core import config_cache, deadline, impact_analysis, locator_preflight, result_log, self_healing, stale_recovery, wait_telemetry
+from core.timeout_calibration import get_calibrator
+from utils.send_email_report import send_test_summary
+
+SESSION_START_KEY = pytest.StashKey[float]()
+
+def load_config():
+    """Load configuration from config.yaml"""
+    return config_cache.load_config()
 
 @pytest.fixture(scope="session")
 def config():
     """Load configuration for test session"""
-    config_path = os.path.join(os.path.dirname(__file__), '..', 'config', 'config.yaml')
-    with open(config_path, 'r') as file:
-        return yaml.safe_load(file)
+    return load_config()
 
 @pytest.fixture(scope="function")
 def driver():
@@ -18,26 +24,85 @@ def driver():
     yield driver_instance
     driver_instance.quit()
 
+def pytest_addoption(parser):
+    """Register --impacted-by for test impact analysis"""
+    impact_analysis.add_option(parser)
+
+def pytest_collection_modifyitems(config, items):
+    """Deselect tests unaffected by --impacted-by changes, flag unusable page locators"""
+    impact_analysis.deselect_unaffected(config, items)
+    locator_preflight.check_items(items)
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    """Error flagged tests immediately instead of letting them time out in a browser"""
+    locator_preflight.raise_for_item(item)
+
+def pytest_sessionstart(session):
+    """Drop telemetry and results flushed by a previous session (controller process only)"""
+    if not hasattr(session.config, 'workerinput'):
+        session.config.stash[SESSION_START_KEY] = time.time()
+        wait_telemetry.clear_flushed()
+        result_log.clear_results()
+
 def pytest_sessionfinish(session, exitstatus):
     """Hook to run after all tests complete"""
-    # Collect test results
-    test_results = {
-        'total': session.testscollected,
-        'passed': session.testscollected - session.testsfailed,
-        'failed': session.testsfailed,
-        'skipped': 0,
-        'failed_tests': []
-    }
+    # Flush wait durations for timeout calibration; the controller folds every worker's into the history
+    get_calibrator().flush()
+    if not hasattr(session.config, 'workerinput'):
+        get_calibrator().save()
+    # Flush this worker's wait histograms for the telemetry report
+    wait_telemetry.telemetry.flush()
+    # Persist fallbacks that healed a locator so later runs try them first
+    self_healing.resolutions.save()
     
-    # Send email report
-    send_email_report(test_results)
+    # Only the controller sees every xdist worker's results; it reports once
+    if hasattr(session.config, 'workerinput'):
+        return
+    summary = result_log.summarize(result_log.load_results())
+    passed = summary['passed']
+    failed = summary['failed'] + summary['error']
+    if passed + failed:
+        send_test_summary(passed, failed, summary['skipped'],
+                          time.time() - session.config.stash[SESSION_START_KEY])
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """Hook to capture test results"""
     outcome = yield
     rep = outcome.get_result()
+    record = result_log.make_record(item, rep)
+    if record is not None:
+        result_log.results.append(record)
     
     if rep.when == "call" and rep.failed:
         # Log failed test
-        print(f"Test failed: {item.nodeid}")
\ No newline at end of file
+        print(f"Test failed: {item.nodeid}")
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    """Run the test inside its time budget so every wait is cut down to the time left"""
+    test_budget = load_config().get('timeouts', {}).get('test_budget')
+    with deadline.budget(deadline.budget_for(item, test_budget)):
+        yield
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Report stale element recovery, healed locators and wait telemetry for the session"""
+    summary = stale_recovery.stats.summary()
+    if summary['retries'] or summary['exhausted']:
+        terminalreporter.section("stale element recovery")
+        for line in stale_recovery.format_summary(summary):
+            terminalreporter.write_line(line)
+
+    lines = self_healing.resolutions.report(since=self_healing.resolutions.started)
+    if lines:
+        terminalreporter.section("self-healing locators")
+        for line in lines:
+            terminalreporter.write_line(line)
+
+    lines = wait_telemetry.WaitTelemetry.load().report()
+    if lines:
+        terminalreporter.section("wait telemetry")
+        for line in lines:
+            terminalreporter.write_line(line)
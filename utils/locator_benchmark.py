@@ -0,0 +1,263 @@
+"""Benchmark page object locators and suggest cheaper equivalents
+
+Every collected locator is placed in a strategy tier reflecting how browsers
+resolve it (id index, attribute match, structural walk, text scan), and
+locators are ranked by tier. Each is also evaluated with lxml against a
+large synthetic DOM and, when one exists, against its page's snapshot
+(`<snapshot dir>/<PageClass>.html` or `<module>.<PageClass>.html`, as for
+utils.locator_validator). Those times only order locators within a tier:
+lxml has no id index, so By.ID costs it a full walk that a browser skips.
+Locators that match one element in their snapshot get a cheaper replacement
+suggested when one matches that same element.
+
+    python -m utils.locator_benchmark snapshots/ [--nodes 20000] [--top 20] [--page LoginPage]
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from collections import namedtuple
+
+from lxml import etree, html
+from selenium.webdriver.common.by import By
+
+from core.locator_inventory import PAGE_GLOBS, collect
+from core.locators import xpath_literal
+from utils.locator_validator import DEFAULT_SNAPSHOT_DIR, group_by_page, select_pages, snapshot_for, to_xpath
+
+# Strategy tiers, cheapest first
+TIERS = ('id', 'attribute', 'structural', 'text scan')
+
+SIMPLE_ID_CSS = re.compile(r'^#[\w-]+$|^\[id=([\'"])[^\'"]*\1\]$')
+SIMPLE_CSS = re.compile(r'^[\w-]*([.#][\w-]+|\[[\w-]+([~|^$*]?=([\'"])[^\'"]*\3)?\])*$')
+TEXT_XPATH = re.compile(r'text\(\)|contains\(|normalize-space|starts-with|\.\s*=|string\(')
+ATTRIBUTE_XPATH = re.compile(r'''^//(\*|[a-zA-Z][\w-]*)\[@([\w-]+)=(['"])([^'"]*)\3\]$''')
+# Attributes conventionally reserved for tests, tried after id and name
+TEST_ATTRIBUTES = ('data-test', 'data-testid', 'data-test-id', 'data-qa', 'data-cy')
+
+Measurement = namedtuple('Measurement', 'page names by value tier synthetic snapshot suggestion')
+Measurement.__doc__ = """Cost of one locator; times in milliseconds, snapshot None without a snapshot"""
+
+
+def strategy_tier(by, value):
+    """Index into TIERS of how expensive a locator's strategy is for a browser"""
+    if by == By.ID or (by == By.CSS_SELECTOR and SIMPLE_ID_CSS.match(value)):
+        return 0
+    if by in (By.NAME, By.CLASS_NAME, By.TAG_NAME):
+        return 1
+    if by == By.CSS_SELECTOR:
+        return 1 if SIMPLE_CSS.match(value.strip()) else 2
+    if by in (By.LINK_TEXT, By.PARTIAL_LINK_TEXT):
+        return 3
+    if by == By.XPATH:
+        return 3 if TEXT_XPATH.search(value) or value.startswith('//*') else 2
+    return 2
+
+
+def synthetic_dom(nodes=20000, seed=1):
+    """Parsed HTML document of roughly `nodes` elements shaped like an application page
+
+    Nested sections of forms, tables, lists and links with ids, names,
+    classes and text, so that scans and text predicates cost what they
+    would on a large real page.
+    """
+    rng = random.Random(seed)
+    words = ['account', 'order', 'product', 'total', 'submit', 'cancel', 'email', 'price',
+             'status', 'details', 'search', 'filter', 'login', 'register', 'cart', 'review']
+    parts = ['<html><head><title>synthetic</title></head><body>']
+    count = 0
+    section = 0
+    while count < nodes:
+        section += 1
+        parts.append(f'<section id="section-{section}" class="panel panel-{section % 7}">'
+                     f'<div class="row"><div class="col"><form name="form-{section}">')
+        for field in range(rng.randint(3, 8)):
+            word = rng.choice(words)
+            parts.append(f'<label for="f{section}-{field}">{word.title()}</label>'
+                         f'<input id="f{section}-{field}" name="{word}-{section}-{field}" '
+                         f'class="input {word}" type="text">')
+            count += 2
+        parts.append(f'<button type="submit" class="btn btn-{rng.choice(words)}">'
+                     f'{rng.choice(words).title()}</button></form></div></div><table><tbody>')
+        for row in range(rng.randint(5, 15)):
+            parts.append('<tr>' + ''.join(
+                f'<td class="cell"><span>{rng.choice(words)} {rng.randint(1, 999)}</span></td>'
+                for _ in range(4)) + '</tr>')
+            count += 9
+        parts.append('</tbody></table><ul class="links">')
+        for link in range(rng.randint(2, 6)):
+            parts.append(f'<li><a href="/{rng.choice(words)}/{link}">{rng.choice(words).title()} '
+                         f'{section}</a></li>')
+            count += 2
+        parts.append('</ul></section>')
+        count += 8
+    parts.append('</body></html>')
+    return html.fromstring(''.join(parts))
+
+
+def time_lookup(document, xpath, repeat=5):
+    """Best of `repeat` evaluations of a compiled XPath after a warm-up run, in milliseconds
+
+    Raises:
+        ValueError: If xpath is not a valid expression
+    """
+    try:
+        compiled = etree.XPath(xpath)
+        # Unknown functions and unbound variables only fail on evaluation
+        compiled(document)
+    except etree.XPathError as e:
+        raise ValueError(f"invalid XPath: {e}")
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        compiled(document)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1000
+
+
+def _rewrite(by, value):
+    """Cheaper locator written from the locator alone, or None"""
+    if by == By.CSS_SELECTOR and SIMPLE_ID_CSS.match(value) and value.startswith('#'):
+        return By.ID, value[1:]
+    if by != By.XPATH:
+        return None
+    match = ATTRIBUTE_XPATH.match(value)
+    if not match:
+        return None
+    tag, attribute, _, text = match.groups()
+    if attribute == 'id':
+        return By.ID, text
+    if attribute == 'name' and tag == '*':
+        return By.NAME, text
+    return By.CSS_SELECTOR, f"{'' if tag == '*' else tag}[{attribute}=\"{text}\"]"
+
+
+def _candidates(element):
+    # Replacements for a locator matching just `element`, cheapest first
+    if element.get('id'):
+        yield By.ID, element.get('id')
+    if element.get('name'):
+        yield By.NAME, element.get('name')
+    for attribute in TEST_ATTRIBUTES:
+        if element.get(attribute) and '"' not in element.get(attribute):
+            yield By.CSS_SELECTOR, f'[{attribute}="{element.get(attribute)}"]'
+    text = (element.text or '').strip()
+    if text:
+        yield By.XPATH, f"//{element.tag}[normalize-space()={xpath_literal(text)}]"
+
+
+def suggest(by, value, document=None):
+    """Cheaper locator matching the same element, or None
+
+    Without a document only rewrites that are equivalent by construction
+    (e.g. //*[@id='x'] -> By.ID) are offered; with one, candidates built from
+    the matched element are accepted when they match that element alone.
+    """
+    tier = strategy_tier(by, value)
+    rewrite = _rewrite(by, value)
+    if rewrite and strategy_tier(*rewrite) < tier:
+        return rewrite
+    if document is None or tier == 0:
+        return None
+    try:
+        matched = document.xpath(to_xpath(by, value))
+    except (ValueError, etree.XPathError):
+        return None
+    if not isinstance(matched, list) or len(matched) != 1:
+        return None
+    for candidate in _candidates(matched[0]):
+        if strategy_tier(*candidate) >= tier:
+            continue
+        try:
+            if document.xpath(to_xpath(*candidate)) == matched:
+                return candidate
+        except (ValueError, etree.XPathError):
+            continue
+    return None
+
+
+def benchmark(snapshot_dir=DEFAULT_SNAPSHOT_DIR, patterns=PAGE_GLOBS, pages=None,
+              nodes=20000, repeat=5):
+    """Measure every collected locator, most expensive tier first and slowest in lxml first within it
+
+    Returns:
+        (list of Measurement, dict of skipped locator or module -> reason)
+    """
+    page_locators, skipped = collect(patterns)
+    grouped = group_by_page(page_locators)
+    if pages:
+        grouped = select_pages(grouped, pages)
+    synthetic = synthetic_dom(nodes)
+    measurements = []
+    for page, locators in grouped.items():
+        snapshot_path = snapshot_for(snapshot_dir, page)
+        snapshot = None
+        if snapshot_path:
+            with open(snapshot_path, 'rb') as f:
+                snapshot = html.fromstring(f.read())
+        for names, by, value in locators:
+            try:
+                xpath = to_xpath(by, value)
+                synthetic_ms = time_lookup(synthetic, xpath, repeat)
+                snapshot_ms = time_lookup(snapshot, xpath, repeat) if snapshot is not None else None
+            except ValueError as e:
+                skipped[f"{page} {by}={value!r}"] = str(e)
+                continue
+            measurements.append(Measurement(page, names, by, value, strategy_tier(by, value),
+                                            synthetic_ms, snapshot_ms, suggest(by, value, snapshot)))
+    measurements.sort(key=lambda m: (m.tier, m.synthetic), reverse=True)
+    return measurements, skipped
+
+
+def by_strategy(measurements):
+    """Locator count and mean synthetic-DOM lxml time per strategy and tier, most expensive tier first"""
+    totals = {}
+    for m in measurements:
+        count, total = totals.get((m.tier, m.by), (0, 0.0))
+        totals[(m.tier, m.by)] = (count + 1, total + m.synthetic)
+    rows = [(tier, by, count, total / count) for (tier, by), (count, total) in totals.items()]
+    return sorted(rows, key=lambda row: (row[0], row[3]), reverse=True)
+
+
+def format_report(measurements, skipped, top=20, nodes=20000):
+    """Report lines: locators per strategy tier, then the most expensive locators"""
+    lines = [f"Locators per strategy, most expensive tier first; lxml ms on a {nodes}-element synthetic DOM",
+             "is a hint within a tier only (lxml has no id index, browsers do)",
+             f"{'tier':<10} {'strategy':<18} {'locators':>8} {'lxml ms':>8}"]
+    lines.extend(f"{TIERS[tier]:<10} {by:<18} {count:>8} {mean:>8.3f}"
+                 for tier, by, count, mean in by_strategy(measurements))
+    lines += ["", f"Most expensive locators (top {top})",
+              f"{'tier':<10} {'synth ms':>9} {'snap ms':>8} locator"]
+    for m in measurements[:top]:
+        snapshot = f"{m.snapshot:>8.3f}" if m.snapshot is not None else f"{'-':>8}"
+        lines.append(f"{TIERS[m.tier]:<10} {m.synthetic:>9.3f} {snapshot} {m.by}={m.value!r}  <- {m.names}")
+        if m.suggestion:
+            lines.append(f"{'':>30}suggest {m.suggestion[0]}={m.suggestion[1]!r}")
+    suggested = [m for m in measurements if m.suggestion]
+    lines += ["", f"{len(suggested)} of {len(measurements)} locators have a cheaper equivalent"]
+    for name, reason in skipped.items():
+        lines.append(f"SKIPPED {name}: {reason}")
+    return lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('snapshot_dir', nargs='?', default=DEFAULT_SNAPSHOT_DIR,
+                        help="directory holding <PageClass>.html snapshots")
+    parser.add_argument('--page', action='append', dest='pages',
+                        help="only benchmark this page class or module.Class (repeatable)")
+    parser.add_argument('--nodes', type=int, default=20000, help="elements in the synthetic DOM")
+    parser.add_argument('--repeat', type=int, default=5, help="evaluations per locator, best one counts")
+    parser.add_argument('--top', type=int, default=20, help="expensive locators to list")
+    args = parser.parse_args(argv)
+    measurements, skipped = benchmark(args.snapshot_dir, pages=args.pages,
+                                      nodes=args.nodes, repeat=args.repeat)
+    print("\n".join(format_report(measurements, skipped, args.top, args.nodes)))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,200 @@
+"""Validate page object locators offline against saved HTML snapshots
+
+Every locator of every page class (and of the Locators.json repository) is
+evaluated in-process against `<snapshot dir>/<PageClass>.html`, one worker
+process per page, so a wrong locator shows up in seconds instead of after a
+browser wait timeout. Page classes are told apart by module: when several
+share a name, `<module>.<PageClass>.html` (e.g.
+auto_scripts.Pages.login_page.LoginPage.html) is used in preference to the
+shared `<PageClass>.html`. Snapshots are plain `driver.page_source` dumps.
+
+    python -m utils.locator_validator snapshots/ [--workers N] [--page LoginPage]
+
+Exits non-zero when a locator matches nothing or is not a valid selector.
+"""
+
+import argparse
+import os
+import sys
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from lxml import etree, html
+from cssselect import HTMLTranslator, SelectorError
+from selenium.webdriver.common.by import By
+
+from core.locator_inventory import PAGE_GLOBS, collect
+from core.locators import xpath_literal
+
+DEFAULT_SNAPSHOT_DIR = os.path.join(os.path.dirname(__file__), '..', 'snapshots')
+
+# Result of evaluating one locator against a snapshot
+OK, UNMATCHED, AMBIGUOUS, INVALID = 'ok', 'unmatched', 'ambiguous', 'invalid'
+
+_css = HTMLTranslator()
+
+
+def to_xpath(by, value):
+    """XPath equivalent of a Selenium (By, value) locator
+
+    Raises:
+        ValueError: If value is not a valid selector for its strategy
+    """
+    literal = xpath_literal(value)
+    if by == By.ID:
+        return f"//*[@id={literal}]"
+    if by == By.NAME:
+        return f"//*[@name={literal}]"
+    if by == By.CLASS_NAME:
+        return f"//*[contains(concat(' ', normalize-space(@class), ' '), ' {value} ')]"
+    if by == By.TAG_NAME:
+        return f"//{value}"
+    if by == By.LINK_TEXT:
+        return f"//a[normalize-space(.)={literal}]"
+    if by == By.PARTIAL_LINK_TEXT:
+        return f"//a[contains(., {literal})]"
+    if by == By.CSS_SELECTOR:
+        try:
+            return _css.css_to_xpath(value)
+        except SelectorError as e:
+            raise ValueError(f"invalid CSS selector: {e}")
+    if by == By.XPATH:
+        return value
+    raise ValueError(f"unsupported locator strategy: {by}")
+
+
+def count_matches(document, by, value):
+    """Number of elements in a parsed document matched by the locator
+
+    Raises:
+        ValueError: If the locator is not a valid selector
+    """
+    try:
+        result = document.xpath(to_xpath(by, value))
+    except etree.XPathError as e:
+        raise ValueError(f"invalid XPath: {e}")
+    return len(result) if isinstance(result, list) else int(bool(result))
+
+
+def validate_page(snapshot, locators):
+    """Evaluate (name, by, value) locators against one snapshot file
+
+    Returns:
+        list of (name, by, value, status, detail)
+    """
+    with open(snapshot, 'rb') as f:
+        document = html.fromstring(f.read())
+    results = []
+    for name, by, value in locators:
+        try:
+            matches = count_matches(document, by, value)
+        except ValueError as e:
+            results.append((name, by, value, INVALID, str(e)))
+            continue
+        if matches == 0:
+            status = UNMATCHED
+        elif matches == 1:
+            status = OK
+        else:
+            status = AMBIGUOUS
+        results.append((name, by, value, status, f"{matches} matches"))
+    return results
+
+
+def page_key(locator):
+    """Group key of a locator: module.Class for page classes, the page name for Locators.json pages"""
+    if not locator.source.endswith('.py'):
+        return locator.page
+    module = os.path.splitext(locator.source)[0].replace(os.sep, '/').replace('/', '.')
+    return f"{module}.{locator.page}"
+
+
+def group_by_page(page_locators):
+    """page key -> list of (names, by, value), merging locators declared more than once"""
+    pages = OrderedDict()
+    for locator in page_locators:
+        entries = pages.setdefault(page_key(locator), OrderedDict())
+        label = f"{locator.source}:{locator.lineno}:{locator.name}" if locator.lineno \
+            else f"{locator.source}:{locator.name}"
+        entries.setdefault((locator.by, locator.value), []).append(label)
+    return OrderedDict(
+        (page, [(", ".join(names), by, value) for (by, value), names in entries.items()])
+        for page, entries in pages.items()
+    )
+
+
+def select_pages(grouped, pages):
+    """Only the groups named in pages, by page key or bare page class name"""
+    return OrderedDict((key, locators) for key, locators in grouped.items()
+                       if key in pages or key.rsplit('.', 1)[-1] in pages)
+
+
+def snapshot_for(snapshot_dir, page):
+    """Snapshot of a page key: <module>.<PageClass>.html if saved, else <PageClass>.html; None if neither"""
+    for name in (page, page.rsplit('.', 1)[-1]):
+        path = os.path.join(snapshot_dir, f"{name}.html")
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def validate(snapshot_dir=DEFAULT_SNAPSHOT_DIR, patterns=PAGE_GLOBS, pages=None, workers=None):
+    """Validate every collected locator against the snapshots in snapshot_dir
+
+    Returns:
+        (dict page -> results or None when the page has no snapshot,
+         dict of unparseable page module -> error)
+    """
+    page_locators, errors = collect(patterns)
+    grouped = group_by_page(page_locators)
+    if pages:
+        grouped = select_pages(grouped, pages)
+    report = OrderedDict((page, None) for page in grouped)
+    jobs = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for page, locators in grouped.items():
+            snapshot = snapshot_for(snapshot_dir, page)
+            if snapshot:
+                jobs[page] = pool.submit(validate_page, snapshot, locators)
+        for page, job in jobs.items():
+            report[page] = job.result()
+    return report, errors
+
+
+def format_report(report, errors, verbose=False):
+    """Report lines plus whether any locator failed"""
+    lines = []
+    failed = False
+    for path, error in errors.items():
+        lines.append(f"SKIPPED {path}: cannot parse ({error})")
+    for page, results in report.items():
+        if results is None:
+            lines.append(f"{page}: no snapshot")
+            continue
+        bad = [r for r in results if r[3] != OK]
+        lines.append(f"{page}: {len(results) - len(bad)}/{len(results)} locators match exactly one element")
+        for names, by, value, status, detail in results:
+            if status == OK and not verbose:
+                continue
+            failed = failed or status in (UNMATCHED, INVALID)
+            lines.append(f"  {status.upper():<9} {by}={value!r} ({detail})  <- {names}")
+    return lines, failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('snapshot_dir', nargs='?', default=DEFAULT_SNAPSHOT_DIR,
+                        help="directory holding <PageClass>.html snapshots")
+    parser.add_argument('--page', action='append', dest='pages',
+                        help="only validate this page class or module.Class (repeatable)")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument('--verbose', action='store_true', help="also list locators that match")
+    args = parser.parse_args(argv)
+    report, errors = validate(args.snapshot_dir, pages=args.pages, workers=args.workers)
+    lines, failed = format_report(report, errors, args.verbose)
+    print("\n".join(lines))
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,9 +1,9 @@
 import smtplib
-import yaml
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime
 import logging
+from core.config_cache import load_config
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -13,8 +13,7 @@ def send_report(message, subject=None, recipients=None):
     """Send email report with test results or error messages"""
     try:
         # Load configuration
-        with open('config/config.yaml') as f:
-            config = yaml.safe_load(f)
+        config = load_config()
         
         if not config.get('reporting', {}).get('email_enabled', False):
             logger.info("Email reporting is disabled")